@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Columnar attribute table for the catalog's derived fields.
+
+The care attributes every plant page, index and feed derives from (light,
+water, humidity, difficulty, size, category, growth rate, pet safety, air
+purifying) are packed into one column per attribute, enums as small integer
+codes. The derived fields are then computed for the whole catalog at once:
+which "best for" / "not ideal for" rules apply (as bitmasks in rule order),
+the maintenance level and the growth value. row_bits() gives each code's
+rows as a bitset, for filters like the search page's facets.
+
+Columns are NumPy arrays when NumPy is installed. Without it, and for
+batches too small for NumPy's per-call overhead to pay off (a single plant
+normalized on its own), they are lists and the same rules run row by row,
+with the same results.
+"""
+
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: the row-by-row fallback gives the same results
+    np = None
+
+DIFFICULTIES = ("easy", "medium", "hard")
+SIZES = ("small", "medium", "large")
+CATEGORIES = ("foliage", "trailing", "succulent", "cactus", "palm", "fern", "flowering")
+GROWTH_RATES = ("slow", "moderate", "fast")
+# Smallest batch worth converting to NumPy arrays
+NUMPY_MIN_ROWS = 32
+
+# Code for a value outside the lists above (kept as-is on the Plant for labels)
+OTHER = 255
+
+EASY, MEDIUM, HARD = range(3)
+SMALL, _, LARGE = range(3)
+TRAILING, SUCCULENT, CACTUS = 1, 2, 3
+
+# Per code; OTHER (and anything unlisted) maps to the middle value
+MAINTENANCE = {EASY: 2, MEDIUM: 3, HARD: 4}
+GROWTH_VALUES = {0: 2, 1: 3, 2: 5}
+
+Columns = namedtuple("Columns", "light water humidity difficulty size category growth pet_safe air_purifying")
+
+# (rule key, predicate). Predicates take Columns of arrays or of one row's
+# scalars, so they only use comparisons and & |. Bits follow list order,
+# which is the order the phrases appear on the page.
+BEST_FOR_RULES = (
+    ("low_light", lambda c: c.light <= 2),
+    ("bright_light", lambda c: c.light >= 4),
+    ("indirect_light", lambda c: (c.light > 2) & (c.light < 4)),
+    ("beginners", lambda c: c.difficulty == EASY),
+    ("pets", lambda c: c.pet_safe == 1),
+    ("forgetful", lambda c: c.water <= 2),
+    ("spacious", lambda c: c.size == LARGE),
+    ("small_spaces", lambda c: c.size == SMALL),
+    ("humid", lambda c: c.humidity >= 4),
+    ("air", lambda c: c.air_purifying == 1),
+    ("hanging", lambda c: c.category == TRAILING),
+    ("sunny", lambda c: (c.category == SUCCULENT) | (c.category == CACTUS)),
+)
+NOT_IDEAL_RULES = (
+    ("beginners", lambda c: c.difficulty == HARD),
+    ("pets", lambda c: c.pet_safe == 0),
+    ("travelers", lambda c: c.water >= 4),
+    ("small_spaces", lambda c: c.size == LARGE),
+    ("dry", lambda c: c.humidity >= 4),
+)
+
+
+def _codes(values):
+    return {value: code for code, value in enumerate(values)}
+
+
+_DIFFICULTY_CODES = _codes(DIFFICULTIES)
+_SIZE_CODES = _codes(SIZES)
+_CATEGORY_CODES = _codes(CATEGORIES)
+_GROWTH_CODES = _codes(GROWTH_RATES)
+
+
+_rule_keys_cache = {}
+
+
+def _rule_keys(rules, mask):
+    """Rule keys whose bits are set in mask, in rule order (one shared tuple per mask)"""
+    keys = _rule_keys_cache.get((rules, mask))
+    if keys is None:
+        keys = _rule_keys_cache[(rules, mask)] = tuple(key for bit, (key, _) in enumerate(rules) if mask >> bit & 1)
+    return keys
+
+
+def _bits(indices, size):
+    bits = bytearray((size + 7) // 8)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+class AttributeTable:
+    """The catalog's care attributes as columns, with the derived fields.
+
+    Row i belongs to plants[i]. best_for(i) / not_ideal(i) give the rule
+    keys, maintenance and growth_value the per-plant values.
+    """
+
+    def __init__(self, plants):
+        plants = list(plants)
+        self.ids = [plant.id for plant in plants]
+        rows = [
+            (plant.light, plant.water, plant.humidity,
+             _DIFFICULTY_CODES.get(plant.difficulty, OTHER), _SIZE_CODES.get(plant.size, OTHER),
+             _CATEGORY_CODES.get(plant.category, OTHER), _GROWTH_CODES.get(plant.growth_rate, OTHER),
+             int(plant.pet_safe), int(plant.air_purifying))
+            for plant in plants
+        ]
+        if np is not None and len(rows) >= NUMPY_MIN_ROWS:
+            data = np.array(rows, dtype=np.int16).reshape(len(rows), len(Columns._fields))
+            self.columns = Columns(*data.T)
+            self.best_for_mask = self._masks(BEST_FOR_RULES)
+            self.not_ideal_mask = self._masks(NOT_IDEAL_RULES)
+            self.maintenance = self._lookup(self.columns.difficulty, MAINTENANCE, 3)
+            self.growth_value = self._lookup(self.columns.growth, GROWTH_VALUES, 3)
+        else:
+            self.columns = Columns(*(list(column) for column in zip(*rows))) if rows else Columns(*([],) * 9)
+            self.best_for_mask = [self._row_mask(BEST_FOR_RULES, Columns(*row)) for row in rows]
+            self.not_ideal_mask = [self._row_mask(NOT_IDEAL_RULES, Columns(*row)) for row in rows]
+            self.maintenance = [MAINTENANCE.get(code, 3) for code in self.columns.difficulty]
+            self.growth_value = [GROWTH_VALUES.get(code, 3) for code in self.columns.growth]
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def vectorized(self):
+        """True if the columns are NumPy arrays"""
+        return not isinstance(self.best_for_mask, list)
+
+    def _masks(self, rules):
+        mask = np.zeros(len(self.ids), dtype=np.uint16)
+        for bit, (_, applies) in enumerate(rules):
+            mask |= applies(self.columns).astype(np.uint16) << bit
+        return mask
+
+    @staticmethod
+    def _row_mask(rules, row):
+        mask = 0
+        for bit, (_, applies) in enumerate(rules):
+            if applies(row):
+                mask |= 1 << bit
+        return mask
+
+    @staticmethod
+    def _lookup(codes, values, default):
+        table = np.full(256, default, dtype=np.int16)
+        for code, value in values.items():
+            table[code] = value
+        return table[codes.astype(np.uint8)]
+
+    def best_for(self, i):
+        return _rule_keys(BEST_FOR_RULES, int(self.best_for_mask[i]))
+
+    def not_ideal(self, i):
+        return _rule_keys(NOT_IDEAL_RULES, int(self.not_ideal_mask[i]))
+
+    def row_bits(self, column):
+        """{code: rows} for one column, rows as an int with bit i set for row i"""
+        codes = getattr(self.columns, column)
+        if self.vectorized:
+            return {int(code): int.from_bytes(np.packbits(codes == code, bitorder="little").tobytes(), "little")
+                    for code in np.unique(codes)}
+        rows = {}
+        for i, code in enumerate(codes):
+            rows.setdefault(code, []).append(i)
+        return {code: _bits(indices, len(codes)) for code, indices in rows.items()}
+
+    def rows(self):
+        """(best_for, not_ideal, maintenance, growth_value) per row, as plain Python values"""
+        lists = [self.best_for_mask, self.not_ideal_mask, self.maintenance, self.growth_value]
+        if self.vectorized:
+            lists = [array.tolist() for array in lists]
+        for best_for, not_ideal, maintenance, growth_value in zip(*lists):
+            yield (_rule_keys(BEST_FOR_RULES, best_for), _rule_keys(NOT_IDEAL_RULES, not_ideal),
+                   maintenance, growth_value)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Catalog benchmark: raw JSON dicts vs catalog.Plant records, parsed or compiled.
+
+Writes a seeded synthetic data/plants.json and loads it each way in a fresh
+Python process: load time (a generator's startup), then what the loaded
+catalog holds, measured with tracemalloc on a second load:
+
+    python benchmarks/bench_catalog.py --plants 100000
+
+"compiled" is a warm start: the Plants an earlier run pickled to the
+compiled cache.
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synthetic import make_catalog
+
+
+def load_dicts(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_parsed(path):
+    from catalog import parse_catalog
+    return parse_catalog(path)
+
+
+def load_compiled(path):
+    from catalog import load_compiled, parse_catalog
+    return load_compiled(path, parse_catalog)
+
+
+LOADERS = {"dicts": load_dicts, "Plant": load_parsed, "compiled": load_compiled}
+
+
+def run_child(loader, path):
+    """Load the catalog one way; prints a JSON result for the parent"""
+    import catalog  # noqa: F401 (its import is not part of the catalog)
+    start = time.perf_counter()
+    plants = LOADERS[loader](path)
+    seconds = time.perf_counter() - start
+    del plants
+    gc.collect()
+    tracemalloc.start()
+    plants = LOADERS[loader](path)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(json.dumps({"plants": len(plants), "held": held, "peak": peak, "seconds": seconds}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plants", type=int, default=100000, help="synthetic catalog size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["PLANTFINDER_CACHE_DIR"] = tmp
+        path = os.path.join(tmp, "plants.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(make_catalog(args.plants, args.seed), f)
+        load_compiled(path)  # the earlier run
+        print(f"🌿 {args.plants} synthetic plants, {os.path.getsize(path) / 1e6:.1f} MB of JSON\n")
+        print(f"{'loaded as':<10}{'load s':>9}{'held MB':>10}{'bytes/plant':>13}{'peak MB':>10}")
+        results = {}
+        for loader in LOADERS:
+            cmd = [sys.executable, os.path.abspath(__file__), "--child", loader, path]
+            result = results[loader] = json.loads(subprocess.run(cmd, capture_output=True, text=True, check=True).stdout)
+            print(f"{loader:<10}{result['seconds']:>9.2f}{result['held'] / 1e6:>10.1f}"
+                  f"{result['held'] / result['plants']:>13.0f}{result['peak'] / 1e6:>10.1f}")
+    print(f"\n📉 Plant records hold {1 - results['Plant']['held'] / results['dicts']['held']:.0%} less;"
+          f" the compiled catalog loads {results['Plant']['seconds'] / results['compiled']['seconds']:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-page render time of the plant page generators.
+
+Compares the working tree against the generators at a git revision (default
+HEAD), on a seeded synthetic catalog:
+
+    python benchmarks/bench_render.py --plants 50000 --baseline HEAD~1
+
+Each tree runs in its own Python process so both import their own modules.
+The "all" row renders every locale for each plant, the way one build does.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synthetic import make_catalog
+
+LOCALES = ("en", "de", "es")
+# Generators from before the shared renderer (plant_pages.py)
+LEGACY_MODULES = {"en": ("generate_plants", None), "de": ("generate_german", "name_de"), "es": ("generate_spanish", "name_es")}
+CHECK_PAGES = 200
+
+
+def tree_renderers(root):
+    """(facts, {locale: render}) for the generators in root.
+
+    render(plant, facts, translation) returns the page bytes. facts is None for
+    trees without plant_pages, where every locale derives its data itself.
+    """
+    sys.path.insert(0, root)
+    if os.path.exists(os.path.join(root, "catalog.py")):
+        import catalog
+        import plant_pages
+        renderers = {code: (lambda p, f, t, r=plant_pages.get_renderer(code).render_bytes: r(f or p, t))
+                     for code in LOCALES}
+        return catalog.as_plant, renderers
+    if os.path.exists(os.path.join(root, "plant_pages.py")):
+        import plant_pages
+        renderers = {code: plant_pages.get_renderer(code).render_bytes for code in LOCALES}
+        return plant_pages.plant_facts, renderers
+
+    renderers = {}
+    for code, (module_name, name_key) in LEGACY_MODULES.items():
+        module = __import__(module_name)
+        # Older revisions have no bytes renderer; their writers encoded the str
+        render = getattr(module, "generate_plant_bytes", None) or (lambda p, m=module: m.generate_plant_html(p).encode("utf-8"))
+        if name_key:
+            render = (lambda p, f, t, r=render, k=name_key: r(dict(p, **{k: t["name"]}) if t else p))
+        else:
+            render = (lambda p, f, t, r=render: r(p))
+        renderers[code] = render
+    return None, renderers
+
+
+def time_best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_child(root, size, seed, repeat):
+    """Time one tree; prints a JSON result for the parent"""
+    plants = make_catalog(size, seed)
+    translations = [{"name": p["name"]} for p in plants]
+    facts_fn, renderers = tree_renderers(root)
+    facts_of = facts_fn or (lambda plant: None)
+
+    result = {"check": {}, "us_per_page": {}}
+    for code, render in renderers.items():
+        h = hashlib.blake2b(digest_size=16)
+        for plant, translation in zip(plants[:CHECK_PAGES], translations):
+            h.update(render(plant, None, translation if code != "en" else None))
+        result["check"][code] = h.hexdigest()
+
+        def one_locale(render=render, code=code):
+            for plant, translation in zip(plants, translations):
+                render(plant, None, translation if code != "en" else None)
+        result["us_per_page"][code] = time_best(one_locale, repeat) / len(plants) * 1e6
+
+    def all_locales():
+        for plant, translation in zip(plants, translations):
+            facts = facts_of(plant)
+            for code, render in renderers.items():
+                render(plant, facts, translation if code != "en" else None)
+    result["us_per_page"]["all"] = time_best(all_locales, repeat) / (len(plants) * len(renderers)) * 1e6
+    print(json.dumps(result))
+
+
+def export_revision(rev, directory):
+    """Check out the tracked files of rev into directory"""
+    archive = os.path.join(directory, "tree.tar")
+    with open(archive, "wb") as f:
+        subprocess.run(["git", "archive", rev], cwd=ROOT, stdout=f, check=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(directory)
+    os.remove(archive)
+    return directory
+
+
+def measure(root, args):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", root,
+           "--plants", str(args.plants), "--seed", str(args.seed), "--repeat", str(args.repeat)]
+    output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plants", type=int, default=50000, help="synthetic catalog size")
+    parser.add_argument("--baseline", default="HEAD", help="git revision to compare against")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.plants, args.seed, args.repeat)
+        return
+
+    print(f"🌿 Rendering {args.plants} synthetic plants (baseline: {args.baseline})")
+    print("   µs per page, encoded and ready to write\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        before = measure(export_revision(args.baseline, tmp), args)
+    after = measure(ROOT, args)
+
+    for code in LOCALES:
+        if before["check"][code] != after["check"][code]:
+            print(f"❌ {code}: output differs from {args.baseline} in the first {CHECK_PAGES} pages")
+
+    print(f"{'locale':<8}{'before µs/page':>16}{'after µs/page':>16}{'speedup':>10}")
+    for code in LOCALES + ("all",):
+        b, a = before["us_per_page"][code], after["us_per_page"][code]
+        print(f"{code:<8}{b:>16.1f}{a:>16.1f}{b / a:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: one str.replace pass per key vs multi_replace.Replacer.
+
+The document is the site's hand-written pages (home, search, quiz, compare,
+faq, about) repeated up to --size-kb; the keys are their text nodes, the
+kind of strings generate_translations.py localizes:
+
+    python benchmarks/bench_replace.py --size-kb 2048 --keys 10,25,100,250
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from multi_replace import Replacer
+
+PAGES = ["index.html", "search/index.html", "quiz/index.html", "compare/index.html",
+         "faq/index.html", "about/index.html"]
+
+
+def load_document(size_kb):
+    source = ""
+    for page in PAGES:
+        with open(os.path.join(ROOT, page), encoding="utf-8") as f:
+            source += f.read()
+    repeat = max(1, size_kb * 1024 // len(source))
+    return source, source * repeat
+
+
+def text_nodes(html):
+    """Distinct visible strings, longest first, like the translation tables"""
+    nodes = {m.strip() for m in re.findall(r">([^<>{}\n]{3,80})<", html)}
+    return sorted((n for n in nodes if len(n) >= 3), key=lambda n: (-len(n), n))
+
+
+def sequential(mapping, text):
+    for old, new in mapping.items():
+        text = text.replace(old, new)
+    return text
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-kb", type=int, default=2048, help="document size")
+    parser.add_argument("--keys", default="10,25,100,250", help="comma-separated key counts")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    source, document = load_document(args.size_kb)
+    nodes = text_nodes(source)
+    print(f"🔁 {len(document) // 1024} KB document, {len(nodes)} candidate keys\n")
+    print(f"{'keys':>6}{'str.replace ms':>16}{'Replacer ms':>13}{'compile ms':>12}{'speedup':>10}  same output")
+
+    for count in (int(k) for k in args.keys.split(",")):
+        mapping = {key: f"«{i}»" for i, key in enumerate(nodes[:count])}
+        loop_time, expected = best_of(lambda: sequential(mapping, document), args.repeat)
+        compile_time, replacer = best_of(lambda: Replacer(mapping), args.repeat)
+        scan_time, result = best_of(lambda: replacer(document), args.repeat)
+        same = "yes" if result == expected else "no (overlapping keys)"
+        print(f"{len(mapping):>6}{loop_time * 1e3:>16.1f}{scan_time * 1e3:>13.1f}{compile_time * 1e3:>12.2f}"
+              f"{loop_time / scan_time:>9.2f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
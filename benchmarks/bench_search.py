@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Search page benchmark: the full catalog vs the precomputed search index.
+
+Writes a seeded synthetic site, builds its data bundles and compares what
+the pages download (raw and gzipped: plants.json, which every page used to
+fetch, against each page's bundle) and the search page's time to first result:
+fetch-to-parse of the JSON, setting up the search, then one query. The
+timings run the page's own search/plant-search.js under node; without node
+only the sizes are reported.
+
+    python benchmarks/bench_search.py --plants 10000
+
+It then times one checkbox change: the page's old per-plant filter loop
+against ANDing and ORing the index's facet bitsets (plus the per-value
+counts the bitsets make cheap).
+
+The old page built a Fuse.js index over plants.json before its first
+result; Fuse isn't vendored here, so its "old" row only times parsing
+plants.json (a lower bound), as does the "fuse" row of the page's Fuse
+fallback, hydrated from the prebuilt fuse bundle. Pass --fuse
+path/to/fuse.js to add the Fuse index construction (or hydration) and a
+Fuse query to both.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synthetic import write_catalog
+
+QUERIES = ["monstera", "calathea zebrina", "philodendrn", "glossy"]
+
+# argv: mode, data file, query, [fuse.js]; prints {"parse": ms, "setup": ms, "query": ms, "results": n}
+NODE_TIMER = r"""
+const [mode, file, query, fusePath] = process.argv.slice(1);
+const fs = require('fs');
+const text = fs.readFileSync(file, 'utf8');
+const now = () => Number(process.hrtime.bigint()) / 1e6;
+let t0 = now();
+const data = JSON.parse(text);
+const t1 = now();
+let search;
+if (mode === 'index') {
+    const PlantSearch = require(process.env.PLANT_SEARCH);
+    const index = new PlantSearch(data);
+    search = q => index.search(q);
+} else if (fusePath) {
+    const Fuse = require(fusePath);
+    const options = {keys: ['name', 'common_names', 'category', 'description'], threshold: 0.4, includeScore: true};
+    const fuse = mode === 'fuse'
+        ? new Fuse(data.records, options, Fuse.parseIndex(data))
+        : new Fuse(data, options);
+    search = q => fuse.search(q).map(r => r.item);
+}
+const t2 = now();
+const results = search ? search(query).length : null;
+const t3 = now();
+console.log(JSON.stringify({parse: t1 - t0, setup: t2 - t1, query: search ? t3 - t2 : null, results}));
+"""
+
+# argv: search index; prints {"loop": ms, "bitsets": ms, "counts": ms, "results": [n, n]}
+FACET_TIMER = r"""
+const PlantSearch = require(process.env.PLANT_SEARCH);
+const index = new PlantSearch(JSON.parse(require('fs').readFileSync(process.argv[1], 'utf8')));
+const plants = index.plants;
+const selection = {light: ['low', 'medium'], water: ['moderate'], difficulty: ['easy'], size: [], category: [], pet_safe: ['true']};
+const now = () => Number(process.hrtime.bigint()) / 1e6;
+const best = run => { let time = Infinity, result; for (let i = 0; i < 20; i++) { const t0 = now(); result = run(); time = Math.min(time, now() - t0); } return [time, result]; };
+// What applyFilters did per change before the facet index
+const [loop, old] = best(() => plants.filter(plant => {
+    const lightMap = {1: "low", 2: "low", 3: "medium", 4: "bright", 5: "direct"}; if (!selection.light.includes(lightMap[plant.light])) return false;
+    const waterMap = {1: "low", 2: "moderate", 3: "moderate", 4: "high", 5: "high"}; if (!selection.water.includes(waterMap[plant.water])) return false;
+    if (!plant.pet_safe) return false;
+    return selection.difficulty.includes(plant.difficulty);
+}));
+const [bitsets, docs] = best(() => index.docsIn(index.filter(selection)).map(doc => plants[doc]));
+const [counts] = best(() => index.facetCounts(selection));
+console.log(JSON.stringify({loop, bitsets, counts, results: [old.length, docs.length]}));
+"""
+
+
+def sizes(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return len(data), len(gzip.compress(data, 6))
+
+
+def node_time(mode, path, query, fuse=None, repeat=5):
+    """Best of repeat fresh node runs, or None without node"""
+    node = shutil.which("node")
+    if not node:
+        return None
+    env = dict(os.environ, PLANT_SEARCH=os.path.join(ROOT, "search", "plant-search.js"))
+    runs = []
+    for _ in range(repeat):
+        cmd = [node, "-e", NODE_TIMER, mode, path, query] + ([os.path.abspath(fuse)] if fuse else [])
+        runs.append(json.loads(subprocess.run(cmd, capture_output=True, text=True, check=True, env=env).stdout))
+    return min(runs, key=lambda run: run["parse"] + run["setup"] + (run["query"] or 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plants", type=int, default=10000, help="synthetic catalog size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fuse", metavar="FUSE_JS", help="fuse.js (CommonJS build) to time the old page fully")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="plantfinder-bench-") as site:
+        os.environ["PLANTFINDER_CACHE_DIR"] = os.path.join(site, ".build", "compiled")
+        os.environ["PLANTFINDER_ROOT"] = site
+        write_catalog(site, args.plants, args.seed)
+        import generate_data_bundles
+        from data_bundles import bundle_path, load_manifest
+        start = time.perf_counter()
+        generate_data_bundles.main(["-l", "en"])
+        build_seconds = time.perf_counter() - start
+
+        old = os.path.join(site, "data", "plants.json")
+        new = bundle_path(site, "en", "search")
+        fuse = bundle_path(site, "en", "fuse")
+        print(f"\n🌿 {args.plants} synthetic plants; bundles built in {build_seconds:.2f}s\n")
+        print(f"{'payload':<22}{'KB':>10}{'gzip KB':>10}")
+        payloads = [("plants.json (old)", old)]
+        payloads += [(f"{bundle} bundle", bundle_path(site, "en", bundle)) for bundle in load_manifest(site)["en"]]
+        for label, path in payloads:
+            raw, packed = sizes(path)
+            print(f"{label:<22}{raw / 1024:>10.0f}{packed / 1024:>10.0f}")
+        # What the compare tool fetches to compare three plants: the summary, then their shards
+        with open(bundle_path(site, "en", "compare"), encoding="utf-8") as f:
+            summary = json.load(f)
+        urls = [summary["shard"].replace("{id}", plant_id).replace("{hash}", shard)
+                for plant_id, _, shard in summary["plants"][:3]]
+        shards = [os.path.join(site, *url.lstrip("/").split("/")) for url in urls]
+        compare = [sizes(path) for path in [bundle_path(site, "en", "compare")] + shards]
+        print(f"{'compare, 3 plants':<22}{sum(raw for raw, _ in compare) / 1024:>10.0f}"
+              f"{sum(packed for _, packed in compare) / 1024:>10.0f}")
+
+        if not shutil.which("node"):
+            print("\n⏭️  node not found: time to first result not measured")
+            return
+        print(f"\n{'time to first result':<30}{'parse ms':>10}{'setup ms':>10}{'query ms':>10}{'total ms':>10}{'hits':>7}")
+        for query in QUERIES:
+            for label, mode, path in (("old", "catalog", old), ("new", "index", new), ("fuse", "fuse", fuse)):
+                run = node_time(mode, path, query, args.fuse)
+                total = run["parse"] + run["setup"] + (run["query"] or 0)
+                query_ms = f"{run['query']:.1f}" if run["query"] is not None else "-"
+                hits = run["results"] if run["results"] is not None else "-"
+                print(f"{label + ' ' + repr(query):<30}{run['parse']:>10.1f}{run['setup']:>10.1f}{query_ms:>10}"
+                      f"{total:>10.1f}{hits:>7}")
+        if not args.fuse:
+            print("\n(old and fuse rows time parsing only: pass --fuse to add the Fuse setup and query)")
+
+        env = dict(os.environ, PLANT_SEARCH=os.path.join(ROOT, "search", "plant-search.js"))
+        run = json.loads(subprocess.run([shutil.which("node"), "-e", FACET_TIMER, new], capture_output=True,
+                                        text=True, check=True, env=env).stdout)
+        print(f"\n{'one filter change':<30}{'ms':>10}{'results':>10}")
+        print(f"{'old filter loop':<30}{run['loop']:>10.2f}{run['results'][0]:>10}")
+        print(f"{'facet bitsets':<30}{run['bitsets']:>10.2f}{run['results'][1]:>10}")
+        print(f"{'facet counts (all values)':<30}{run['counts']:>10.2f}{'':>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Benchmark suite: the generators on synthetic catalogs from 100 to 100k plants.
+
+Every (stage, size) pair runs in a fresh Python process on a fresh site
+directory written by synthetic.write_catalog, so peak RSS belongs to that
+stage alone. Results are printed as a table and can be saved as JSON to
+compare releases:
+
+    python benchmarks/bench_suite.py --sizes 100,1000,10000,100000 --json results.json
+
+Each result has pages (URLs for the sitemap writers, files for the bulk
+pass, plants times locales for the search index), seconds, pages_per_sec,
+bytes_written (bytes the stage wrote to disk, or rendered for the
+in-memory stages), peak_rss_mb and rss_before_mb (peak RSS once the
+catalog was loaded, before the timed part).
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synthetic import write_catalog
+
+DEFAULT_SIZES = "100,1000,10000,100000"
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def tree_files(directory):
+    """{path: (size, mtime_ns)} for every file under directory"""
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            st = os.stat(path)
+            files[path] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def disk_output(directory):
+    """Callable returning the bytes written under directory since this call"""
+    before = tree_files(directory)
+    return lambda: sum(size for path, (size, mtime) in tree_files(directory).items()
+                       if before.get(path) != (size, mtime))
+
+
+def load_bundles(site):
+    from catalog import load_catalog
+    plants = load_catalog(os.path.join(site, "data", "plants.json"))
+    translations = {}
+    for code in ("de", "es"):
+        with open(os.path.join(site, "data", f"plants_{code}.json"), encoding="utf-8") as f:
+            translations[code] = json.load(f)
+    return plants, translations
+
+
+# Stage setups take the site directory and return (run, output_bytes): run() is
+# timed and returns the page count, output_bytes() is called after it.
+
+def render_stage(locale):
+    def setup(site):
+        import generate_plants
+        plants, translations = load_bundles(site)
+        bundle = translations.get(locale, {})
+        pairs = [(plant, bundle.get(plant.id)) for plant in plants]
+
+        def run():
+            for plant, translation in pairs:
+                generate_plants.generate_plant_html(plant, locale, translation)
+            return len(pairs)
+
+        # Untimed second pass: what the generator would write
+        return run, lambda: sum(len(generate_plants.generate_plant_bytes(p, locale, t)) for p, t in pairs)
+    return setup
+
+
+def translation_pages(site):
+    import generate_translations
+    generate_translations.BASE_DIR = Path(site)
+    generate_translations.plants, _ = load_bundles(site)
+
+    def run():
+        generate_translations.generate_plant_pages("de")
+        return len(generate_translations.plants)
+    return run, disk_output(site)
+
+
+def site_sitemap(site):
+    """The sitemap from a registry of every plant page in every locale"""
+    from generate_translations import STATIC_PAGES
+    from sitemap_writer import write_site_sitemap
+    from url_registry import LANGS, UrlRegistry
+    plants, _ = load_bundles(site)
+    registry = UrlRegistry()
+    for page, changefreq, priority in STATIC_PAGES:
+        registry.add_page(page, LANGS, changefreq, priority)
+    for plant in plants:
+        registry.add_page(f"plants/{plant.id}/", LANGS, "monthly", "0.7")
+    registry.save(site, "generate_plants")
+    del plants, registry
+
+    def run():
+        sitemap, _ = write_site_sitemap(site)
+        return sitemap.urls
+    return run, disk_output(site)
+
+
+def search_indexes(site):
+    """The search page's index in every locale"""
+    from plant_pages import load_locale
+    from search_index import build_index
+    plants, translations = load_bundles(site)
+    sizes = []
+
+    def run():
+        for code in ("en", "de", "es"):
+            index = build_index(plants, translations.get(code, {}), load_locale(code), plants.table)
+            sizes.append(len(json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")))
+        return len(plants) * 3
+    return run, lambda: sum(sizes)
+
+
+def bulk_transforms(site):
+    """The post-render pass over freshly rendered English pages"""
+    import bulk_fixes  # registers the transforms
+    import generate_plants
+    from output_writer import OutputWriter
+    from post_render import run_pipeline
+    plants, _ = load_bundles(site)
+    writer = OutputWriter()
+    for plant in plants:
+        path = os.path.join(site, "plants", plant.id, "index.html")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        writer.write_bytes(path, generate_plants.generate_plant_bytes(plant))
+
+    def run():
+        processed, _ = run_pipeline(site, bulk_fixes.writer, jobs=1, force=True)
+        return processed
+    return run, disk_output(site)
+
+
+STAGES = {
+    "render-en": render_stage("en"),
+    "render-de": render_stage("de"),
+    "render-es": render_stage("es"),
+    "translation-pages": translation_pages,
+    "sitemap": site_sitemap,
+    "search-index": search_indexes,
+    "bulk-fixes": bulk_transforms,
+}
+
+
+def run_child(stage, size, seed):
+    """Time one stage on a fresh synthetic site; prints a JSON result for the parent"""
+    with tempfile.TemporaryDirectory(prefix="plantfinder-bench-") as site:
+        # Compiled catalogs go with the throwaway site, not the checkout
+        os.environ["PLANTFINDER_CACHE_DIR"] = os.path.join(site, ".build", "compiled")
+        write_catalog(site, size, seed)
+        run, output_bytes = STAGES[stage](site)
+        rss_before = peak_rss_mb()
+        start = time.perf_counter()
+        pages = run()
+        seconds = time.perf_counter() - start
+        peak = peak_rss_mb()
+        written = output_bytes()
+    print(json.dumps({
+        "stage": stage,
+        "plants": size,
+        "pages": pages,
+        "seconds": round(seconds, 6),
+        "pages_per_sec": round(pages / seconds, 1) if seconds > 0 else None,
+        "bytes_written": written,
+        "peak_rss_mb": round(peak, 1),
+        "rss_before_mb": round(rss_before, 1),
+    }))
+
+
+def measure(stage, size, args):
+    """Fastest of --repeat fresh child runs"""
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", stage, "--seed", str(args.seed), "--sizes", str(size)]
+    runs = []
+    for _ in range(args.repeat):
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode:
+            raise RuntimeError(f"{stage} at {size} plants failed:\n{proc.stderr}")
+        runs.append(json.loads(proc.stdout.splitlines()[-1]))
+    return min(runs, key=lambda result: result["seconds"])
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_list(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"comma-separated catalog sizes (default: {DEFAULT_SIZES})")
+    parser.add_argument("--stages", default=",".join(STAGES), help="comma-separated stages (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="best of N fresh runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON to PATH")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, int(args.sizes), args.seed)
+        return
+
+    sizes = [int(size) for size in parse_list(args.sizes)]
+    stages = parse_list(args.stages)
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)} (available: {', '.join(STAGES)})")
+
+    print(f"🌿 Benchmarking {len(stages)} stages at {', '.join(map(str, sizes))} plants\n")
+    print(f"{'stage':<22}{'plants':>8}{'pages/s':>11}{'seconds':>10}{'MB written':>12}{'peak RSS MB':>13}")
+    results = []
+    for size in sizes:
+        for stage in stages:
+            result = measure(stage, size, args)
+            results.append(result)
+            print(f"{stage:<22}{size:>8}{result['pages_per_sec'] or 0:>11.0f}{result['seconds']:>10.3f}"
+                  f"{result['bytes_written'] / 1e6:>12.2f}{result['peak_rss_mb']:>13.1f}")
+
+    if args.json:
+        report = {
+            "revision": git_revision(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📊 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Seeded synthetic plant catalogs for benchmarking the generators.
+
+Writes a site's data/ directory (plants.json plus the plants_de.json and
+plants_es.json translation bundles) at any size:
+
+    python benchmarks/synthetic.py --plants 100000 --out /tmp/site
+"""
+
+import argparse
+import json
+import os
+import random
+
+CATEGORIES = ["foliage", "trailing", "succulent", "cactus", "palm", "fern", "flowering"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+SIZES = ["small", "medium", "large"]
+GROWTH_RATES = ["slow", "moderate", "fast"]
+PETS = [[], ["cats"], ["dogs"], ["cats", "dogs"]]
+GENERA = ["Monstera", "Philodendron", "Calathea", "Ficus", "Dracaena", "Hoya", "Peperomia",
+          "Alocasia", "Begonia", "Pilea", "Aglaonema", "Anthurium", "Sansevieria", "Echeveria"]
+EPITHETS = ["Deliciosa", "Aurea", "Variegata", "Elegans", "Minima", "Gigantea", "Rubra",
+            "Argentea", "Compacta", "Marginata", "Lutea", "Nana", "Pendula", "Zebrina"]
+WORDS = ["leaves", "glossy", "bright", "indirect", "light", "water", "soil", "humidity",
+         "trailing", "stems", "patterned", "easy", "care", "statement", "compact", "roots"]
+ORIGINS = ["Central America", "South America", "West Africa", "Southeast Asia", "Madagascar", ""]
+# Non-ASCII on purpose: translated pages exercise the UTF-8 paths
+LOCALE_WORDS = {
+    "de": ["Blätter", "glänzend", "hell", "indirektes", "Licht", "gießen", "Erde", "Luftfeuchtigkeit",
+           "hängend", "Triebe", "gemustert", "pflegeleicht", "Pflege", "Blickfang", "kompakt", "Wurzeln"],
+    "es": ["hojas", "brillantes", "luz", "indirecta", "riego", "sustrato", "humedad", "colgante",
+           "tallos", "estampadas", "fácil", "cuidado", "llamativa", "compacta", "raíces", "jardín"],
+}
+
+
+def _sentence(rng, words, vocabulary=WORDS):
+    return " ".join(rng.choice(vocabulary) for _ in range(words)).capitalize() + "."
+
+
+def make_plant(rng, index):
+    name = f"{rng.choice(GENERA)} {rng.choice(EPITHETS)} {index}"
+    pet_safe = rng.random() < 0.4
+    return {
+        "id": name.lower().replace(" ", "-"),
+        "name": name,
+        "common_names": [f"{rng.choice(EPITHETS)} Plant {index}" for _ in range(rng.randint(0, 2))],
+        "category": rng.choice(CATEGORIES),
+        "light": rng.randint(1, 5),
+        "water": rng.randint(1, 5),
+        "humidity": rng.randint(1, 5),
+        "difficulty": rng.choice(DIFFICULTIES),
+        "pet_safe": pet_safe,
+        "toxic_to": [] if pet_safe else rng.choice(PETS),
+        "size": rng.choice(SIZES),
+        "growth_rate": rng.choice(GROWTH_RATES),
+        "air_purifying": rng.random() < 0.3,
+        "description": " ".join(_sentence(rng, 10) for _ in range(2)),
+        "care_tips": _sentence(rng, 12),
+        "origin": rng.choice(ORIGINS),
+    }
+
+
+def make_catalog(size, seed=0):
+    """Return a list of `size` plant records shaped like data/plants.json"""
+    rng = random.Random(seed)
+    return [make_plant(rng, i) for i in range(size)]
+
+
+def make_translations(plants, locale, seed=0):
+    """Translation bundle shaped like data/plants_<locale>.json: {id: {name, description, care_tips}}"""
+    rng = random.Random(f"{seed}-{locale}")
+    words = LOCALE_WORDS[locale]
+    return {
+        plant["id"]: {
+            "name": plant["name"],
+            "description": " ".join(_sentence(rng, 10, words) for _ in range(2)),
+            "care_tips": _sentence(rng, 12, words),
+        }
+        for plant in plants
+    }
+
+
+def write_catalog(site_dir, size, seed=0):
+    """Write data/plants.json and the translation bundles under site_dir; returns the plants"""
+    plants = make_catalog(size, seed)
+    data_dir = os.path.join(site_dir, "data")
+    os.makedirs(data_dir, exist_ok=True)
+    bundles = {"plants.json": plants}
+    bundles.update((f"plants_{locale}.json", make_translations(plants, locale, seed)) for locale in LOCALE_WORDS)
+    for filename, data in bundles.items():
+        with open(os.path.join(data_dir, filename), "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    return plants
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plants", type=int, default=1000, help="catalog size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True, help="site directory; files go to <out>/data/")
+    args = parser.parse_args()
+
+    write_catalog(args.out, args.plants, args.seed)
+    print(f"🌱 Wrote {args.plants} synthetic plants to {os.path.join(args.out, 'data')}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""Build the whole PlantFinder site as a graph of stages.
+
+Each stage is one generator script with the files it reads and the files it
+writes declared up front. A stage that reads another stage's output runs
+after it; everything else runs in parallel, each stage in its own process.
+A stage whose inputs hash the same as on the last successful run (and whose
+outputs are all still there) is skipped. Every output has exactly one owner,
+so the scripts that used to overwrite each other's sitemaps and articles now
+each write their own part. A stage that rewrites another stage's inputs
+without declaring them as outputs (so the other stage would rerun on the
+next build) is reported at the end.
+
+    python build.py            # run what changed
+    python build.py --dry-run  # list the stages that would run
+    python build.py --force    # run every stage, and have each redo all its work
+    python build.py --trace build-trace.json  # timeline of every stage's spans
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from build_manifest import BuildManifest, digest, source_version
+from url_registry import REGISTRY_DIR
+import profiling
+import tracing
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Modules the page generators share; editing one reruns every stage using it
+PAGE_SOURCES = ["attribute_table.py", "build_manifest.py", "catalog.py", "output_writer.py", "page_template.py", "plant_pages.py",
+                "site_partials.py", "fix_language_selector.py", "url_registry.py", "locales/"]
+STATIC_PAGES = ["", "search/", "quiz/", "compare/", "faq/", "about/"]
+
+
+class Task:
+    """One build stage: a script, what it reads and what it writes.
+
+    force is the script's own flag for ignoring what it skipped last time
+    (scripts with a build manifest of their own), added by build.py --force.
+    """
+
+    __slots__ = ("name", "command", "inputs", "outputs", "deps", "force")
+
+    def __init__(self, name, command, inputs, outputs, deps=(), force=None):
+        self.name = name
+        self.command = command
+        self.inputs = inputs
+        self.outputs = outputs
+        self.deps = list(deps)
+        self.force = force
+
+
+def urls(owner):
+    """The URL registry part a generator saves (see url_registry.py)"""
+    return f"{REGISTRY_DIR}/{owner}.json"
+
+
+def site_tasks():
+    """The site's stages, in the order the manual build ran them"""
+    import bulk_fixes
+    import generate_articles_de
+    import generate_articles_es
+    from catalog import load_catalog
+    from locales import LOCALES
+    from plant_pages import load_locale
+
+    plant_ids = [plant.id for plant in load_catalog(os.path.join(ROOT, "data", "plants.json"))]
+    locales = [load_locale(code) for code in LOCALES]
+    page_tasks = ["plants", "translations", "articles-index", "articles-de", "articles-es"]
+
+    return [
+        Task("plants", ["generate_plants.py", "--no-sitemap"],
+             inputs=["generate_plants.py", "data/plants.json", *PAGE_SOURCES]
+                    + [f"data/{locale.TRANSLATIONS}" for locale in locales if locale.TRANSLATIONS],
+             outputs=[f"{locale.PREFIX}plants/{plant_id}/index.html" for locale in locales for plant_id in plant_ids]
+                     + [urls("generate_plants")],
+             force="--force"),
+        Task("translations", ["generate_translations.py", "--no-plant-pages", "--no-sitemap"],
+             inputs=["generate_translations.py", "multi_replace.py", "translations.json", "data/plants.json",
+                     *PAGE_SOURCES] + [f"{page}index.html" for page in STATIC_PAGES],
+             outputs=[f"{lang}/{page}index.html" for lang in ("es", "de") for page in STATIC_PAGES]
+                     + [urls("generate_translations")]),
+        # Bundle names carry their content hash; the manifest lists them
+        Task("data-bundles", ["generate_data_bundles.py"],
+             inputs=["generate_data_bundles.py", "data_bundles.py", "search_index.py", "fuse_index.py",
+                     "data/plants.json", *PAGE_SOURCES]
+                    + [f"data/{locale.TRANSLATIONS}" for locale in locales if locale.TRANSLATIONS],
+             outputs=["data/bundles/manifest.json"]),
+        Task("articles-index", ["generate_articles.py", "--index-only"],
+             inputs=["generate_articles.py", *PAGE_SOURCES],
+             outputs=["articles/index.html", "es/articles/index.html", "de/articles/index.html", urls("generate_articles")]),
+        Task("articles-de", ["generate_articles_de.py"],
+             inputs=["generate_articles_de.py", *PAGE_SOURCES],
+             outputs=[f"de/articles/{slug}/index.html" for slug in generate_articles_de.articles]
+                     + [urls("generate_articles_de")]),
+        Task("articles-es", ["generate_articles_es.py"],
+             inputs=["generate_articles_es.py", *PAGE_SOURCES],
+             outputs=[f"es/articles/{slug}/index.html" for slug in generate_articles_es.articles]
+                     + [urls("generate_articles_es")]),
+        # Also rewrites pages in place (a no-op on fresh ones), so it waits for every page stage
+        Task("bulk-fixes", ["bulk_fixes.py"],
+             inputs=["bulk_fixes.py", "post_render.py", *PAGE_SOURCES],
+             outputs=[os.path.relpath(path, bulk_fixes.BASE_DIR).replace(os.sep, "/") for path, _ in bulk_fixes.redirect_pages()]
+                     + [".build/page-dates.json", urls("bulk_fixes")],
+             deps=page_tasks, force="--force"),
+        # Reads every stage's registered URLs and the page dates bulk-fixes records, so it runs last
+        Task("sitemap", ["scripts/generate_sitemap.py"],
+             inputs=["scripts/generate_sitemap.py", "sitemap_writer.py", "build_manifest.py", "url_registry.py",
+                     ".build/page-dates.json"]
+                    + [urls(owner) for owner in ("generate_plants", "generate_translations", "generate_articles",
+                                                 "generate_articles_de", "generate_articles_es", "bulk_fixes")],
+             outputs=["sitemap.xml"]),
+    ]
+
+
+def expand(paths):
+    """Input paths with directories replaced by the files under them"""
+    files = []
+    for path in paths:
+        full = os.path.join(ROOT, path)
+        if os.path.isdir(full):
+            for root, dirs, names in os.walk(full):
+                dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                files += [os.path.relpath(os.path.join(root, name), ROOT).replace(os.sep, "/")
+                          for name in sorted(names) if not name.endswith(".pyc")]
+        else:
+            files.append(path)
+    return files
+
+
+def input_hash(paths):
+    h = hashlib.blake2b(digest_size=16)
+    for path in sorted(set(expand(paths))):
+        h.update(path.encode("utf-8") + b"\0")
+        try:
+            with open(os.path.join(ROOT, path), "rb") as f:
+                h.update(f.read())
+        except FileNotFoundError:
+            h.update(b"<missing>")
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def resolve(tasks):
+    """Add implicit dependencies and order tasks so dependencies come first.
+
+    A task that reads another task's output depends on it. Two tasks writing
+    the same file, unknown dependencies and cycles are errors.
+    """
+    by_name = {task.name: task for task in tasks}
+    owners = {}
+    for task in tasks:
+        for path in task.outputs:
+            if path in owners:
+                raise ValueError(f"{path} is written by both {owners[path]} and {task.name}")
+            owners[path] = task.name
+    for task in tasks:
+        for path in expand(task.inputs):
+            owner = owners.get(path)
+            if owner and owner != task.name and owner not in task.deps:
+                task.deps.append(owner)
+        unknown = [dep for dep in task.deps if dep not in by_name]
+        if unknown:
+            raise ValueError(f"{task.name} depends on unknown task(s): {', '.join(unknown)}")
+
+    ordered = []
+    state = {}
+
+    def visit(task, chain):
+        if state.get(task.name) == "done":
+            return
+        if state.get(task.name) == "visiting":
+            raise ValueError(f"dependency cycle: {' -> '.join(chain + [task.name])}")
+        state[task.name] = "visiting"
+        for dep in task.deps:
+            visit(by_name[dep], chain + [task.name])
+        state[task.name] = "done"
+        ordered.append(task)
+
+    for task in tasks:
+        visit(task, [])
+    return ordered
+
+
+def task_key(task, keys):
+    """Fingerprint of the command, its input files and its dependencies' fingerprints"""
+    return digest(task.command, input_hash(task.inputs), [keys[dep] for dep in task.deps])
+
+
+def changed_inputs(tasks, keys, status):
+    """Tasks that ran or were skipped but whose inputs no longer hash as they did then.
+
+    Their inputs were written after their key was taken, by a stage that
+    doesn't declare them as outputs, so the next build would run them again.
+    """
+    return [task.name for task in tasks
+            if status.get(task.name) in ("ran", "skipped") and task_key(task, keys) != keys[task.name]]
+
+
+def stage_command(task, force=False):
+    """The task's command line, with its own force flag when forcing"""
+    return task.command + [task.force] if force and task.force else task.command
+
+
+def run_task(task, env, force=False):
+    """Run a stage's script in its own process; returns (returncode, output, start, end)"""
+    command = stage_command(task, force)
+    start = time.perf_counter()
+    with tracing.span(task.name, "stage", command=" ".join(command)):
+        proc = subprocess.run([sys.executable] + command, cwd=ROOT, env=env,
+                              stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return proc.returncode, proc.stdout, start, time.perf_counter()
+
+
+def critical_path(tasks, durations):
+    """Longest chain of dependent stages by duration: (seconds, [names])"""
+    best = {}
+    for task in tasks:  # dependencies first
+        before = max((best[dep] for dep in task.deps), default=(0.0, []))
+        best[task.name] = (before[0] + durations.get(task.name, 0.0), before[1] + [task.name])
+    return max(best.values(), default=(0.0, []))
+
+
+def report(tasks, timings, status, wall):
+    durations = {name: end - start for name, (start, end) in timings.items()}
+    print(f"\n⏱️  Stages (wall {wall:.2f}s, {sum(durations.values()):.2f}s of stage time)")
+    print(f"   {'stage':<16}{'start':>8}{'end':>8}{'time':>9}")
+    for task in sorted(tasks, key=lambda t: timings.get(t.name, (0.0, 0.0))):
+        if task.name in timings:
+            start, end = timings[task.name]
+            print(f"   {task.name:<16}{start:>8.2f}{end:>8.2f}{end - start:>8.2f}s")
+        else:
+            print(f"   {task.name:<16}{'':>8}{'':>8}{'':>9}  {status[task.name]}")
+    length, chain = critical_path(tasks, durations)
+    if length > 0:
+        steps = " → ".join(f"{name} {durations.get(name, 0.0):.2f}s" for name in chain if name in durations)
+        print(f"🛤️  Critical path {length:.2f}s: {steps}")
+
+
+def build(tasks, jobs=1, force=False, dry_run=False, verbose=False):
+    """Run stale tasks, dependencies first; returns the names of failed tasks"""
+    tasks = resolve(tasks)
+    manifest = BuildManifest.for_generator(ROOT, "build", source_version(__file__), force=force)
+    env = dict(os.environ, PLANTFINDER_ROOT=ROOT)
+
+    keys = {}
+    status = {}
+    timings = {}
+    pending = list(tasks)
+    running = {}
+    t0 = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            for task in list(pending):
+                if any(status.get(dep) in ("failed", "blocked") for dep in task.deps):
+                    status[task.name] = "blocked"
+                    pending.remove(task)
+                    continue
+                if not all(status.get(dep) in ("ran", "skipped", "stale") for dep in task.deps):
+                    continue
+                pending.remove(task)
+                keys[task.name] = key = task_key(task, keys)
+                if all(manifest.is_fresh(task.name, key, os.path.join(ROOT, path)) for path in task.outputs):
+                    manifest.record(task.name, key)
+                    status[task.name] = "skipped"
+                    print(f"⏭️  {task.name} (unchanged)")
+                elif dry_run:
+                    status[task.name] = "stale"
+                    print(f"🔧 {task.name} would run: {' '.join(stage_command(task, force))}")
+                else:
+                    print(f"🔧 {task.name}: {' '.join(stage_command(task, force))}")
+                    running[pool.submit(run_task, task, env, force)] = task
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                returncode, output, start, end = future.result()
+                timings[task.name] = (start - t0, end - t0)
+                if verbose or returncode:
+                    print("".join(f"   │ {line}\n" for line in output.splitlines()), end="")
+                if returncode:
+                    status[task.name] = "failed"
+                    print(f"❌ {task.name} failed (exit {returncode}) after {end - start:.2f}s")
+                else:
+                    # Only successful runs are recorded, so failures rerun next time
+                    manifest.record(task.name, keys[task.name])
+                    status[task.name] = "ran"
+                    print(f"✅ {task.name} ({end - start:.2f}s)")
+
+    if not dry_run:
+        manifest.save()
+        if timings:
+            report(tasks, timings, status, time.perf_counter() - t0)
+        else:
+            print("\n✨ Everything up to date")
+        changed = changed_inputs(tasks, keys, status)
+        if changed:
+            print(f"⚠️  Inputs of {', '.join(changed)} changed during the build: a stage writes them "
+                  f"without declaring them as outputs, so the next build will run them again")
+    return [name for name, state in status.items() if state in ("failed", "blocked")]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="stages to run at once (default: CPU count, 1 = one after another)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the record of previous runs and run every stage, passing --force "
+                             "on to the stages that skip unchanged pages themselves")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="only list the stages that would run")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="show each stage's own output")
+    tracing.add_trace_option(parser)
+    profiling.add_profile_option(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        # Before build() copies the environment, so every stage reports to this trace
+        tracing.start(args.trace)
+    print("🌿 Building PlantFinder...\n")
+    failed = build(site_tasks(), jobs=args.jobs, force=args.force, dry_run=args.dry_run, verbose=args.verbose)
+    trace = tracing.save()
+    if trace:
+        print(f"🧭 Trace written to {trace}")
+    if failed:
+        print(f"\n❌ Not built: {', '.join(failed)}")
+        return 1
+    print("\n🎉 Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(profiling.run(main))
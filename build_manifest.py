@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Persistent build manifest for incremental page generation.
+
+Each generator keeps one JSON manifest under .build/ mapping an output key
+(usually the plant id) to a content hash of everything that went into the page:
+the plant record, its translation entry and the generator version. Pages whose
+hash is unchanged and whose output file still exists are skipped.
+
+A manifest can also carry a hash of the generator's input files: when those
+and the version match the last run, every entry still holds and the
+generator can skip its per-page checks altogether (up_to_date()).
+
+PageDates records when each finished page last changed, for sitemap lastmod.
+"""
+
+import ast
+import functools
+import hashlib
+import json
+import os
+from datetime import date
+
+MANIFEST_DIR = ".build"
+
+
+def digest(*parts):
+    """Stable hash of any JSON-serialisable values"""
+    data = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def quick_digest(*parts):
+    """digest() for per-page hashes in hot loops: hashes repr() instead of JSON.
+
+    Several times cheaper, for plain values only (str, numbers, bools, None
+    and tuples, lists and dicts of them). Unlike digest(), dict key order
+    counts, so the same data built in another order hashes differently.
+    """
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def source_version(*paths):
+    """Hash of generator source files, so template edits invalidate every page"""
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def module_sources(path):
+    """path plus every module of this checkout it imports, directly or not, as a sorted tuple.
+
+    Imports are read from the source (import and from-import statements), so
+    a generator's version can cover the helpers it renders with without
+    listing them by hand. Modules outside the checkout are ignored.
+    """
+    root = os.path.dirname(os.path.abspath(path))
+    seen = set()
+    todo = [os.path.abspath(path)]
+    while todo:
+        path = todo.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                base = os.path.join(root, *name.split("."))
+                for candidate in (f"{base}.py", os.path.join(base, "__init__.py")):
+                    if os.path.isfile(candidate):
+                        todo.append(candidate)
+    return tuple(sorted(seen))
+
+
+class BuildManifest:
+    """Key -> content hash map persisted between runs.
+
+    inputs, if given, is a hash of the generator's input files, kept next to
+    the entries for up_to_date().
+    """
+
+    def __init__(self, path, version, force=False, inputs=None):
+        self.path = path
+        self.version = version
+        self.force = force
+        self.inputs = inputs
+        self.entries = {}
+        self.current = {}
+        self.loaded = False  # the file on disk is this version's
+        self.last_inputs = None
+        if not force and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == version:
+                self.entries = data.get("entries", {})
+                self.last_inputs = data.get("inputs")
+                self.loaded = True
+
+    @classmethod
+    def for_generator(cls, base_dir, name, version, force=False, inputs=None):
+        return cls(os.path.join(base_dir, MANIFEST_DIR, f"{name}.json"), version, force, inputs)
+
+    def up_to_date(self):
+        """True if the version and the input files are the last run's, so every entry still holds"""
+        return self.loaded and self.inputs is not None and self.inputs == self.last_inputs
+
+    def matches(self, key, content_hash):
+        """True if key was built from identical inputs last run (whether its output is still there is not checked)"""
+        return not self.force and self.entries.get(key) == content_hash
+
+    def is_fresh(self, key, content_hash, output_path):
+        """True if the page was built from identical inputs and is still on disk"""
+        return self.matches(key, content_hash) and os.path.exists(output_path)
+
+    def record(self, key, content_hash):
+        self.current[key] = content_hash
+
+    def keep_all(self):
+        """Carry every entry over unchanged (after up_to_date())"""
+        self.current = dict(self.entries)
+
+    def save(self):
+        """Write the manifest atomically, unless it would be unchanged; keys not recorded this run are dropped"""
+        if self.loaded and self.current == self.entries and self.inputs == self.last_inputs:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {"version": self.version, "entries": self.current}
+        if self.inputs is not None:
+            data["inputs"] = self.inputs
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            # One dumps call: json.dump streams through the pure-Python encoder
+            f.write(json.dumps(data, sort_keys=True))
+        os.replace(tmp, self.path)
+
+
+class PageDates:
+    """Page -> (hash of its final bytes, date those bytes first appeared).
+
+    Kept by the post-render pass, the last step to write each page, and read
+    by the sitemap writers for lastmod, so a page's lastmod only moves when
+    the page itself changed. Keys are paths relative to the site root
+    (plants/<id>/index.html); pages not seen in a run are dropped.
+    """
+
+    FILENAME = "page-dates.json"
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.current = {}
+        try:
+            with open(path, "r") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def for_site(cls, base_dir):
+        return cls(os.path.join(base_dir, MANIFEST_DIR, cls.FILENAME))
+
+    def update(self, relpath, content_hash, today=None):
+        """Record the page's current hash; returns its lastmod date"""
+        entry = self.entries.get(relpath)
+        if not entry or entry[0] != content_hash:
+            entry = [content_hash, today or date.today().isoformat()]
+        self.current[relpath] = entry
+        return entry[1]
+
+    def keep(self, relpath):
+        """Carry an unchanged page's entry over; False if there is none"""
+        entry = self.entries.get(relpath)
+        if entry:
+            self.current[relpath] = entry
+        return bool(entry)
+
+    def lastmod(self, page):
+        """Date page (a URL path like "es/plants/<id>/") last changed, or None"""
+        entry = self.entries.get(f"{page}index.html" if not page or page.endswith("/") else page)
+        return entry[1] if entry else None
+
+    def save(self):
+        """Write atomically; pages not updated or kept this run are dropped"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.current, f, sort_keys=True, separators=(",", ":"))
+        os.replace(tmp, self.path)
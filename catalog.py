@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""The plant catalog, loaded once into compact Plant records.
+
+data/plants.json is parsed once per process and every record is normalized
+up front: missing fields get their defaults, levels become ints, flags bools
+and enum values shared strings. The locale-independent page facts (badge
+keys, which "best for" rules apply, the slot values every locale shares) are
+derived at load time too, for the whole catalog at once by attribute_table,
+and plants with the same combination share one copy. Renderers read
+attributes instead of .get()-ing dicts per page.
+
+The loaded catalog is also compiled to .build/compiled/ (pickled Plants and
+their attribute table, marshalled translation bundles), keyed by the source file's hash, so later
+runs unpickle it instead of parsing JSON; a stale copy is rebuilt from the
+JSON.
+"""
+
+import contextlib
+import gc
+import hashlib
+import json
+import marshal
+import os
+import pickle
+import re
+import sqlite3
+import sys
+from itertools import islice
+from sys import intern
+
+import attribute_table
+from build_manifest import MANIFEST_DIR, quick_digest, source_version
+from output_writer import atomic_write
+
+# Source fields in data/plants.json order (Plant.__init__ fills in the defaults)
+FIELDS = ("id", "name", "common_names", "category", "light", "water", "humidity", "difficulty",
+          "pet_safe", "toxic_to", "size", "growth_rate", "air_purifying", "description",
+          "care_tips", "origin")
+
+# Tuples and slot dicts shared by every plant with the same values
+_shared = {}
+
+
+def _share(value):
+    return _shared.setdefault(value, value)
+
+
+def _care_slots(light, water, humidity, maintenance, growth_value, air_purifying):
+    key = ("care_slots", light, water, humidity, maintenance, growth_value, air_purifying)
+    slots = _shared.get(key)
+    if slots is None:
+        slots = _shared[key] = {
+            "light": str(light),
+            "water": str(water),
+            "humidity": str(humidity),
+            "maintenance": str(maintenance),
+            "growth_rate_val": str(growth_value),
+            "air_purifying_val": "4" if air_purifying else "1",
+        }
+    return slots
+
+
+class Plant:
+    """One catalog record plus everything about its page that no locale changes.
+
+    best_for, not_ideal and care_slots are filled in for a whole batch of
+    plants by derive_facts; load_catalog, iter_catalog and as_plant do that.
+    """
+
+    __slots__ = FIELDS + (
+        "common_names_text", "common_name_suffix", "levels", "badges", "info_badges",
+        "best_for", "not_ideal", "care_slots",
+    )
+
+    def __init__(self, record):
+        get = record.get
+        self.id = record["id"]
+        self.name = record["name"]
+        self.common_names = tuple(get("common_names", ()))
+        self.category = intern(get("category", "foliage"))
+        self.light = int(get("light", 3))
+        self.water = int(get("water", 3))
+        self.humidity = int(get("humidity", 3))
+        self.difficulty = intern(get("difficulty", "medium"))
+        self.pet_safe = bool(get("pet_safe", False))
+        self.toxic_to = _share(tuple(map(intern, get("toxic_to", ()))))
+        self.size = intern(get("size", "medium"))
+        self.growth_rate = intern(get("growth_rate", "moderate"))
+        self.air_purifying = bool(get("air_purifying", False))
+        self.description = get("description", "")
+        self.care_tips = get("care_tips", "")
+        self.origin = get("origin", "")
+
+        self.common_names_text = ", ".join(self.common_names)
+        self.common_name_suffix = f" ({self.common_names[0]})" if self.common_names else ""
+        # Hashable keys, so each locale renders a given combination only once
+        self.levels = _share((self.light, self.water, self.humidity))
+        self.badges = _share((self.difficulty, self.category, self.pet_safe))
+        self.info_badges = _share((self.size, self.growth_rate, self.air_purifying))
+
+    def __repr__(self):
+        return f"Plant({self.id!r})"
+
+    def fingerprint(self):
+        """Hash of the normalized source fields, cheap enough to take for every plant on every build"""
+        return quick_digest(*[getattr(self, field) for field in FIELDS])
+
+    def record(self):
+        """The normalized source fields as a JSON-ready dict"""
+        record = {field: getattr(self, field) for field in FIELDS}
+        record["common_names"] = list(self.common_names)
+        record["toxic_to"] = list(self.toxic_to)
+        return record
+
+
+def derive_facts(plants):
+    """Fill in the derived fields of plants from one AttributeTable; returns the table"""
+    table = attribute_table.AttributeTable(plants)
+    for plant, (best_for, not_ideal, maintenance, growth_value) in zip(plants, table.rows()):
+        plant.best_for = best_for
+        plant.not_ideal = not_ideal
+        # Slot values shared verbatim by every locale (read-only: plants share it)
+        plant.care_slots = _care_slots(plant.light, plant.water, plant.humidity, maintenance,
+                                       growth_value, plant.air_purifying)
+    return table
+
+
+def as_plant(plant):
+    """plant as a Plant, normalizing a raw record dict"""
+    if isinstance(plant, Plant):
+        return plant
+    plant = Plant(plant)
+    derive_facts([plant])
+    return plant
+
+
+# Compiled copies of the JSON sources, so a warm start skips parsing and
+# normalizing: <name>-<path hash>.<codec> under .build/compiled/
+CACHE_DIR_ENV = "PLANTFINDER_CACHE_DIR"
+CODECS = {"pickle": pickle, "marshal": marshal}
+# Changes to Plant's layout or derived fields, the Python version or whether the
+# attribute table's columns are NumPy arrays invalidate every copy
+CACHE_VERSION = (f"{source_version(__file__, attribute_table.__file__)}:{sys.version_info[:2]}"
+                 f":{attribute_table.np is not None}")
+
+
+def cache_path(path, codec):
+    directory = os.environ.get(CACHE_DIR_ENV) or os.path.join(os.path.dirname(os.path.abspath(__file__)), MANIFEST_DIR, "compiled")
+    key = hashlib.blake2b(os.path.abspath(path).encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(directory, f"{os.path.basename(path)}-{key}.{codec}")
+
+
+def file_hash(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+@contextlib.contextmanager
+def _no_gc():
+    # Loads allocate millions of objects and free none; collections only cost time
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def load_compiled(path, parse, codec="pickle"):
+    """parse(path), or its compiled copy if path still hashes the same.
+
+    The copy starts with a pickled header (source size, mtime and hash); a
+    matching size and mtime are trusted, otherwise the source is rehashed.
+    A missing, stale or unreadable copy is rebuilt from parse.
+    """
+    path = os.fspath(path)
+    module = CODECS[codec]
+    cached = cache_path(path, codec)
+    st = os.stat(path)
+    source = {"version": CACHE_VERSION, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": None}
+    with _no_gc():
+        try:
+            with open(cached, "rb") as f:
+                header = pickle.load(f)
+                if header.get("version") == CACHE_VERSION:
+                    if (header["size"], header["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+                        return module.load(f)
+                    source["hash"] = file_hash(path)
+                    if header["hash"] == source["hash"]:
+                        # Touched but unchanged: restamp so the next load skips the hash
+                        payload = f.read()
+                        atomic_write(cached, pickle.dumps(source) + payload)
+                        return module.loads(payload)
+        except (OSError, EOFError, ValueError, KeyError, pickle.UnpicklingError):
+            pass
+        # Hash before parsing, so a source edited meanwhile is recompiled next time
+        source["hash"] = source["hash"] or file_hash(path)
+        value = parse(path)
+    try:
+        atomic_write(cached, pickle.dumps(source) + module.dumps(value))
+    except OSError:
+        pass  # read-only checkout: parse every time
+    return value
+
+
+class _JSONStream:
+    """Reads the members of a JSON array or object file one at a time"""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what was consumed, so the buffer stays about one chunk long
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character ("" at the end of the file)"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"{self.f.name}: expected one of {chars!r}, found {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number running into the end of the buffer may continue in the next chunk
+                if self.eof or not isinstance(value, (int, float)) or _NUMBER_TAIL.match(self.buf, end).end() < len(self.buf):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9eE.+-]*")
+_decoder = json.JSONDecoder()
+
+
+def iter_json_array(path, chunk_size=1 << 16):
+    """Items of the JSON array in path, parsed one at a time"""
+    with open(path, encoding="utf-8") as f:
+        stream = _JSONStream(f, chunk_size)
+        stream.expect("[")
+        if stream.peek() == "]":
+            return
+        while True:
+            yield stream.value()
+            if stream.expect(",]") == "]":
+                return
+
+
+def iter_json_object(path, chunk_size=1 << 16):
+    """(key, value) pairs of the JSON object in path, parsed one at a time"""
+    with open(path, encoding="utf-8") as f:
+        stream = _JSONStream(f, chunk_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            yield key, stream.value()
+            if stream.expect(",}") == "}":
+                return
+
+
+def iter_catalog(path, batch_size=1024):
+    """Plants in path, parsed and normalized a batch of records at a time.
+
+    For catalogs too big to hold: memory stays at one batch plus the read
+    buffer however long the file is. Nothing is cached.
+    """
+    records = iter_json_array(os.fspath(path))
+    while True:
+        batch = [Plant(record) for record in islice(records, batch_size)]
+        if not batch:
+            return
+        derive_facts(batch)
+        yield from batch
+
+
+class BundleStore:
+    """A translation bundle ({plant id: entry}) looked up from disk.
+
+    The streaming counterpart of load_json for data/plants_<lang>.json: the
+    bundle is streamed once into an SQLite file under .build/compiled/
+    (rebuilt when the source's hash changes), and get() reads one entry.
+    Use it from one process; workers get their entries with their tasks.
+    """
+
+    def __init__(self, path):
+        path = os.fspath(path)
+        self.path = cache_path(path, "sqlite")
+        st = os.stat(path)
+        self.db = self._open(path, st)
+        if self.db is None:
+            self.db = self._build(path, st)
+
+    def _open(self, path, st):
+        try:
+            db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            header = dict(db.execute("SELECT key, value FROM meta"))
+        except sqlite3.Error:
+            return None
+        if header.get("version") == CACHE_VERSION and (
+                header.get("stat") == f"{st.st_size}:{st.st_mtime_ns}" or header.get("hash") == file_hash(path)):
+            return db
+        db.close()
+        return None
+
+    def _build(self, path, st):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        db = sqlite3.connect(tmp)
+        try:
+            db.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            db.execute("CREATE TABLE entries (id TEXT PRIMARY KEY, entry BLOB)")
+            db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [
+                ("version", CACHE_VERSION), ("stat", f"{st.st_size}:{st.st_mtime_ns}"), ("hash", file_hash(path))])
+            db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?)",
+                           ((key, marshal.dumps(entry)) for key, entry in iter_json_object(path)))
+            db.commit()
+        finally:
+            db.close()
+        os.replace(tmp, self.path)
+        return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def get(self, key, default=None):
+        row = self.db.execute("SELECT entry FROM entries WHERE id = ?", (key,)).fetchone()
+        return marshal.loads(row[0]) if row else default
+
+    def close(self):
+        self.db.close()
+
+
+def load_json(path):
+    """A JSON data file (translation bundles, translations.json) via its compiled copy"""
+    def parse(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return load_compiled(path, parse, "marshal")
+
+
+class Catalog(list):
+    """The catalog's Plants, plus the attribute_table.AttributeTable their facts
+    were derived from (row i is self[i]) for index and feed builders.
+    """
+
+    def __init__(self, plants, table):
+        super().__init__(plants)
+        self.table = table
+
+
+def parse_catalog(path):
+    with open(path, encoding="utf-8") as f:
+        plants = [Plant(record) for record in json.load(f)]
+    return Catalog(plants, derive_facts(plants))
+
+
+_catalogs = {}
+
+
+def load_catalog(path):
+    """The Catalog in path (a data/plants.json), loaded once per process.
+
+    A warm start unpickles the Catalog compiled by an earlier run (table
+    included) instead of parsing and normalizing the JSON again.
+    """
+    path = os.fspath(path)
+    plants = _catalogs.get(path)
+    if plants is None:
+        plants = _catalogs[path] = load_compiled(path, parse_catalog)
+    return plants
+
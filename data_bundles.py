@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Per-page, per-language data bundles with content-hashed filenames.
+
+Each page that loads plant data gets its own bundle per language: only the
+fields that page reads, names translated, minified, written as
+
+    data/bundles/plants.<bundle>.<lang>.<hash>.json
+
+The hash covers the content, so a bundle can be cached forever and a new
+one only appears when its data changes. data/bundles/manifest.json maps
+language -> bundle -> URL; it's the one small file pages revalidate:
+
+    {"de": {"home": "/data/bundles/plants.home.de.3f9a1c2e07.json", ...}, ...}
+
+A bundle can also be sharded by plant, hashed the same way:
+
+    data/bundles/<bundle>/<lang>/<plant id>.<hash>.json
+
+The compare tool works like that: its bundle is only a summary for the
+pickers, and it fetches the shards of the two or three plants being
+compared. To stay small as the catalog grows, the summary is one
+[id, name, shard hash] row per plant plus the URL templates that turn a
+row into its thumbnail and shard (see compare_summary()).
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+
+BUNDLE_DIR = os.path.join("data", "bundles")
+MANIFEST = "manifest.json"
+HASH_LENGTH = 10
+
+# Bundle -> the plant fields its page reads (search and fuse are the
+# search page's indexes, see search_index.py and fuse_index.py, compare is
+# sharded)
+PAGE_FIELDS = {
+    "home": ("id", "name"),
+    "quiz": ("id", "name", "size", "difficulty", "pet_safe"),
+}
+COMPARE_FIELDS = ("id", "name", "category", "size", "difficulty", "pet_safe", "light", "water", "humidity",
+                  "air_purifying")
+
+THUMBNAIL_URL = "/images/plants/{id}.webp"
+
+
+def project(plants, translations, fields):
+    """One {field: value} per plant with just fields, name localized"""
+    rows = []
+    for plant in plants:
+        translation = translations.get(plant.id) or {}
+        row = {field: getattr(plant, field) for field in fields}
+        if "name" in row:
+            row["name"] = translation.get("name") or plant.name
+        rows.append(row)
+    return rows
+
+
+def dumps(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()[:HASH_LENGTH]
+
+
+class BundleWriter:
+    """Writes hashed bundles under base_dir and keeps the manifest.
+
+    Entries for languages not written this run stay in the manifest, so a
+    partial run (one locale) leaves the others alone. save() writes the
+    manifest and removes the bundles it no longer references, and the
+    shards of every sharded bundle written this run that weren't.
+    """
+
+    def __init__(self, base_dir, writer):
+        self.base_dir = base_dir
+        self.dir = os.path.join(base_dir, BUNDLE_DIR)
+        self.writer = writer
+        self.manifest = load_manifest(base_dir)
+        self.shards = {}  # (bundle, lang) -> shard filenames written
+
+    def _write(self, prefix, data):
+        """Write data to <prefix>.<hash>.json under the bundle directory"""
+        encoded = dumps(data).encode("utf-8")
+        relpath = f"{prefix}.{content_hash(encoded)}.json"
+        self.writer.write_bytes(os.path.join(self.dir, *relpath.split("/")), encoded)
+        return f"/{BUNDLE_DIR.replace(os.sep, '/')}/{relpath}", len(encoded)
+
+    def write(self, bundle, lang, data):
+        """Write data (JSON-ready) as lang's bundle; returns (URL, size in bytes)"""
+        url, size = self._write(f"plants.{bundle}.{lang}", data)
+        self.manifest.setdefault(lang, {})[bundle] = url
+        return url, size
+
+    def write_shard(self, bundle, lang, plant_id, data):
+        """Write data as plant_id's shard of lang's bundle; returns (URL, size in bytes)"""
+        url, size = self._write(f"{bundle}/{lang}/{plant_id}", data)
+        self.shards.setdefault((bundle, lang), set()).add(url.rsplit("/", 1)[1])
+        return url, size
+
+    def save(self):
+        os.makedirs(self.dir, exist_ok=True)
+        self.writer.write_text(os.path.join(self.dir, MANIFEST),
+                               json.dumps(self.manifest, indent=2, sort_keys=True) + "\n")
+        self._remove_stale()
+
+    def _remove_stale(self):
+        current = {os.path.basename(url) for bundles in self.manifest.values() for url in bundles.values()}
+        hashed = re.compile(r"plants\.[\w-]+\.[\w-]+\.[0-9a-f]+\.json")
+        for path in glob.glob(os.path.join(glob.escape(self.dir), "plants.*.json")):
+            name = os.path.basename(path)
+            if name not in current and hashed.fullmatch(name):
+                os.remove(path)
+        for (bundle, lang), names in self.shards.items():
+            for path in glob.glob(os.path.join(glob.escape(self.dir), bundle, lang, "*.json")):
+                if os.path.basename(path) not in names:
+                    os.remove(path)
+
+
+def shard_hash(url):
+    """The content hash in a shard's URL"""
+    return url.rsplit(".", 2)[1]
+
+
+def compare_summary(lang, rows):
+    """The compare tool's summary: rows of [id, name, shard hash] plus the URL templates"""
+    return {
+        "thumbnail": THUMBNAIL_URL,
+        "shard": f"/{BUNDLE_DIR.replace(os.sep, '/')}/compare/{lang}/{{id}}.{{hash}}.json",
+        "plants": rows,
+    }
+
+
+def load_manifest(base_dir):
+    """language -> bundle -> URL, empty before the first build"""
+    try:
+        with open(os.path.join(base_dir, BUNDLE_DIR, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def bundle_path(base_dir, lang, bundle):
+    """The file the manifest names for lang's bundle"""
+    url = load_manifest(base_dir)[lang][bundle]
+    return os.path.join(base_dir, *url.lstrip("/").split("/"))
@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 """Fix language selector to match BreedFinder style - in header nav, hover dropdown"""
 
+import argparse
 import os
 import re
 from pathlib import Path
 
+from output_writer import OutputWriter
+import profiling
+import tracing
+
 BASE_DIR = Path(__file__).parent
 
+writer = OutputWriter()
+
 # Language selector HTML for each language
 LANG_SELECTOR = {
     "en": '''<!-- Language selector -->
@@ -47,6 +54,12 @@ LANG_SELECTOR = {
                 </div>'''
 }
 
+# Old fixed position selectors (top right and bottom right), removed in one scan
+OLD_SELECTOR = re.compile(
+    r'<div style="position:fixed;(?:top:80px|bottom:20px);right:20px;z-index:50;">.*?</select>\s*</div>',
+    flags=re.DOTALL
+)
+
 def get_lang_from_path(filepath):
     """Determine language from file path"""
     path_str = str(filepath)
@@ -56,34 +69,14 @@ def get_lang_from_path(filepath):
         return "de"
     return "en"
 
-def fix_file(filepath):
-    """Fix language selector in a single file"""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    lang = get_lang_from_path(filepath)
-    
-    # Remove old fixed position language selector
-    content = re.sub(
-        r'<div style="position:fixed;top:80px;right:20px;z-index:50;">.*?</select>\s*</div>',
-        '',
-        content,
-        flags=re.DOTALL
-    )
-    
-    # Also remove any other fixed language selectors
-    content = re.sub(
-        r'<div style="position:fixed;bottom:20px;right:20px;z-index:50;">.*?</select>\s*</div>',
-        '',
-        content,
-        flags=re.DOTALL
-    )
+def fix_language_selector(content, lang):
+    """Remove old floating selectors and put the hover dropdown in the nav"""
+    # Remove old fixed position language selectors
+    content = OLD_SELECTOR.sub('', content)
     
     # Check if language selector already in nav
     if '<!-- Language selector -->' in content:
-        with open(filepath, 'w') as f:
-            f.write(content)
-        return "cleaned"
+        return content
     
     # Add language selector to nav (before closing </nav>)
     selector = LANG_SELECTOR[lang]
@@ -92,12 +85,31 @@ def fix_file(filepath):
     if '</nav>' in content:
         content = content.replace('</nav>', f'{selector}\n            </nav>', 1)
     
-    with open(filepath, 'w') as f:
-        f.write(content)
+    return content
+
+def fix_file(filepath):
+    """Fix language selector in a single file"""
+    with tracing.span("load page", path=str(filepath)):
+        with open(filepath, 'r') as f:
+            content = f.read()
+    original = content
+    
+    with tracing.span("render page", path=str(filepath)):
+        content = fix_language_selector(content, get_lang_from_path(filepath))
+    writer.write_text(filepath, content, existing=original)
     
-    return "updated"
+    return "cleaned" if '<!-- Language selector -->' in original else "updated"
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    tracing.add_trace_option(parser)
+    profiling.add_profile_option(parser)
+    return parser.parse_args(argv)
 
-def main():
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        tracing.start(args.trace)
     print("Fixing language selectors...\\n")
     
     count = 0
@@ -112,6 +124,10 @@ def main():
             print(f"  Processed {count} files...")
     
     print(f"\\n✅ Fixed {count} files")
+    print(f"📝 {writer.summary()}")
+    trace = tracing.save()
+    if trace:
+        print(f"🧭 Trace written to {trace}")
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Fuse.js's serialized index, built ahead of time.
+
+new Fuse(docs, options) walks every document on each visitor's machine to
+build its index. The index is plain JSON, so the build makes it instead:
+create_index() produces what Fuse.createIndex(KEYS, docs).toJSON() would
+in Fuse 7, and the search page hydrates it with
+
+    new Fuse(docs, {keys: KEYS, threshold: THRESHOLD}, Fuse.parseIndex(index))
+
+Fuse still scores queries in the browser; only the construction moves.
+"""
+
+import math
+
+FUSE_VERSION = "7.0.0"
+
+# The keys and options the search page gives Fuse; the index is only valid
+# for these keys, in this order
+KEYS = ("name", "common_names", "category", "description")
+THRESHOLD = 0.4
+
+
+def create_key(name):
+    """Fuse's createKey() for a plain string key"""
+    return {"path": name.split("."), "id": name, "weight": 1, "src": name, "getFn": None}
+
+
+def field_norm(value):
+    """Fuse's field-length norm: 1/sqrt(space-separated tokens), 3 decimals"""
+    tokens = sum(1 for token in value.split(" ") if token)
+    norm = math.floor(1 / tokens ** 0.5 * 1000 + 0.5) / 1000
+    # JSON.stringify writes 1, not 1.0
+    return int(norm) if norm.is_integer() else norm
+
+
+def _get(doc, path):
+    """Fuse's default getFn: the value at path, array items flattened"""
+    values = [doc]
+    is_list = False
+    for key in path:
+        found = []
+        for value in values:
+            value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, list):
+                is_list = True
+                found.extend(item for item in value if item is not None)
+            elif value is not None:
+                found.append(value)
+        values = found
+    if is_list:
+        return values
+    return values[0] if values else None
+
+
+def create_record(doc, doc_index, keys):
+    """One document's index record: {"i": doc_index, "$": {key index: entry}}
+
+    Only string fields (and lists of strings) are indexed, as the plant
+    docs have no others.
+    """
+    fields = {}
+    for key_index, key in enumerate(keys):
+        value = _get(doc, key["path"])
+        if value is None:
+            continue
+        if isinstance(value, list):
+            # Fuse pops its work stack, so array entries come out last first
+            fields[str(key_index)] = [
+                {"v": item, "i": item_index, "n": field_norm(item)}
+                for item_index, item in reversed(list(enumerate(value)))
+                if isinstance(item, str) and item.strip()
+            ]
+        elif isinstance(value, str) and value.strip():
+            fields[str(key_index)] = {"v": value, "n": field_norm(value)}
+    return {"i": doc_index, "$": fields}
+
+
+def create_index(docs, keys=KEYS):
+    """The serialized Fuse index ({"keys", "records"}) of docs, a list of dicts"""
+    keys = [create_key(key) for key in keys]
+    return {"keys": keys, "records": [create_record(doc, i, keys) for i, doc in enumerate(docs)]}
+
+
+def plant_doc(plant, translation):
+    """The plant as the search page's Fuse sees it, name and description localized"""
+    translation = translation or {}
+    return {
+        "name": translation.get("name") or plant.name,
+        "common_names": list(plant.common_names),
+        "category": plant.category,
+        "description": translation.get("description") or plant.description,
+    }
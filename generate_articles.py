@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 """Generate translated articles for PlantFinder"""
 
+import argparse
 import os
 from pathlib import Path
 
+from output_writer import OutputWriter
+from site_partials import finish_page
+from url_registry import UrlRegistry
+import profiling
+import tracing
+
 BASE_DIR = Path(__file__).parent
 
 # Article translations
@@ -487,8 +494,6 @@ def generate_article_page(slug, lang):
     <link rel="alternate" hreflang="de" href="https://plantfinder.org/de/articles/{slug}/">
     <link rel="icon" href="/favicon.svg" type="image/svg+xml">
     <script src="https://cdn.tailwindcss.com"></script>
-    <script async src="https://www.googletagmanager.com/gtag/js?id=G-J2JW25BZPF"></script>
-    <script>window.dataLayer=window.dataLayer||[];function gtag(){{dataLayer.push(arguments);}}gtag("js",new Date());gtag("config","G-J2JW25BZPF");</script>
 </head>
 <body class="bg-slate-50 min-h-screen">
     <header class="bg-white border-b border-slate-200 sticky top-0 z-50">
@@ -565,8 +570,6 @@ def generate_articles_index(lang):
     <link rel="canonical" href="https://plantfinder.org{lang_prefix}/articles/">
     <link rel="icon" href="/favicon.svg" type="image/svg+xml">
     <script src="https://cdn.tailwindcss.com"></script>
-    <script async src="https://www.googletagmanager.com/gtag/js?id=G-J2JW25BZPF"></script>
-    <script>window.dataLayer=window.dataLayer||[];function gtag(){{dataLayer.push(arguments);}}gtag("js",new Date());gtag("config","G-J2JW25BZPF");</script>
 </head>
 <body class="bg-slate-50 min-h-screen">
     <header class="bg-white border-b border-slate-200 sticky top-0 z-50">
@@ -604,8 +607,21 @@ def generate_articles_index(lang):
     return html
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--index-only", action="store_true",
+                        help="only write the article indexes (generate_articles_de/es.py own the full articles)")
+    tracing.add_trace_option(parser)
+    profiling.add_profile_option(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        tracing.start(args.trace)
     print("Generating translated articles...\\n")
+    writer = OutputWriter()
     
     for lang in ["es", "de"]:
         # Create articles directory
@@ -613,24 +629,37 @@ def main():
         articles_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate index
-        with open(articles_dir / "index.html", "w") as f:
-            f.write(generate_articles_index(lang))
+        with tracing.span("render page", lang=lang, page="articles"):
+            writer.write_text(articles_dir / "index.html", finish_page(generate_articles_index(lang), lang, "articles/"))
         print(f"  ✓ {lang}/articles/index.html")
         
         # Generate each article
+        if args.index_only:
+            continue
         for slug in ARTICLES:
             article_dir = articles_dir / slug
             article_dir.mkdir(exist_ok=True)
-            with open(article_dir / "index.html", "w") as f:
-                f.write(generate_article_page(slug, lang))
+            with tracing.span("render page", lang=lang, page=slug):
+                writer.write_text(article_dir / "index.html", finish_page(generate_article_page(slug, lang), lang))
             print(f"  ✓ {lang}/articles/{slug}/")
     
     # Also update English articles index with language selector
-    with open(BASE_DIR / "articles" / "index.html", "w") as f:
-        f.write(generate_articles_index("en"))
+    with tracing.span("render page", lang="en", page="articles"):
+        writer.write_text(BASE_DIR / "articles" / "index.html", finish_page(generate_articles_index("en"), "en", "articles/"))
     print(f"  ✓ articles/index.html (updated)")
     
+    # The English articles are the hand-written originals the indexes link to
+    registry = UrlRegistry()
+    registry.add_page("articles/", ["en", "es", "de"], "weekly", "0.7")
+    for slug in ARTICLES:
+        registry.add_page(f"articles/{slug}/", ["en"] if args.index_only else ["en", "es", "de"], "monthly", "0.6")
+    registry.save(BASE_DIR, "generate_articles")
+    
+    print(f"\n📝 {writer.summary()}")
+    trace = tracing.save()
+    if trace:
+        print(f"🧭 Trace written to {trace}")
     print("\\n✅ All articles translated!")
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
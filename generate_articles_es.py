@@ -1,17 +1,21 @@
 #!/usr/bin/env python3
 """Generate Spanish article pages for PlantFinder"""
 
+import argparse
 import os
 
-BASE_DIR = os.path.expanduser("~/clawd/houseplant-finder")
-GA_ID = "G-J2JW25BZPF"
+from output_writer import OutputWriter
+from site_partials import finish_page
+from url_registry import UrlRegistry
+import profiling
+import tracing
+
+BASE_DIR = os.environ.get("PLANTFINDER_ROOT") or os.path.expanduser("~/clawd/houseplant-finder")
 
 def get_header(lang_code, current_article):
     return f'''<!DOCTYPE html>
 <html lang="es">
 <head>
-    <script async src="https://www.googletagmanager.com/gtag/js?id={GA_ID}"></script>
-    <script>window.dataLayer=window.dataLayer||[];function gtag(){{dataLayer.push(arguments);}}gtag("js",new Date());gtag("config","{GA_ID}");</script>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">'''
 
@@ -31,6 +35,7 @@ def get_nav():
 
 def get_lang_selector(article_slug):
     return f'''
+                    <!-- Language selector -->
                     <div class="relative group">
                         <button class="flex items-center gap-1 text-slate-600 hover:text-emerald-700 py-2">
                             <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/><path d="M2 12h20M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/></svg>
@@ -364,20 +369,39 @@ def generate_article(slug, article):
     return html
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    tracing.add_trace_option(parser)
+    profiling.add_profile_option(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        tracing.start(args.trace)
+    writer = OutputWriter()
     for slug, article in articles.items():
         article_dir = os.path.join(BASE_DIR, f"es/articles/{slug}")
-        os.makedirs(article_dir, exist_ok=True)
-        
-        html = generate_article(slug, article)
-        
-        with open(os.path.join(article_dir, "index.html"), 'w') as f:
-            f.write(html)
+        with tracing.span("render page", lang="es", page=slug):
+            html = finish_page(generate_article(slug, article), "es")
+        with tracing.span("write page", lang="es", page=slug):
+            writer.write_text(os.path.join(article_dir, "index.html"), html)
         
         print(f"  ✓ {slug}")
     
+    with tracing.span("register urls"):
+        registry = UrlRegistry()
+        for slug in articles:
+            registry.add_page(f"articles/{slug}/", ["es"])
+        registry.save(BASE_DIR, "generate_articles_es")
+    
     print(f"\n✅ Created {len(articles)} Spanish articles")
+    print(f"📝 {writer.summary()}")
+    trace = tracing.save()
+    if trace:
+        print(f"🧭 Trace written to {trace}")
 
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Write the plant data every page loads, per page and language.
+
+For each language: the home page's autocomplete names, the quiz's fields,
+the search page's precomputed index (see search_index.py) and Fuse.js
+index (see fuse_index.py), and the compare tool's picker summary plus one
+shard per plant. Each is written minified under a content-hashed name and
+listed in data/bundles/manifest.json, which the pages read to find them
+(see data_bundles.py).
+"""
+
+import argparse
+import os
+
+from catalog import load_catalog, load_json
+from data_bundles import COMPARE_FIELDS, PAGE_FIELDS, BundleWriter, compare_summary, project, shard_hash
+from fuse_index import create_index, plant_doc
+from locales import LOCALES, parse_locales
+from output_writer import OutputWriter
+from plant_pages import load_locale
+from search_index import build_index
+import profiling
+import tracing
+
+# PLANTFINDER_ROOT (set by build.py) points the generators at another checkout
+BASE_DIR = os.environ.get("PLANTFINDER_ROOT") or os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-l", "--locales", type=parse_locales, default=list(LOCALES),
+                        help=f"comma-separated locales to bundle (default: {','.join(LOCALES)})")
+    tracing.add_trace_option(parser)
+    profiling.add_profile_option(parser)
+    return parser.parse_args(argv)
+
+
+def locale_bundles(plants, translations, strings):
+    """(bundle, JSON-ready data) for one language; plants is the loaded Catalog"""
+    for bundle, fields in PAGE_FIELDS.items():
+        yield bundle, project(plants, translations, fields)
+    with tracing.span("search index", locale=strings.CODE):
+        yield "search", build_index(plants, translations, strings, plants.table)
+    with tracing.span("fuse index", locale=strings.CODE):
+        yield "fuse", create_index([plant_doc(plant, translations.get(plant.id)) for plant in plants])
+
+
+def write_compare(bundles, plants, translations, code):
+    """One shard per plant, then the summary that points at them; returns the summary's (URL, size)"""
+    rows = []
+    total = 0
+    for row in project(plants, translations, COMPARE_FIELDS):
+        url, size = bundles.write_shard("compare", code, row["id"], row)
+        rows.append([row["id"], row["name"], shard_hash(url)])
+        total += size
+    print(f"  ✓ data/bundles/compare/{code}/ ({len(rows)} plants, {total / len(rows or [0]) / 1024:.1f} KB each)")
+    return bundles.write("compare", code, compare_summary(code, rows))
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        tracing.start(args.trace)
+    writer = OutputWriter()
+    bundles = BundleWriter(BASE_DIR, writer)
+    with tracing.span("load data"):
+        plants = load_catalog(os.path.join(DATA_DIR, "plants.json"))
+    print(f"Bundling {len(plants)} plants: {', '.join(args.locales)}")
+
+    for code in args.locales:
+        strings = load_locale(code)
+        translations = load_json(os.path.join(DATA_DIR, strings.TRANSLATIONS)) if strings.TRANSLATIONS else {}
+        for bundle, data in locale_bundles(plants, translations, strings):
+            with tracing.span("write bundle", bundle=bundle, locale=code):
+                url, size = bundles.write(bundle, code, data)
+            print(f"  ✓ {url.lstrip('/')} ({size / 1024:.0f} KB)")
+        with tracing.span("compare shards", locale=code):
+            url, size = write_compare(bundles, plants, translations, code)
+        print(f"  ✓ {url.lstrip('/')} ({size / 1024:.0f} KB)")
+    bundles.save()
+
+    print(f"\n📝 {writer.summary()}")
+    trace = tracing.save()
+    if trace:
+        print(f"🧭 Trace written to {trace}")
+    print("\n🎉 Done!")
+
+
+if __name__ == "__main__":
+    profiling.run(main)
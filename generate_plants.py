@@ -1,579 +1,287 @@
 #!/usr/bin/env python3
-"""Generate all plant pages for PlantFinder"""
-
-import json
-
-# Size to height mapping
-size_heights = {
-    "small": "15-30 cm (6-12 in)",
-    "medium": "30-90 cm (1-3 ft)", 
-    "large": "90-180+ cm (3-6+ ft)"
-}
+"""Generate all plant pages for PlantFinder (English, German and Spanish)"""
 
+import argparse
 import os
-from datetime import datetime
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from build_manifest import BuildManifest, digest, quick_digest, source_version
+from catalog import BundleStore, file_hash, iter_catalog, load_catalog, load_json
+from locales import LOCALES, parse_locales
+from output_writer import OutputWriter, write_if_changed
+from plant_pages import get_renderer, locale_sources
+from sitemap_writer import write_site_sitemap
+from url_registry import UrlRegistry, registry_path
+import profiling
+import tracing
 
 # Configuration
-BASE_DIR = os.path.expanduser("~/clawd/houseplant-finder")
+# PLANTFINDER_ROOT (set by build.py) points the generators at another checkout
+BASE_DIR = os.environ.get("PLANTFINDER_ROOT") or os.path.expanduser("~/clawd/houseplant-finder")
 PLANTS_DIR = os.path.join(BASE_DIR, "plants")
 DATA_FILE = os.path.join(BASE_DIR, "data/plants.json")
-SITEMAP_FILE = os.path.join(BASE_DIR, "sitemap.xml")
-BASE_URL = "https://plantfinder.org"
-
-def get_light_label(level):
-    labels = {1: "Very Low", 2: "Low", 3: "Medium (Indirect)", 4: "Bright Indirect", 5: "Direct Sun"}
-    return labels.get(level, "Medium")
-
-def get_water_label(level):
-    labels = {1: "Very Low", 2: "Low", 3: "Moderate", 4: "Frequent", 5: "Constant"}
-    return labels.get(level, "Moderate")
-
-def get_humidity_label(level):
-    labels = {1: "Very Low", 2: "Low", 3: "Average", 4: "High", 5: "Very High"}
-    return labels.get(level, "Average")
-
-def get_difficulty_badge(difficulty):
-    colors = {
-        "easy": ("emerald", "Easy Care"),
-        "medium": ("amber", "Moderate Care"),
-        "hard": ("rose", "Expert Care")
-    }
-    color, text = colors.get(difficulty, ("slate", difficulty.title()))
-    return f'<span class="bg-{color}-100 text-{color}-700 px-3 py-1 rounded-full text-sm font-medium">{text}</span>'
-
-def get_growth_rate_value(rate):
-    values = {"slow": 2, "moderate": 3, "fast": 5}
-    return values.get(rate, 3)
-
-def generate_plant_html(plant):
-    plant_id = plant["id"]
-    name = plant["name"]
-    common_names = plant.get("common_names", [])
-    common_names_str = ", ".join(common_names) if common_names else ""
-    
-    light = plant.get("light", 3)
-    water = plant.get("water", 3)
-    humidity = plant.get("humidity", 3)
-    difficulty = plant.get("difficulty", "medium")
-    pet_safe = plant.get("pet_safe", False)
-    toxic_to = plant.get("toxic_to", [])
-    size = plant.get("size", "medium").title()
-    size_height = size_heights.get(plant.get("size", "medium"), "30-90 cm")
-    growth_rate = plant.get("growth_rate", "moderate")
-    air_purifying = plant.get("air_purifying", False)
-    description = plant.get("description", "")
-    care_tips = plant.get("care_tips", "")
-    origin = plant.get("origin", "")
-    category = plant.get("category", "foliage")
-    
-    # Calculate maintenance (inverse of difficulty)
-    maintenance_map = {"easy": 2, "medium": 3, "hard": 4}
-    maintenance = maintenance_map.get(difficulty, 3)
-    
-    # Build badges
-    badges = [get_difficulty_badge(difficulty)]
-    badges.append(f'<span class="bg-teal-100 text-teal-700 px-3 py-1 rounded-full text-sm font-medium">{category.title()}</span>')
-    if not pet_safe:
-        badges.append('<span class="bg-rose-100 text-rose-700 px-3 py-1 rounded-full text-sm font-medium">⚠️ Toxic to Pets</span>')
-    else:
-        badges.append('<span class="bg-green-100 text-green-700 px-3 py-1 rounded-full text-sm font-medium">✓ Pet Safe</span>')
-    
-    badges_html = "\n                        ".join(badges)
-    
-    # Pet warning section
-    pet_warning_html = ""
-    if not pet_safe and toxic_to:
-        pets_str = " and ".join(toxic_to)
-        pet_warning_html = f'''
-        <!-- Pet Safety Warning -->
-        <div class="bg-rose-50 border border-rose-200 rounded-2xl p-6 mb-8">
-            <div class="flex items-start gap-4">
-                <div class="w-12 h-12 bg-rose-100 rounded-xl flex items-center justify-center flex-shrink-0">
-                    <i data-lucide="alert-triangle" class="w-6 h-6 text-rose-600"></i>
-                </div>
-                <div>
-                    <h3 class="font-bold text-rose-800 mb-1">⚠️ Toxic to Pets</h3>
-                    <p class="text-rose-700">{name} contains compounds that are toxic to {pets_str} if ingested. Keep this plant out of reach of pets, or consider a <a href="/search/?pet_safe=true" class="underline hover:no-underline">pet-safe alternative</a>.</p>
-                </div>
-            </div>
-        </div>
-'''
-    elif pet_safe:
-        pet_warning_html = f'''
-        <!-- Pet Safety Notice -->
-        <div class="bg-green-50 border border-green-200 rounded-2xl p-6 mb-8">
-            <div class="flex items-start gap-4">
-                <div class="w-12 h-12 bg-green-100 rounded-xl flex items-center justify-center flex-shrink-0">
-                    <i data-lucide="heart" class="w-6 h-6 text-green-600"></i>
-                </div>
-                <div>
-                    <h3 class="font-bold text-green-800 mb-1">✓ Pet Safe</h3>
-                    <p class="text-green-700">{name} is non-toxic and safe for homes with cats and dogs.</p>
-                </div>
-            </div>
-        </div>
-'''
-    
-    # Additional badges for size, growth rate, air purifying
-    info_badges = []
-    info_badges.append(f'''<div class="flex items-center gap-2 px-4 py-2 bg-slate-100 rounded-xl">
-                            <i data-lucide="ruler" class="w-4 h-4 text-slate-600"></i>
-                            <span class="text-sm font-medium text-slate-700">{size}</span>
-                        </div>''')
-    info_badges.append(f'''<div class="flex items-center gap-2 px-4 py-2 bg-slate-100 rounded-xl">
-                            <i data-lucide="trending-up" class="w-4 h-4 text-slate-600"></i>
-                            <span class="text-sm font-medium text-slate-700">{growth_rate.title()} Growth</span>
-                        </div>''')
-    if air_purifying:
-        info_badges.append('''<div class="flex items-center gap-2 px-4 py-2 bg-emerald-100 rounded-xl">
-                            <i data-lucide="wind" class="w-4 h-4 text-emerald-600"></i>
-                            <span class="text-sm font-medium text-emerald-700">Air Purifying</span>
-                        </div>''')
-    
-    info_badges_html = "\n                        ".join(info_badges)
-    
-    # Best for / Not ideal for based on plant characteristics
-    best_for = []
-    not_ideal = []
-    
-    if light <= 2:
-        best_for.append("Low light rooms and offices")
-    elif light >= 4:
-        best_for.append("Bright rooms with good natural light")
-    else:
-        best_for.append("Living rooms with indirect light")
-    
-    if difficulty == "easy":
-        best_for.append("Beginners and busy plant parents")
-    elif difficulty == "hard":
-        not_ideal.append("Beginners or those with limited time")
-    
-    if pet_safe:
-        best_for.append("Homes with cats and dogs")
-    else:
-        not_ideal.append("Homes with curious pets")
-    
-    if water <= 2:
-        best_for.append("Forgetful waterers")
-    elif water >= 4:
-        not_ideal.append("Frequent travelers")
-    
-    if size == "Large":
-        best_for.append("Making a statement in spacious rooms")
-        not_ideal.append("Small apartments or tight spaces")
-    elif size == "Small":
-        best_for.append("Desks, shelves, and small spaces")
-    
-    if humidity >= 4:
-        best_for.append("Bathrooms or rooms with humidifiers")
-        not_ideal.append("Very dry climates without humidity control")
-    
-    if air_purifying:
-        best_for.append("Improving indoor air quality")
-    
-    if category == "trailing":
-        best_for.append("Hanging baskets and high shelves")
-    elif category == "succulent" or category == "cactus":
-        best_for.append("Sunny windowsills")
-    
-    best_for_html = "\n                        ".join([f'<li class="flex items-start gap-2"><i data-lucide="check" class="w-5 h-5 text-green-500 flex-shrink-0 mt-0.5"></i><span>{item}</span></li>' for item in best_for[:4]])
-    not_ideal_html = "\n                        ".join([f'<li class="flex items-start gap-2"><i data-lucide="x" class="w-5 h-5 text-red-500 flex-shrink-0 mt-0.5"></i><span>{item}</span></li>' for item in not_ideal[:3]])
-    
-    growth_rate_val = get_growth_rate_value(growth_rate)
-    air_purifying_val = 4 if air_purifying else 1
-
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <!-- Google Analytics placeholder -->
-    <script async src="https://www.googletagmanager.com/gtag/js?id=G-XXXXXXXXXX"></script>
-    <script>
-      window.dataLayer = window.dataLayer || [];
-      function gtag(){{dataLayer.push(arguments);}}
-      gtag('js', new Date());
-      gtag('config', 'G-XXXXXXXXXX');
-    </script>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{name} Care Guide | PlantFinder</title>
-    <meta name="description" content="Complete care guide for {name}{' (' + common_names[0] + ')' if common_names else ''}. Learn about light, water, humidity needs, and how to keep your {name} thriving.">
-    <link rel="canonical" href="{BASE_URL}/plants/{plant_id}/">
-    <meta property="og:title" content="{name} Care Guide | PlantFinder">
-    <meta property="og:description" content="{description}">
-    <meta property="og:url" content="{BASE_URL}/plants/{plant_id}/">
-    <meta property="og:type" content="article">
-    <meta property="og:site_name" content="PlantFinder">
-    <link rel="icon" href="/favicon.svg" type="image/svg+xml">
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/lucide@latest"></script>
-    <link href="https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@400;500;600;700;800&display=swap" rel="stylesheet">
-    <script>
-        tailwind.config = {{
-            theme: {{
-                extend: {{
-                    fontFamily: {{ sans: ['Plus Jakarta Sans', 'sans-serif'] }}
-                }}
-            }}
-        }}
-    </script>
-    <style>
-        .rating-bar {{ height: 8px; background: #e2e8f0; border-radius: 4px; overflow: hidden; }}
-        .rating-bar::after {{ content: ''; display: block; height: 100%; border-radius: 4px; background: linear-gradient(90deg, #10b981, #14b8a6); }}
-        .rating-1::after {{ width: 20%; }}
-        .rating-2::after {{ width: 40%; }}
-        .rating-3::after {{ width: 60%; }}
-        .rating-4::after {{ width: 80%; }}
-        .rating-5::after {{ width: 100%; }}
-    </style>
-
-    <!-- Twitter Card -->
-    <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="{name} Care Guide">
-    <meta name="twitter:description" content="{description}">
-
-    <!-- Schema.org Markup -->
-    <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "Article",
-        "mainEntityOfPage": {{
-            "@type": "WebPage",
-            "@id": "{BASE_URL}/plants/{plant_id}/"
-        }},
-        "headline": "{name}: Complete Care Guide, Light & Water Needs",
-        "description": "{description}",
-        "author": {{
-            "@type": "Organization",
-            "name": "PlantFinder"
-        }},
-        "publisher": {{
-            "@type": "Organization",
-            "name": "PlantFinder",
-            "logo": {{
-                "@type": "ImageObject",
-                "url": "{BASE_URL}/favicon.svg"
-            }}
-        }}
-    }}
-    </script>
-
-    <!-- Breadcrumb Schema -->
-    <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "BreadcrumbList",
-        "itemListElement": [
-            {{"@type": "ListItem", "position": 1, "name": "Home", "item": "{BASE_URL}/"}},
-            {{"@type": "ListItem", "position": 2, "name": "Plants", "item": "{BASE_URL}/search/"}},
-            {{"@type": "ListItem", "position": 3, "name": "{name}"}}
-        ]
-    }}
-    </script>
-</head>
-<body class="bg-slate-50 text-slate-800">
-    <nav class="bg-white/80 backdrop-blur-md border-b border-slate-200 sticky top-0 z-50">
-        <div class="max-w-6xl mx-auto px-4 py-4">
-            <div class="flex items-center justify-between">
-                <a href="/" class="flex items-center gap-2">
-                    <svg class="w-7 h-7 text-emerald-600" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                        <path d="M7 20h10"/>
-                        <path d="M10 20c5.5-2.5.8-6.4 3-10"/>
-                        <path d="M9.5 9.4c1.1.8 1.8 2.2 2.3 3.7-2 .4-3.5.4-4.8-.3-1.2-.6-2.3-1.9-3-4.2 2.8-.5 4.4 0 5.5.8z"/>
-                        <path d="M14.1 6a7 7 0 0 0-1.1 4c1.9-.1 3.3-.6 4.3-1.4 1-1 1.6-2.3 1.7-4.6-2.7.1-4 1-4.9 2z"/>
-                    </svg>
-                    <span class="font-bold text-xl bg-gradient-to-r from-emerald-600 to-teal-600 bg-clip-text text-transparent">PlantFinder</span>
-                </a>
-                <div class="flex items-center gap-4 md:gap-6">
-                    <a href="/search/" class="text-slate-600 hover:text-slate-900 font-medium hidden sm:block">Browse</a>
-                    <a href="/quiz/" class="text-slate-600 hover:text-slate-900 font-medium hidden sm:block">Quiz</a>
-                    <a href="/compare/" class="text-slate-600 hover:text-slate-900 font-medium hidden sm:block">Compare</a>
-                    <!-- Language selector -->
-                    <div class="relative group">
-                        <button class="flex items-center gap-1 text-slate-600 hover:text-emerald-700 py-2">
-                            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/><path d="M2 12h20M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/></svg>
-                            <span>EN</span>
-                        </button>
-                        <div class="absolute right-0 top-full bg-white border border-slate-200 rounded-xl shadow-xl hidden group-hover:block min-w-[140px] py-2 z-50">
-                            <a href="/plants/{plant_id}/" class="block px-4 py-2 hover:bg-slate-100 font-semibold text-emerald-700">English</a>
-                            <a href="/es/plants/{plant_id}/" class="block px-4 py-2 hover:bg-slate-100 text-slate-600">Español</a>
-                            <a href="/de/plants/{plant_id}/" class="block px-4 py-2 hover:bg-slate-100 text-slate-600">Deutsch</a>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <main class="max-w-6xl mx-auto px-4 py-8">
-        <nav class="text-sm text-slate-500 mb-6">
-            <a href="/" class="hover:text-emerald-600">Home</a>
-            <span class="mx-2">/</span>
-            <a href="/search/" class="hover:text-emerald-600">Plants</a>
-            <span class="mx-2">/</span>
-            <span class="text-slate-700">{name}</span>
-        </nav>
-
-        <div class="bg-white rounded-2xl shadow-sm border border-slate-200 overflow-hidden mb-8">
-            <div class="md:flex">
-                <div class="md:w-2/5">
-                    <div class="aspect-[4/5] bg-gradient-to-br from-emerald-100 via-teal-100 to-lime-100 relative overflow-hidden flex items-center justify-center p-8">
-                        <img src="/images/plants/{plant_id}.webp" alt="{name}" class="w-full h-full object-contain" onerror="this.onerror=null; this.src=''; this.parentElement.innerHTML='<span class=\'text-9xl\'>🪴</span>'">
-                    </div>
-                </div>
-                <div class="md:w-3/5 p-6 md:p-8">
-                    <div class="flex flex-wrap gap-2 mb-4">
-                        {badges_html}
-                    </div>
-                    <h1 class="text-3xl md:text-4xl font-bold text-slate-900 mb-2">{name}</h1>
-                    {f'<p class="text-slate-500 mb-4">Also known as: {common_names_str}</p>' if common_names_str else '<div class="mb-4"></div>'}
-                    
-                    <div class="flex flex-wrap gap-2 mb-6">
-                        {info_badges_html}
-                    </div>
-                    
-                    <div class="grid grid-cols-2 gap-4">
-                        <div class="flex items-center gap-3 p-3 bg-slate-50 rounded-xl">
-                            <i data-lucide="sun" class="w-6 h-6 text-amber-500"></i>
-                            <div>
-                                <p class="text-xs text-slate-500">Light</p>
-                                <p class="font-semibold text-slate-700">{get_light_label(light)}</p>
-                            </div>
-                        </div>
-                        <div class="flex items-center gap-3 p-3 bg-slate-50 rounded-xl">
-                            <i data-lucide="droplets" class="w-6 h-6 text-blue-500"></i>
-                            <div>
-                                <p class="text-xs text-slate-500">Water</p>
-                                <p class="font-semibold text-slate-700">{get_water_label(water)}</p>
-                            </div>
-                        </div>
-                        <div class="flex items-center gap-3 p-3 bg-slate-50 rounded-xl">
-                            <i data-lucide="cloud" class="w-6 h-6 text-cyan-500"></i>
-                            <div>
-                                <p class="text-xs text-slate-500">Humidity</p>
-                                <p class="font-semibold text-slate-700">{get_humidity_label(humidity)}</p>
-                            </div>
-                        </div>
-                        <div class="flex items-center gap-3 p-3 bg-slate-50 rounded-xl">
-                            <i data-lucide="ruler" class="w-6 h-6 text-emerald-500"></i>
-                            <div>
-                                <p class="text-xs text-slate-500">Size</p>
-                                <p class="font-semibold text-slate-700">{size}</p>
-                                <p class="text-xs text-slate-500 mt-1">{size_height}</p>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-{pet_warning_html}
-        <!-- Care Ratings -->
-        <section class="bg-white rounded-2xl shadow-sm border border-slate-200 p-6 md:p-8 mb-8">
-            <h2 class="text-xl font-bold text-slate-900 mb-6">Care Requirements</h2>
-            <div class="grid md:grid-cols-2 gap-x-12 gap-y-4">
-                <div>
-                    <div class="flex justify-between mb-2"><span class="text-slate-600">Light Needs</span><span class="font-medium">{light}/5</span></div>
-                    <div class="rating-bar rating-{light}"></div>
-                </div>
-                <div>
-                    <div class="flex justify-between mb-2"><span class="text-slate-600">Water Needs</span><span class="font-medium">{water}/5</span></div>
-                    <div class="rating-bar rating-{water}"></div>
-                </div>
-                <div>
-                    <div class="flex justify-between mb-2"><span class="text-slate-600">Humidity Needs</span><span class="font-medium">{humidity}/5</span></div>
-                    <div class="rating-bar rating-{humidity}"></div>
-                </div>
-                <div>
-                    <div class="flex justify-between mb-2"><span class="text-slate-600">Maintenance</span><span class="font-medium">{maintenance}/5</span></div>
-                    <div class="rating-bar rating-{maintenance}"></div>
-                </div>
-                <div>
-                    <div class="flex justify-between mb-2"><span class="text-slate-600">Growth Speed</span><span class="font-medium">{growth_rate_val}/5</span></div>
-                    <div class="rating-bar rating-{growth_rate_val}"></div>
-                </div>
-                <div>
-                    <div class="flex justify-between mb-2"><span class="text-slate-600">Air Purifying</span><span class="font-medium">{air_purifying_val}/5</span></div>
-                    <div class="rating-bar rating-{air_purifying_val}"></div>
-                </div>
-            </div>
-        </section>
-
-        <!-- About -->
-        <section class="bg-white rounded-2xl shadow-sm border border-slate-200 p-6 md:p-8 mb-8">
-            <h2 class="text-xl font-bold text-slate-900 mb-4">About the {name}</h2>
-            <p class="text-slate-600 leading-relaxed mb-4">{description}</p>
-            {f'<p class="text-slate-600 leading-relaxed"><strong>Origin:</strong> {origin}</p>' if origin else ''}
-        </section>
-
-        <!-- Care Tips -->
-        <section class="bg-white rounded-2xl shadow-sm border border-slate-200 p-6 md:p-8 mb-8">
-            <h2 class="text-xl font-bold text-slate-900 mb-4">Care Tips</h2>
-            <div class="bg-emerald-50 rounded-xl p-5">
-                <div class="flex items-start gap-3">
-                    <i data-lucide="lightbulb" class="w-6 h-6 text-emerald-600 mt-0.5"></i>
-                    <p class="text-slate-700">{care_tips}</p>
-                </div>
-            </div>
-        </section>
-
-        <!-- Is This Plant Right for You? -->
-        <section class="bg-gradient-to-br from-emerald-50 via-teal-50 to-lime-50 rounded-2xl p-6 md:p-8 mb-8">
-            <h2 class="text-xl font-bold text-slate-900 mb-6">Is This Plant Right for You?</h2>
-            <div class="grid md:grid-cols-2 gap-6 mb-6">
-                <div class="bg-white rounded-xl p-5 shadow-sm">
-                    <h3 class="font-semibold text-green-700 mb-3 flex items-center gap-2">
-                        <i data-lucide="check-circle" class="w-5 h-5"></i>
-                        Best For
-                    </h3>
-                    <ul class="space-y-2 text-slate-600">
-                        {best_for_html}
-                    </ul>
-                </div>
-                <div class="bg-white rounded-xl p-5 shadow-sm">
-                    <h3 class="font-semibold text-red-700 mb-3 flex items-center gap-2">
-                        <i data-lucide="x-circle" class="w-5 h-5"></i>
-                        Not Ideal For
-                    </h3>
-                    <ul class="space-y-2 text-slate-600">
-                        {not_ideal_html if not_ideal_html else '<li class="text-slate-400">No major concerns!</li>'}
-                    </ul>
-                </div>
-            </div>
-            
-            <div class="flex flex-wrap gap-3">
-                <a href="/compare/" class="inline-flex items-center gap-2 bg-white text-slate-700 border border-slate-200 px-5 py-2.5 rounded-xl font-semibold hover:border-slate-300 hover:shadow-md transition">
-                    <i data-lucide="scale" class="w-4 h-4"></i>
-                    Compare with other plants
-                </a>
-                {f'<a href="/search/?pet_safe=true" class="inline-flex items-center gap-2 bg-emerald-600 text-white px-5 py-2.5 rounded-xl font-semibold hover:bg-emerald-700 transition"><i data-lucide="paw-print" class="w-4 h-4"></i>Find pet-safe alternatives</a>' if not pet_safe else ''}
-            </div>
-        </section>
-    </main>
-
-    <footer class="bg-slate-900 text-slate-400 py-12">
-        <div class="max-w-6xl mx-auto px-4">
-            <div class="flex flex-col md:flex-row justify-between items-center gap-4">
-                <div class="flex items-center gap-2">
-                    <svg class="w-6 h-6 text-emerald-400" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                        <path d="M7 20h10"/>
-                        <path d="M10 20c5.5-2.5.8-6.4 3-10"/>
-                        <path d="M9.5 9.4c1.1.8 1.8 2.2 2.3 3.7-2 .4-3.5.4-4.8-.3-1.2-.6-2.3-1.9-3-4.2 2.8-.5 4.4 0 5.5.8z"/>
-                        <path d="M14.1 6a7 7 0 0 0-1.1 4c1.9-.1 3.3-.6 4.3-1.4 1-1 1.6-2.3 1.7-4.6-2.7.1-4 1-4.9 2z"/>
-                    </svg>
-                    <span class="font-bold text-white">PlantFinder</span>
-                </div>
-                <div class="flex gap-6 text-sm">
-                    <a href="/search/" class="hover:text-white">Browse</a>
-                    <a href="/quiz/" class="hover:text-white">Quiz</a>
-                    <a href="/compare/" class="hover:text-white">Compare</a>
-                    <a href="/faq/" class="hover:text-white">FAQ</a>
-                </div>
-                <p class="text-sm">&copy; 2026 PlantFinder</p>
-            </div>
-        </div>
-    </footer>
-    
-    <script>
-        lucide.createIcons();
-    </script>
-</body>
-</html>'''
-    
-    return html
+# Catalogs bigger than this are streamed unless --no-stream says otherwise
+STREAM_THRESHOLD = 64 * 1024 * 1024
 
 
-def generate_sitemap(plants):
-    """Generate sitemap.xml with all plant URLs"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    
-    sitemap = f'''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-    <url>
-        <loc>{BASE_URL}/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>1.0</priority>
-    </url>
-    <url>
-        <loc>{BASE_URL}/search/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>0.9</priority>
-    </url>
-    <url>
-        <loc>{BASE_URL}/quiz/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>monthly</changefreq>
-        <priority>0.8</priority>
-    </url>
-    <url>
-        <loc>{BASE_URL}/compare/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>monthly</changefreq>
-        <priority>0.8</priority>
-    </url>
-    <url>
-        <loc>{BASE_URL}/faq/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>monthly</changefreq>
-        <priority>0.7</priority>
-    </url>
-'''
+def generate_plant_html(plant, locale="en", translation=None):
+    return get_renderer(locale).render(plant, translation=translation)
+
+
+def generate_plant_bytes(plant, locale="en", translation=None):
+    """UTF-8 page straight from the pre-encoded template chunks (no str -> bytes pass)"""
+    return get_renderer(locale).render_bytes(plant, translation=translation)
+
+
+def load_translations(locales, stream=False):
+    """Translation bundle per locale, loaded once: {locale: {plant_id: entry}}
+
+    With stream, each bundle is a BundleStore read from disk entry by entry.
+    """
+    translations = {}
+    for code in locales:
+        path = translation_path(code)
+        if path:
+            translations[code] = BundleStore(path) if stream else load_json(path)
+        else:
+            translations[code] = {}
+    return translations
+
+
+def translation_path(code):
+    """The locale's translation bundle, or None (English has none)"""
+    filename = get_renderer(code).strings.TRANSLATIONS
+    return os.path.join(BASE_DIR, "data", filename) if filename else None
+
+
+def input_hash(code, catalog_hash):
+    """Hash of the files a locale's pages are built from: the catalog (catalog_hash) and its translation bundle"""
+    path = translation_path(code)
+    return digest(catalog_hash, file_hash(path) if path else None)
+
+
+def page_dirs(code):
+    """Ids of the plants with a page directory in the locale's tree (one scan, not a stat per page)"""
+    try:
+        with os.scandir(os.path.join(BASE_DIR, get_renderer(code).prefix, "plants")) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+
+def generate_sitemap(writer=None):
+    """Write sitemap.xml for every registered page; returns the number of URLs"""
+    sitemap, _ = write_site_sitemap(BASE_DIR, writer)
+    return sitemap.urls
+
+
+def plant_page_path(plant_id, locale="en"):
+    return os.path.join(BASE_DIR, get_renderer(locale).prefix, "plants", plant_id, "index.html")
+
+
+def write_plant_page(task):
+    """Render one plant in each requested locale and write the pages.
+
+    task is (plant, [(locale, translation), ...]); the catalog Plant carries
+    the locale-independent facts every locale shares. Returns
+    (name, id, [(locale, changed), ...]) so the parent process can print
+    progress and count writes even when this runs in a worker.
+    """
+    plant, locales = task
+    plant_id = plant.id
+    results = []
+    with tracing.span("plant", plant=plant_id):
+        for locale, translation in locales:
+            with tracing.span("render page", locale=locale):
+                html = get_renderer(locale).render_bytes(plant, translation)
+            # Write file (skipped if identical; creates the directory if needed)
+            results.append((locale, write_if_changed(plant_page_path(plant_id, locale), html)))
+    return plant.name, plant_id, results
+
+
+def write_plant_pages(tasks, jobs=1):
+    """Write every plant page, fanning out across a process pool when jobs > 1.
+
+    Each worker renders with the same LocaleRenderers, so the output is
+    byte-identical to the serial path. Results come back in catalog order.
+    """
+    if jobs <= 1 or len(tasks) < 2:
+        for task in tasks:
+            yield write_plant_page(task)
+        return
     
+    # Contiguous slices keep per-task overhead low for big catalogs
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(write_plant_page, tasks, chunksize=chunksize)
+
+
+def write_plant_batch(tasks):
+    return [write_plant_page(task) for task in tasks]
+
+
+def stream_plant_pages(tasks, jobs=1, batch_size=256):
+    """write_plant_pages for a task iterator of unknown length.
+
+    Tasks are pulled in batches of batch_size, with at most two batches per
+    worker in flight, so the plants, translations and rendered pages held at
+    once are bounded by the batch size rather than the catalog. The per-page
+    bookkeeping still grows with the catalog: stale_tasks records a hash per
+    page in the build manifests and a URL per plant in the registry. Results
+    come back in catalog order.
+    """
+    tasks = iter(tasks)
+    if jobs <= 1:
+        yield from map(write_plant_page, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        in_flight = deque()
+        while True:
+            batch = list(islice(tasks, batch_size))
+            if batch:
+                in_flight.append(pool.submit(write_plant_batch, batch))
+            if in_flight and (not batch or len(in_flight) >= 2 * jobs):
+                yield from in_flight.popleft().result()
+            elif not batch:
+                return
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-l", "--locales", type=parse_locales, default=list(LOCALES),
+                        help=f"comma-separated locales to build (default: {','.join(LOCALES)})")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count, 1 = serial)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the build manifest and rebuild every page")
+    parser.add_argument("--no-sitemap", dest="sitemap", action="store_false",
+                        help="leave sitemap.xml alone (build.py writes it in its own stage)")
+    parser.add_argument("--stream", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"parse the catalog record by record instead of loading it whole "
+                             f"(default: only for catalogs over {STREAM_THRESHOLD // 2**20} MB)")
+    parser.add_argument("--batch-size", type=int, default=256,
+                        help="plants per worker batch when streaming (default: 256)")
+    tracing.add_trace_option(parser)
+    profiling.add_profile_option(parser)
+    return parser.parse_args(argv)
+
+
+def stale_tasks(plants, translations, manifests, built, counts, registry):
+    """(plant, [(locale, translation), ...]) for each plant with a page to rebuild.
+
+    Only pages whose record, translation or renderer changed since the last
+    run, or whose directory is missing from built (locale -> page_dirs()),
+    are rebuilt. The record is hashed once per plant, and each locale with a
+    translation hashes that in. Lazy, so a streamed catalog flows straight through;
+    counts["plants"] and counts["skipped"] are updated and every plant's
+    pages registered as plants go by (the manifests and registry keep one
+    entry per page, so they are the part of a streamed build that still
+    grows with the catalog).
+    """
+    locales = list(manifests)
     for plant in plants:
-        sitemap += f'''    <url>
-        <loc>{BASE_URL}/plants/{plant["id"]}/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>monthly</changefreq>
-        <priority>0.8</priority>
-    </url>
-'''
-    
-    sitemap += '</urlset>'
-    return sitemap
+        counts["plants"] += 1
+        plant_id = plant.id
+        registry.add_page(f"plants/{plant_id}/", locales, "monthly", "0.7")
+        record_hash = plant.fingerprint()
+        stale = []
+        for code, manifest in manifests.items():
+            translation = translations[code].get(plant_id)
+            content_hash = quick_digest(record_hash, translation) if translation else record_hash
+            manifest.record(plant_id, content_hash)
+            if manifest.matches(plant_id, content_hash) and plant_id in built[code]:
+                counts["skipped"] += 1
+            else:
+                stale.append((code, translation))
+        if stale:
+            yield plant, stale
 
 
-def main():
-    # Load plant data
-    print(f"Loading plant data from {DATA_FILE}...")
-    with open(DATA_FILE, 'r') as f:
-        plants = json.load(f)
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        tracing.start(args.trace)
+    writer = OutputWriter()
+    stream = args.stream if args.stream is not None else os.path.getsize(DATA_FILE) > STREAM_THRESHOLD
+    catalog_hash = file_hash(DATA_FILE)
+    manifests = {
+        code: BuildManifest.for_generator(BASE_DIR, f"plants-{code}", source_version(__file__, *locale_sources([code])),
+                                          force=args.force, inputs=input_hash(code, catalog_hash))
+        for code in args.locales
+    }
+    built = {code: page_dirs(code) for code in args.locales}
+    counts = {"plants": 0, "skipped": 0}
+    registry = UrlRegistry()
     
-    print(f"Found {len(plants)} plants")
+    if os.path.exists(registry_path(BASE_DIR, "generate_plants")) and all(
+            manifest.up_to_date() and manifest.entries.keys() <= built[code] for code, manifest in manifests.items()):
+        # Same catalog, translations and renderer as the last run, every page still there:
+        # nothing to load or check page by page, and the manifests and URL registry stand
+        print(f"Plant data, translations and renderer unchanged since the last run ({', '.join(args.locales)})")
+        for manifest in manifests.values():
+            manifest.keep_all()
+        counts["skipped"] = sum(len(manifest.entries) for manifest in manifests.values())
+        registry = None
+        pages = 0
+        results = ()
+    elif stream:
+        # Records are parsed as the workers ask for them; translations are read from disk
+        print(f"Streaming plant data from {DATA_FILE}, building locales: {', '.join(args.locales)}")
+        with tracing.span("load translations", locales=",".join(args.locales)):
+            translations = load_translations(args.locales, stream=True)
+        tasks = stale_tasks(iter_catalog(DATA_FILE), translations, manifests, built, counts, registry)
+        pages = None  # not known until the catalog has streamed past
+        results = stream_plant_pages(tasks, args.jobs, args.batch_size)
+    else:
+        # Load plant data and every locale's translations once
+        print(f"Loading plant data from {DATA_FILE}...")
+        with tracing.span("load data"):
+            plants = load_catalog(DATA_FILE)
+        with tracing.span("load translations", locales=",".join(args.locales)):
+            translations = load_translations(args.locales)
+        print(f"Found {len(plants)} plants, building locales: {', '.join(args.locales)}")
+        with tracing.span("check manifests"):
+            tasks = list(stale_tasks(plants, translations, manifests, built, counts, registry))
+        pages = sum(len(stale) for _, stale in tasks)
+        results = write_plant_pages(tasks, args.jobs)
     
-    # Generate pages for each plant
+    # Generate pages for each plant, all locales in one pass
     created = 0
-    skipped = 0
+    start = time.perf_counter()
     
-    for plant in plants:
-        plant_id = plant["id"]
-        plant_dir = os.path.join(PLANTS_DIR, plant_id)
-        plant_file = os.path.join(plant_dir, "index.html")
-        
-        # Create directory if needed
-        os.makedirs(plant_dir, exist_ok=True)
-        
-        # Generate HTML
-        html = generate_plant_html(plant)
-        
-        # Write file
-        with open(plant_file, 'w') as f:
-            f.write(html)
-        
-        created += 1
-        print(f"  ✓ {plant['name']} ({plant_id})")
+    with tracing.span("render pages", pages=pages, jobs=args.jobs):
+        for name, plant_id, written in results:
+            for locale, changed in written:
+                writer.tally(changed)
+                created += 1
+            print(f"  ✓ {name} ({plant_id}) [{', '.join(locale for locale, _ in written)}]")
     
-    print(f"\n✅ Created {created} plant pages")
+    for manifest in manifests.values():
+        manifest.save()
+    if registry is not None:
+        registry.save(BASE_DIR, "generate_plants")
+    skipped = counts["skipped"]
+    elapsed = time.perf_counter() - start
+    rate = created / elapsed if elapsed > 0 else 0
+    print(f"\n✅ Created {created} plant pages in {elapsed:.2f}s ({rate:.0f} pages/sec, {args.jobs} worker{'s' if args.jobs != 1 else ''})")
+    if skipped:
+        print(f"⏭️  Skipped {skipped} unchanged plant pages (use --force to rebuild)")
     
-    # Generate sitemap
-    print(f"\nGenerating sitemap...")
-    sitemap = generate_sitemap(plants)
-    with open(SITEMAP_FILE, 'w') as f:
-        f.write(sitemap)
-    print(f"✅ Sitemap updated with {len(plants)} plant URLs")
+    if args.sitemap:
+        print(f"\nGenerating sitemap...")
+        with tracing.span("sitemap"):
+            urls = generate_sitemap(writer)
+        print(f"✅ Sitemap updated with {urls} URLs")
     
-    print(f"\n🎉 Done! All plant pages generated at {PLANTS_DIR}/")
+    print(f"\n📝 {writer.summary()}")
+    trace = tracing.save()
+    if trace:
+        print(f"🧭 Trace written to {trace}")
+    print(f"\n🎉 Done! Plant pages generated under {BASE_DIR}/")
 
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
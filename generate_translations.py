@@ -1,20 +1,30 @@
 #!/usr/bin/env python3
 """Generate Spanish and German translations for PlantFinder"""
 
-import json
+import argparse
 import os
 import re
 from pathlib import Path
 
+from catalog import load_catalog, load_json
+from multi_replace import Replacer
+from output_writer import OutputWriter
+from plant_pages import get_renderer
+from site_partials import finish_page
+from sitemap_writer import write_site_sitemap
+from url_registry import UrlRegistry
+import profiling
+import tracing
+
 BASE_DIR = Path(__file__).parent
 PLANTS_FILE = BASE_DIR / "data" / "plants.json"
 TRANS_FILE = BASE_DIR / "translations.json"
 
+writer = OutputWriter()
+
 # Load data
-with open(PLANTS_FILE) as f:
-    plants = json.load(f)
-with open(TRANS_FILE) as f:
-    translations = json.load(f)
+plants = load_catalog(PLANTS_FILE)
+translations = load_json(TRANS_FILE)
 
 # Plant name translations (common plants)
 PLANT_NAMES = {
@@ -130,7 +140,7 @@ PLANT_DESCRIPTIONS = {
 
 def get_plant_name(plant, lang):
     """Get translated plant name or return original"""
-    return PLANT_NAMES.get(lang, {}).get(plant["name"], plant["name"])
+    return PLANT_NAMES.get(lang, {}).get(plant.name, plant.name)
 
 def translate_difficulty(diff, lang):
     return PLANT_DESCRIPTIONS.get(lang, {}).get(diff, diff)
@@ -179,50 +189,28 @@ def generate_homepage(lang):
         'About': t['about'],
         'Contact': t['contact'],
         'Privacy': t['privacy'],
+        # Fix URLs for language subdirectory
+        'href="/quiz/"': f'href="/{lang}/quiz/"',
+        'href="/compare/"': f'href="/{lang}/compare/"',
+        'href="/search/"': f'href="/{lang}/search/"',
+        'href="/faq/"': f'href="/{lang}/faq/"',
+        'href="/about/"': f'href="/{lang}/about/"',
+        'href="/plants/': f'href="/{lang}/plants/',
+        'https://houseplantfinder.app/">': f'https://plantfinder.org/{lang}/">',
     }
     
-    for old, new in replacements.items():
-        html = html.replace(old, new)
-    
-    # Fix URLs for language subdirectory
-    html = html.replace('href="/quiz/"', f'href="/{lang}/quiz/"')
-    html = html.replace('href="/compare/"', f'href="/{lang}/compare/"')
-    html = html.replace('href="/search/"', f'href="/{lang}/search/"')
-    html = html.replace('href="/faq/"', f'href="/{lang}/faq/"')
-    html = html.replace('href="/about/"', f'href="/{lang}/about/"')
-    html = html.replace('href="/plants/', f'href="/{lang}/plants/')
+    # One scan over the page for every key
+    html = Replacer(replacements)(html)
     
     # Update canonical
-    html = html.replace('https://houseplantfinder.app/">', f'https://plantfinder.org/{lang}/">')
     html = re.sub(r'<link rel="canonical" href="[^"]+">',
                   f'<link rel="canonical" href="https://plantfinder.org/{lang}/">', html)
     
-    # Add hreflang tags
-    hreflang = '''
-    <link rel="alternate" hreflang="en" href="https://plantfinder.org/">
-    <link rel="alternate" hreflang="es" href="https://plantfinder.org/es/">
-    <link rel="alternate" hreflang="de" href="https://plantfinder.org/de/">
-    <link rel="alternate" hreflang="x-default" href="https://plantfinder.org/">'''
-    
-    html = html.replace('</head>', f'{hreflang}\n</head>')
-    
-    # Add language selector before </body>
-    lang_selector = f'''
-    <div style="position:fixed;bottom:20px;right:20px;z-index:50;">
-        <select onchange="window.location.href=this.value" 
-                class="bg-white dark:bg-slate-800 border border-slate-300 dark:border-slate-600 rounded-lg px-3 py-2 text-sm shadow-lg"
-                aria-label="Select language">
-            <option value="/" {"" if lang == "en" else ""}>🇬🇧 English</option>
-            <option value="/es/" {"selected" if lang == "es" else ""}>🇪🇸 Español</option>
-            <option value="/de/" {"selected" if lang == "de" else ""}>🇩🇪 Deutsch</option>
-        </select>
-    </div>'''
-    
-    html = html.replace('</body>', f'{lang_selector}\n</body>')
+    # Consent banner, hreflang and nav language selector
+    html = finish_page(html, lang, "")
     
     # Write translated homepage
-    with open(lang_dir / "index.html", "w") as f:
-        f.write(html)
+    writer.write_text(lang_dir / "index.html", html)
     
     print(f"  ✓ {lang}/index.html")
 
@@ -260,23 +248,20 @@ def generate_search_page(lang):
         'No': t['no'],
         'plants found': 'plantas encontradas' if lang == 'es' else 'Pflanzen gefunden',
         'PlantFinder': 'PlantFinder',
+        # Fix URLs
+        'href="/"': f'href="/{lang}/"',
+        'href="/quiz/"': f'href="/{lang}/quiz/"',
+        'href="/compare/"': f'href="/{lang}/compare/"',
+        'href="/plants/': f'href="/{lang}/plants/',
     }
     
-    for old, new in replacements.items():
-        html = html.replace(old, new)
-    
-    # Fix URLs
-    html = html.replace('href="/"', f'href="/{lang}/"')
-    html = html.replace('href="/quiz/"', f'href="/{lang}/quiz/"')
-    html = html.replace('href="/compare/"', f'href="/{lang}/compare/"')
-    html = html.replace('href="/plants/', f'href="/{lang}/plants/')
+    html = Replacer(replacements)(html)
     
     # Update canonical
     html = re.sub(r'<link rel="canonical" href="[^"]+">',
                   f'<link rel="canonical" href="https://plantfinder.org/{lang}/search/">', html)
     
-    with open(lang_dir / "index.html", "w") as f:
-        f.write(html)
+    writer.write_text(lang_dir / "index.html", finish_page(html, lang, "search/"))
     
     print(f"  ✓ {lang}/search/index.html")
 
@@ -359,16 +344,13 @@ def generate_quiz_page(lang):
         '<html lang="en">': f'<html lang="{lang}">',
     }
     replacements.update(quiz_trans.get(lang, {}))
-    
-    for old, new in replacements.items():
-        html = html.replace(old, new)
-    
     # Fix URLs
-    html = html.replace('href="/"', f'href="/{lang}/"')
-    html = html.replace('href="/plants/', f'href="/{lang}/plants/')
+    replacements['href="/"'] = f'href="/{lang}/"'
+    replacements['href="/plants/'] = f'href="/{lang}/plants/'
     
-    with open(lang_dir / "index.html", "w") as f:
-        f.write(html)
+    html = Replacer(replacements)(html)
+    
+    writer.write_text(lang_dir / "index.html", finish_page(html, lang, "quiz/"))
     
     print(f"  ✓ {lang}/quiz/index.html")
 
@@ -416,16 +398,13 @@ def generate_compare_page(lang):
         '<html lang="en">': f'<html lang="{lang}">',
     }
     replacements.update(compare_trans.get(lang, {}))
-    
-    for old, new in replacements.items():
-        html = html.replace(old, new)
-    
     # Fix URLs
-    html = html.replace('href="/"', f'href="/{lang}/"')
-    html = html.replace('href="/plants/', f'href="/{lang}/plants/')
+    replacements['href="/"'] = f'href="/{lang}/"'
+    replacements['href="/plants/'] = f'href="/{lang}/plants/'
+    
+    html = Replacer(replacements)(html)
     
-    with open(lang_dir / "index.html", "w") as f:
-        f.write(html)
+    writer.write_text(lang_dir / "index.html", finish_page(html, lang, "compare/"))
     
     print(f"  ✓ {lang}/compare/index.html")
 
@@ -470,15 +449,12 @@ def generate_faq_page(lang):
         '<html lang="en">': f'<html lang="{lang}">',
     }
     replacements.update(faq_trans.get(lang, {}))
-    
-    for old, new in replacements.items():
-        html = html.replace(old, new)
-    
     # Fix URLs
-    html = html.replace('href="/"', f'href="/{lang}/"')
+    replacements['href="/"'] = f'href="/{lang}/"'
     
-    with open(lang_dir / "index.html", "w") as f:
-        f.write(html)
+    html = Replacer(replacements)(html)
+    
+    writer.write_text(lang_dir / "index.html", finish_page(html, lang, "faq/"))
     
     print(f"  ✓ {lang}/faq/index.html")
 
@@ -509,138 +485,88 @@ def generate_about_page(lang):
         '<html lang="en">': f'<html lang="{lang}">',
     }
     replacements.update(about_trans.get(lang, {}))
-    
-    for old, new in replacements.items():
-        html = html.replace(old, new)
-    
     # Fix URLs
-    html = html.replace('href="/"', f'href="/{lang}/"')
+    replacements['href="/"'] = f'href="/{lang}/"'
+    
+    html = Replacer(replacements)(html)
     
-    with open(lang_dir / "index.html", "w") as f:
-        f.write(html)
+    writer.write_text(lang_dir / "index.html", finish_page(html, lang, "about/"))
     
     print(f"  ✓ {lang}/about/index.html")
 
 def generate_plant_pages(lang):
-    """Generate translated plant detail pages"""
-    t = translations[lang]
+    """Generate translated plant detail pages.
+
+    Rendered straight from the catalog, data/plants_<lang>.json and the
+    locale strings in locales/, so the English pages need not be built first.
+    """
+    renderer = get_renderer(lang)
+    with tracing.span("load translations", locale=lang):
+        plant_translations = load_json(BASE_DIR / "data" / renderer.strings.TRANSLATIONS)
     
     for plant in plants:
-        plant_id = plant['id']
-        plant_dir = BASE_DIR / lang / "plants" / plant_id
-        plant_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Read English plant page
-        en_page = BASE_DIR / "plants" / plant_id / "index.html"
-        if not en_page.exists():
-            continue
-        
-        with open(en_page) as f:
-            html = f.read()
-        
-        # Basic translations
-        replacements = {
-            '<html lang="en">': f'<html lang="{lang}">',
-            'Care Guide': t['care_guide'],
-            'Light': t['light'],
-            'Water': t['water'],
-            'Humidity': t['humidity'],
-            'Difficulty': t['difficulty'],
-            'Size': t['size'],
-            'Toxic to': t['toxic_to'],
-            'Origin': t['origin'],
-            'Care Tips': t['care_tips'],
-            'Common Names': t['common_names'],
-            '>Easy<': f'>{t["easy"]}<',
-            '>Moderate<': f'>{t["moderate"]}<',
-            '>Hard<': f'>{t["hard"]}<',
-            '>Small<': f'>{t["small"]}<',
-            '>Medium<': f'>{t["medium"]}<',
-            '>Large<': f'>{t["large"]}<',
-            '>Low<': f'>{t["low"]}<',
-            '>High<': f'>{t["high"]}<',
-            'cats': t['cats'],
-            'dogs': t['dogs'],
-        }
-        
-        for old, new in replacements.items():
-            html = html.replace(old, new)
-        
-        # Fix URLs
-        html = html.replace('href="/"', f'href="/{lang}/"')
-        html = html.replace('href="/search/"', f'href="/{lang}/search/"')
-        html = html.replace('href="/quiz/"', f'href="/{lang}/quiz/"')
-        html = html.replace('href="/compare/"', f'href="/{lang}/compare/"')
-        html = html.replace('href="/plants/', f'href="/{lang}/plants/')
-        
-        # Update canonical
-        html = re.sub(r'<link rel="canonical" href="[^"]+">',
-                      f'<link rel="canonical" href="https://plantfinder.org/{lang}/plants/{plant_id}/">', html)
-        
-        with open(plant_dir / "index.html", "w") as f:
-            f.write(html)
+        plant_id = plant.id
+        with tracing.span("render page", locale=lang, plant=plant_id):
+            html = renderer.render_bytes(plant, translation=plant_translations.get(plant_id))
+        writer.write_bytes(BASE_DIR / lang / "plants" / plant_id / "index.html", html)
     
     print(f"  ✓ {lang}/plants/ ({len(plants)} plants)")
 
-def update_sitemap():
-    """Update sitemap with translated pages"""
-    urls = []
-    
-    # English pages
-    urls.append(('https://plantfinder.org/', '1.0'))
-    urls.append(('https://plantfinder.org/search/', '0.9'))
-    urls.append(('https://plantfinder.org/quiz/', '0.9'))
-    urls.append(('https://plantfinder.org/compare/', '0.9'))
-    urls.append(('https://plantfinder.org/faq/', '0.8'))
-    urls.append(('https://plantfinder.org/about/', '0.7'))
-    
-    for plant in plants:
-        urls.append((f'https://plantfinder.org/plants/{plant["id"]}/', '0.8'))
-    
-    # Spanish and German
-    for lang in ['es', 'de']:
-        urls.append((f'https://plantfinder.org/{lang}/', '1.0'))
-        urls.append((f'https://plantfinder.org/{lang}/search/', '0.9'))
-        urls.append((f'https://plantfinder.org/{lang}/quiz/', '0.9'))
-        urls.append((f'https://plantfinder.org/{lang}/compare/', '0.9'))
-        urls.append((f'https://plantfinder.org/{lang}/faq/', '0.8'))
-        urls.append((f'https://plantfinder.org/{lang}/about/', '0.7'))
-        
+# (path, changefreq, priority) of the pages translated from the English originals
+STATIC_PAGES = [("", "weekly", "1.0"), ("search/", "weekly", "0.9"), ("quiz/", "monthly", "0.8"),
+                ("compare/", "monthly", "0.8"), ("faq/", "monthly", "0.6"), ("about/", "monthly", "0.5")]
+
+def register_pages(plant_pages):
+    """Register the English originals and their es/de translations"""
+    registry = UrlRegistry()
+    for page, changefreq, priority in STATIC_PAGES:
+        registry.add_page(page, ['en', 'es', 'de'], changefreq, priority)
+    if plant_pages:
         for plant in plants:
-            urls.append((f'https://plantfinder.org/{lang}/plants/{plant["id"]}/', '0.8'))
-    
-    sitemap = '''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-'''
-    for url, priority in urls:
-        sitemap += f'''  <url>
-    <loc>{url}</loc>
-    <priority>{priority}</priority>
-  </url>
-'''
-    sitemap += '</urlset>'
-    
-    with open(BASE_DIR / "sitemap.xml", "w") as f:
-        f.write(sitemap)
-    
-    print(f"✅ Sitemap updated with {len(urls)} URLs")
+            registry.add_page(f'plants/{plant.id}/', ['es', 'de'], 'monthly', '0.7')
+    registry.save(BASE_DIR, 'generate_translations')
+
+def update_sitemap():
+    """Update sitemap with every registered page"""
+    sitemap, _ = write_site_sitemap(BASE_DIR, writer)
+    print(f"✅ Sitemap updated with {sitemap.urls} URLs")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-plant-pages", dest="plant_pages", action="store_false",
+                        help="skip the plant pages (generate_plants.py builds them as well)")
+    parser.add_argument("--no-sitemap", dest="sitemap", action="store_false",
+                        help="leave sitemap.xml alone (build.py writes it in its own stage)")
+    tracing.add_trace_option(parser)
+    profiling.add_profile_option(parser)
+    return parser.parse_args(argv)
 
-def main():
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        tracing.start(args.trace)
     print("Generating translations for PlantFinder...\n")
     
+    pages = [generate_homepage, generate_search_page, generate_quiz_page,
+             generate_compare_page, generate_faq_page, generate_about_page]
+    if args.plant_pages:
+        pages.append(generate_plant_pages)
     for lang in ['es', 'de']:
         print(f"\n🌐 {translations[lang]['lang_name']} ({lang}):")
-        generate_homepage(lang)
-        generate_search_page(lang)
-        generate_quiz_page(lang)
-        generate_compare_page(lang)
-        generate_faq_page(lang)
-        generate_about_page(lang)
-        generate_plant_pages(lang)
-    
-    print("\n")
-    update_sitemap()
+        for generate in pages:
+            with tracing.span(generate.__name__, lang=lang):
+                generate(lang)
+    register_pages(args.plant_pages)
+    
+    if args.sitemap:
+        print("\n")
+        with tracing.span("sitemap"):
+            update_sitemap()
+    print(f"\n📝 {writer.summary()}")
+    trace = tracing.save()
+    if trace:
+        print(f"🧭 Trace written to {trace}")
     print("\n🎉 Done!")
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
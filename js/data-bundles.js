@@ -0,0 +1,17 @@
+// Fetches the page's data in the page's language, as listed by
+// data/bundles/manifest.json (see data_bundles.py). The manifest is the one
+// file revalidated; it names each bundle's content-hashed, so
+// forever-cacheable, file.
+//
+//   loadBundle('quiz').then(plants => ...)
+(function (root) {
+    let manifest = null;
+
+    function loadBundle(name) {
+        const lang = root.document.documentElement.lang || 'en';
+        manifest = manifest || fetch('/data/bundles/manifest.json', { cache: 'no-cache' }).then(r => r.json());
+        return manifest.then(bundles => fetch(bundles[lang][name])).then(r => r.json());
+    }
+
+    root.loadBundle = loadBundle;
+})(this);
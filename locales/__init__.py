@@ -0,0 +1,18 @@
+"""Per-language strings and page templates for plant_pages.
+
+Each module (en, de, es) defines the same constants; adding a language means
+adding a module here and listing it in LOCALES.
+"""
+
+import argparse
+
+LOCALES = ("en", "de", "es")
+
+
+def parse_locales(value):
+    """argparse type for a comma-separated --locales list of LOCALES codes"""
+    locales = [code.strip() for code in value.split(",") if code.strip()]
+    unknown = [code for code in locales if code not in LOCALES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown locale(s): {', '.join(unknown)} (available: {', '.join(LOCALES)})")
+    return locales
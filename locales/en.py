@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""English strings and plant page template for the plant page renderer"""
+
+CODE = "en"
+# Prefix of this locale's pages under the site root ("" for English)
+PREFIX = ""
+BASE_URL = "https://plantfinder.org"
+# Per-plant name/description/care_tips translations in data/ (None: plants.json as-is)
+TRANSLATIONS = None
+
+LIGHT_LABELS = {
+    1: "Very Low",
+    2: "Low",
+    3: "Medium (Indirect)",
+    4: "Bright Indirect",
+    5: "Direct Sun",
+}
+LIGHT_DEFAULT = "Medium"
+
+WATER_LABELS = {
+    1: "Very Low",
+    2: "Low",
+    3: "Moderate",
+    4: "Frequent",
+    5: "Constant",
+}
+WATER_DEFAULT = "Moderate"
+
+HUMIDITY_LABELS = {
+    1: "Very Low",
+    2: "Low",
+    3: "Average",
+    4: "High",
+    5: "Very High",
+}
+HUMIDITY_DEFAULT = "Average"
+
+# difficulty -> (badge colour, label)
+DIFFICULTY_BADGES = {
+    "easy": ("emerald", "Easy Care"),
+    "medium": ("amber", "Moderate Care"),
+    "hard": ("rose", "Expert Care"),
+}
+
+# Labels falling back to the title-cased key when missing (or to the default if set)
+CATEGORY_LABELS = {}
+
+SIZE_LABELS = {
+    "small": "Small",
+    "medium": "Medium",
+    "large": "Large",
+}
+SIZE_DEFAULT = None
+
+SIZE_HEIGHTS = {
+    "small": "15-30 cm (6-12 in)",
+    "medium": "30-90 cm (1-3 ft)",
+    "large": "90-180+ cm (3-6+ ft)",
+}
+
+GROWTH_LABELS = {
+    "slow": "Slow",
+    "moderate": "Moderate",
+    "fast": "Fast",
+}
+GROWTH_DEFAULT = None
+GROWTH_BADGE = "{} Growth"
+
+PET_TOXIC_BADGE = "⚠️ Toxic to Pets"
+PET_SAFE_BADGE = "✓ Pet Safe"
+AIR_PURIFYING_BADGE = "Air Purifying"
+
+TOXIC_PETS = {}
+PETS_JOINER = " and "
+
+TOXIC_WARNING = '''
+        <!-- Pet Safety Warning -->
+        <div class="bg-rose-50 border border-rose-200 rounded-2xl p-6 mb-8">
+            <div class="flex items-start gap-4">
+                <div class="w-12 h-12 bg-rose-100 rounded-xl flex items-center justify-center flex-shrink-0">
+                    <i data-lucide="alert-triangle" class="w-6 h-6 text-rose-600"></i>
+                </div>
+                <div>
+                    <h3 class="font-bold text-rose-800 mb-1">⚠️ Toxic to Pets</h3>
+                    <p class="text-rose-700">{name} contains compounds that are toxic to {pets} if ingested. Keep this plant out of reach of pets, or consider a <a href="/search/?pet_safe=true" class="underline hover:no-underline">pet-safe alternative</a>.</p>
+                </div>
+            </div>
+        </div>
+'''
+
+PET_SAFE_NOTICE = '''
+        <!-- Pet Safety Notice -->
+        <div class="bg-green-50 border border-green-200 rounded-2xl p-6 mb-8">
+            <div class="flex items-start gap-4">
+                <div class="w-12 h-12 bg-green-100 rounded-xl flex items-center justify-center flex-shrink-0">
+                    <i data-lucide="heart" class="w-6 h-6 text-green-600"></i>
+                </div>
+                <div>
+                    <h3 class="font-bold text-green-800 mb-1">✓ Pet Safe</h3>
+                    <p class="text-green-700">{name} is non-toxic and safe for homes with cats and dogs.</p>
+                </div>
+            </div>
+        </div>
+'''
+
+# "Is this plant right for you?" phrases, keyed by the rules in attribute_table.
+# A locale may leave a key out to skip that rule.
+BEST_FOR = {
+    "low_light": "Low light rooms and offices",
+    "bright_light": "Bright rooms with good natural light",
+    "indirect_light": "Living rooms with indirect light",
+    "beginners": "Beginners and busy plant parents",
+    "pets": "Homes with cats and dogs",
+    "forgetful": "Forgetful waterers",
+    "spacious": "Making a statement in spacious rooms",
+    "small_spaces": "Desks, shelves, and small spaces",
+    "humid": "Bathrooms or rooms with humidifiers",
+    "air": "Improving indoor air quality",
+    "hanging": "Hanging baskets and high shelves",
+    "sunny": "Sunny windowsills",
+}
+
+NOT_IDEAL = {
+    "beginners": "Beginners or those with limited time",
+    "pets": "Homes with curious pets",
+    "travelers": "Frequent travelers",
+    "small_spaces": "Small apartments or tight spaces",
+    "dry": "Very dry climates without humidity control",
+}
+
+NO_CONCERNS = "No major concerns!"
+PET_ALTERNATIVE = "Find pet-safe alternatives"
+COMMON_NAMES = "Also known as: "
+ORIGIN = "Origin:"
+
+PLANT_PAGE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{name} Care Guide | PlantFinder</title>
+    <meta name="description" content="Complete care guide for {name}{common_name_suffix}. Learn about light, water, humidity needs, and how to keep your {name} thriving.">
+    <link rel="canonical" href="{BASE_URL}/plants/{plant_id}/">
+    {HREFLANG}
+    <meta property="og:title" content="{name} Care Guide | PlantFinder">
+    <meta property="og:description" content="{description}">
+    <meta property="og:url" content="{BASE_URL}/plants/{plant_id}/">
+    <meta property="og:type" content="article">
+    <meta property="og:site_name" content="PlantFinder">
+    <link rel="icon" href="/favicon.svg" type="image/svg+xml">
+    <script src="https://cdn.tailwindcss.com"></script>
+    <script src="https://unpkg.com/lucide@latest"></script>
+    <link href="https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@400;500;600;700;800&display=swap" rel="stylesheet">
+    <script>
+        tailwind.config = {{
+            theme: {{
+                extend: {{
+                    fontFamily: {{ sans: ['Plus Jakarta Sans', 'sans-serif'] }}
+                }}
+            }}
+        }}
+    </script>
+    <style>
+        .rating-bar {{ height: 8px; background: #e2e8f0; border-radius: 4px; overflow: hidden; }}
+        .rating-bar::after {{ content: ''; display: block; height: 100%; border-radius: 4px; background: linear-gradient(90deg, #10b981, #14b8a6); }}
+        .rating-1::after {{ width: 20%; }}
+        .rating-2::after {{ width: 40%; }}
+        .rating-3::after {{ width: 60%; }}
+        .rating-4::after {{ width: 80%; }}
+        .rating-5::after {{ width: 100%; }}
+    </style>
+
+    <!-- Twitter Card -->
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:title" content="{name} Care Guide">
+    <meta name="twitter:description" content="{description}">
+
+    <!-- Schema.org Markup -->
+    <script type="application/ld+json">
+    {{
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "mainEntityOfPage": {{
+            "@type": "WebPage",
+            "@id": "{BASE_URL}/plants/{plant_id}/"
+        }},
+        "headline": "{name}: Complete Care Guide, Light & Water Needs",
+        "description": "{description}",
+        "author": {{
+            "@type": "Organization",
+            "name": "PlantFinder"
+        }},
+        "publisher": {{
+            "@type": "Organization",
+            "name": "PlantFinder",
+            "logo": {{
+                "@type": "ImageObject",
+                "url": "{BASE_URL}/favicon.svg"
+            }}
+        }}
+    }}
+    </script>
+
+    <!-- Breadcrumb Schema -->
+    <script type="application/ld+json">
+    {{
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {{"@type": "ListItem", "position": 1, "name": "Home", "item": "{BASE_URL}/"}},
+            {{"@type": "ListItem", "position": 2, "name": "Plants", "item": "{BASE_URL}/search/"}},
+            {{"@type": "ListItem", "position": 3, "name": "{name}"}}
+        ]
+    }}
+    </script>
+</head>
+<body class="bg-slate-50 text-slate-800">
+    <nav class="bg-white/80 backdrop-blur-md border-b border-slate-200 sticky top-0 z-50">
+        <div class="max-w-6xl mx-auto px-4 py-4">
+            <div class="flex items-center justify-between">
+                <a href="/" class="flex items-center gap-2">
+                    <svg class="w-7 h-7 text-emerald-600" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+                        <path d="M7 20h10"/>
+                        <path d="M10 20c5.5-2.5.8-6.4 3-10"/>
+                        <path d="M9.5 9.4c1.1.8 1.8 2.2 2.3 3.7-2 .4-3.5.4-4.8-.3-1.2-.6-2.3-1.9-3-4.2 2.8-.5 4.4 0 5.5.8z"/>
+                        <path d="M14.1 6a7 7 0 0 0-1.1 4c1.9-.1 3.3-.6 4.3-1.4 1-1 1.6-2.3 1.7-4.6-2.7.1-4 1-4.9 2z"/>
+                    </svg>
+                    <span class="font-bold text-xl bg-gradient-to-r from-emerald-600 to-teal-600 bg-clip-text text-transparent">PlantFinder</span>
+                </a>
+                <div class="flex items-center gap-4 md:gap-6">
+                    <a href="/search/" class="text-slate-600 hover:text-slate-900 font-medium hidden sm:block">Browse</a>
+                    <a href="/quiz/" class="text-slate-600 hover:text-slate-900 font-medium hidden sm:block">Quiz</a>
+                    <a href="/compare/" class="text-slate-600 hover:text-slate-900 font-medium hidden sm:block">Compare</a>
+                    <!-- Language selector -->
+                    <div class="relative group">
+                        <button class="flex items-center gap-1 text-slate-600 hover:text-emerald-700 py-2">
+                            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/><path d="M2 12h20M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/></svg>
+                            <span>EN</span>
+                        </button>
+                        <div class="absolute right-0 top-full bg-white border border-slate-200 rounded-xl shadow-xl hidden group-hover:block min-w-[140px] py-2 z-50">
+                            <a href="/plants/{plant_id}/" class="block px-4 py-2 hover:bg-slate-100 font-semibold text-emerald-700">English</a>
+                            <a href="/es/plants/{plant_id}/" class="block px-4 py-2 hover:bg-slate-100 text-slate-600">Español</a>
+                            <a href="/de/plants/{plant_id}/" class="block px-4 py-2 hover:bg-slate-100 text-slate-600">Deutsch</a>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </nav>
+
+    <main class="max-w-6xl mx-auto px-4 py-8">
+        <nav class="text-sm text-slate-500 mb-6">
+            <a href="/" class="hover:text-emerald-600">Home</a>
+            <span class="mx-2">/</span>
+            <a href="/search/" class="hover:text-emerald-600">Plants</a>
+            <span class="mx-2">/</span>
+            <span class="text-slate-700">{name}</span>
+        </nav>
+
+        <div class="bg-white rounded-2xl shadow-sm border border-slate-200 overflow-hidden mb-8">
+            <div class="md:flex">
+                <div class="md:w-2/5">
+                    <div class="aspect-[4/5] bg-gradient-to-br from-emerald-100 via-teal-100 to-lime-100 relative overflow-hidden flex items-center justify-center p-8">
+                        <img src="/images/plants/{plant_id}.webp" alt="{name}" class="w-full h-full object-contain" onerror="this.onerror=null; this.src=''; this.parentElement.innerHTML='<span class=\'text-9xl\'>🪴</span>'">
+                    </div>
+                </div>
+                <div class="md:w-3/5 p-6 md:p-8">
+                    <div class="flex flex-wrap gap-2 mb-4">
+                        {badges_html}
+                    </div>
+                    <h1 class="text-3xl md:text-4xl font-bold text-slate-900 mb-2">{name}</h1>
+                    {common_names_html}
+                    
+                    <div class="flex flex-wrap gap-2 mb-6">
+                        {info_badges_html}
+                    </div>
+                    
+                    <div class="grid grid-cols-2 gap-4">
+                        <div class="flex items-center gap-3 p-3 bg-slate-50 rounded-xl">
+                            <i data-lucide="sun" class="w-6 h-6 text-amber-500"></i>
+                            <div>
+                                <p class="text-xs text-slate-500">Light</p>
+                                <p class="font-semibold text-slate-700">{light_label}</p>
+                            </div>
+                        </div>
+                        <div class="flex items-center gap-3 p-3 bg-slate-50 rounded-xl">
+                            <i data-lucide="droplets" class="w-6 h-6 text-blue-500"></i>
+                            <div>
+                                <p class="text-xs text-slate-500">Water</p>
+                                <p class="font-semibold text-slate-700">{water_label}</p>
+                            </div>
+                        </div>
+                        <div class="flex items-center gap-3 p-3 bg-slate-50 rounded-xl">
+                            <i data-lucide="cloud" class="w-6 h-6 text-cyan-500"></i>
+                            <div>
+                                <p class="text-xs text-slate-500">Humidity</p>
+                                <p class="font-semibold text-slate-700">{humidity_label}</p>
+                            </div>
+                        </div>
+                        <div class="flex items-center gap-3 p-3 bg-slate-50 rounded-xl">
+                            <i data-lucide="ruler" class="w-6 h-6 text-emerald-500"></i>
+                            <div>
+                                <p class="text-xs text-slate-500">Size</p>
+                                <p class="font-semibold text-slate-700">{size_label}</p>
+                                <p class="text-xs text-slate-500 mt-1">{size_height}</p>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+{pet_warning_html}
+        <!-- Care Ratings -->
+        <section class="bg-white rounded-2xl shadow-sm border border-slate-200 p-6 md:p-8 mb-8">
+            <h2 class="text-xl font-bold text-slate-900 mb-6">Care Requirements</h2>
+            <div class="grid md:grid-cols-2 gap-x-12 gap-y-4">
+                <div>
+                    <div class="flex justify-between mb-2"><span class="text-slate-600">Light Needs</span><span class="font-medium">{light}/5</span></div>
+                    <div class="rating-bar rating-{light}"></div>
+                </div>
+                <div>
+                    <div class="flex justify-between mb-2"><span class="text-slate-600">Water Needs</span><span class="font-medium">{water}/5</span></div>
+                    <div class="rating-bar rating-{water}"></div>
+                </div>
+                <div>
+                    <div class="flex justify-between mb-2"><span class="text-slate-600">Humidity Needs</span><span class="font-medium">{humidity}/5</span></div>
+                    <div class="rating-bar rating-{humidity}"></div>
+                </div>
+                <div>
+                    <div class="flex justify-between mb-2"><span class="text-slate-600">Maintenance</span><span class="font-medium">{maintenance}/5</span></div>
+                    <div class="rating-bar rating-{maintenance}"></div>
+                </div>
+                <div>
+                    <div class="flex justify-between mb-2"><span class="text-slate-600">Growth Speed</span><span class="font-medium">{growth_rate_val}/5</span></div>
+                    <div class="rating-bar rating-{growth_rate_val}"></div>
+                </div>
+                <div>
+                    <div class="flex justify-between mb-2"><span class="text-slate-600">Air Purifying</span><span class="font-medium">{air_purifying_val}/5</span></div>
+                    <div class="rating-bar rating-{air_purifying_val}"></div>
+                </div>
+            </div>
+        </section>
+
+        <!-- About -->
+        <section class="bg-white rounded-2xl shadow-sm border border-slate-200 p-6 md:p-8 mb-8">
+            <h2 class="text-xl font-bold text-slate-900 mb-4">About the {name}</h2>
+            <p class="text-slate-600 leading-relaxed mb-4">{description}</p>
+            {origin_html}
+        </section>
+
+        <!-- Care Tips -->
+        <section class="bg-white rounded-2xl shadow-sm border border-slate-200 p-6 md:p-8 mb-8">
+            <h2 class="text-xl font-bold text-slate-900 mb-4">Care Tips</h2>
+            <div class="bg-emerald-50 rounded-xl p-5">
+                <div class="flex items-start gap-3">
+                    <i data-lucide="lightbulb" class="w-6 h-6 text-emerald-600 mt-0.5"></i>
+                    <p class="text-slate-700">{care_tips}</p>
+                </div>
+            </div>
+        </section>
+
+        <!-- Is This Plant Right for You? -->
+        <section class="bg-gradient-to-br from-emerald-50 via-teal-50 to-lime-50 rounded-2xl p-6 md:p-8 mb-8">
+            <h2 class="text-xl font-bold text-slate-900 mb-6">Is This Plant Right for You?</h2>
+            <div class="grid md:grid-cols-2 gap-6 mb-6">
+                <div class="bg-white rounded-xl p-5 shadow-sm">
+                    <h3 class="font-semibold text-green-700 mb-3 flex items-center gap-2">
+                        <i data-lucide="check-circle" class="w-5 h-5"></i>
+                        Best For
+                    </h3>
+                    <ul class="space-y-2 text-slate-600">
+                        {best_for_html}
+                    </ul>
+                </div>
+                <div class="bg-white rounded-xl p-5 shadow-sm">
+                    <h3 class="font-semibold text-red-700 mb-3 flex items-center gap-2">
+                        <i data-lucide="x-circle" class="w-5 h-5"></i>
+                        Not Ideal For
+                    </h3>
+                    <ul class="space-y-2 text-slate-600">
+                        {not_ideal_html}
+                    </ul>
+                </div>
+            </div>
+            
+            <div class="flex flex-wrap gap-3">
+                <a href="/compare/" class="inline-flex items-center gap-2 bg-white text-slate-700 border border-slate-200 px-5 py-2.5 rounded-xl font-semibold hover:border-slate-300 hover:shadow-md transition">
+                    <i data-lucide="scale" class="w-4 h-4"></i>
+                    Compare with other plants
+                </a>
+                {pet_alternative_html}
+            </div>
+        </section>
+    </main>
+
+    <footer class="bg-slate-900 text-slate-400 py-12">
+        <div class="max-w-6xl mx-auto px-4">
+            <div class="flex flex-col md:flex-row justify-between items-center gap-4">
+                <div class="flex items-center gap-2">
+                    <svg class="w-6 h-6 text-emerald-400" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+                        <path d="M7 20h10"/>
+                        <path d="M10 20c5.5-2.5.8-6.4 3-10"/>
+                        <path d="M9.5 9.4c1.1.8 1.8 2.2 2.3 3.7-2 .4-3.5.4-4.8-.3-1.2-.6-2.3-1.9-3-4.2 2.8-.5 4.4 0 5.5.8z"/>
+                        <path d="M14.1 6a7 7 0 0 0-1.1 4c1.9-.1 3.3-.6 4.3-1.4 1-1 1.6-2.3 1.7-4.6-2.7.1-4 1-4.9 2z"/>
+                    </svg>
+                    <span class="font-bold text-white">PlantFinder</span>
+                </div>
+                <div class="flex gap-6 text-sm">
+                    <a href="/search/" class="hover:text-white">Browse</a>
+                    <a href="/quiz/" class="hover:text-white">Quiz</a>
+                    <a href="/compare/" class="hover:text-white">Compare</a>
+                    <a href="/faq/" class="hover:text-white">FAQ</a>
+                </div>
+                <p class="text-sm">&copy; 2026 PlantFinder</p>
+            </div>
+        </div>
+    </footer>
+    
+    <script>
+        lucide.createIcons();
+    </script>
+
+{CONSENT_SCRIPT}
+
+</body>
+</html>'''
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Single-pass multi-pattern replacement for the translation and fix-up scripts.
+
+A mapping of literal strings is compiled once into one regex (a prefix trie
+of the keys), so a document is rewritten in one scan instead of one
+str.replace pass per key. Matching is leftmost-longest: at each position the
+longest key wins (e.g. "Medium light" before "Medium"), and replaced text is
+never scanned again.
+"""
+
+import re
+
+
+def alternation(keys):
+    """Regex source matching any of keys, preferring the longest.
+
+    Keys are merged into a prefix trie, so the regex engine follows one path
+    per position instead of trying every key in turn.
+    """
+    trie = {}
+    for key in keys:
+        if not key:
+            raise ValueError("replacement keys must be non-empty strings")
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = True
+    if not trie:
+        raise ValueError("no replacement keys")
+    return _trie_pattern(trie)
+
+
+def _trie_pattern(node):
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    terminal = "" in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    # A key ending here is only taken when no longer key matches (greedy "?")
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if terminal else group
+
+
+class Replacer:
+    """Literal mapping compiled for one-scan replacement"""
+
+    __slots__ = ("mapping", "pattern")
+
+    def __init__(self, mapping):
+        self.mapping = dict(mapping)
+        self.pattern = re.compile(alternation(self.mapping))
+
+    def __call__(self, text):
+        mapping = self.mapping
+        return self.pattern.sub(lambda m: mapping[m[0]], text)
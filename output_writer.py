@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Skip-if-identical atomic file writer shared by the generators.
+
+A file is only rewritten when its bytes change: a size mismatch means it
+changed; otherwise the old contents are read and compared. Changed files go to
+a temp file in the same directory and are renamed over the target, so readers
+never see half-written pages and unchanged files keep their mtime.
+"""
+
+import os
+
+import tracing
+
+
+class OutputWriter:
+    """Writes generated files and counts written vs unchanged"""
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+
+    def write_bytes(self, path, data):
+        """Write data to path unless identical; returns True if the file changed"""
+        path = os.fspath(path)
+        with tracing.span("write file", "io", path=path):
+            changed = not is_identical(path, data)
+            if changed:
+                atomic_write(path, data)
+        self.tally(changed)
+        return changed
+
+    def write_text(self, path, text, encoding="utf-8", existing=None):
+        """Write text to path unless identical.
+
+        Callers that already read the file can pass its contents as existing
+        to compare in memory instead of re-reading it from disk.
+        """
+        if existing is None:
+            return self.write_bytes(path, text.encode(encoding))
+        changed = text != existing
+        if changed:
+            with tracing.span("write file", "io", path=os.fspath(path)):
+                atomic_write(os.fspath(path), text.encode(encoding))
+        self.tally(changed)
+        return changed
+
+    def tally(self, changed):
+        """Count a write done elsewhere, e.g. in a worker process"""
+        if changed:
+            self.written += 1
+        else:
+            self.unchanged += 1
+
+    def summary(self):
+        return f"Wrote {self.written} files, {self.unchanged} unchanged"
+
+
+def is_identical(path, data):
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+
+def atomic_write(path, data):
+    """Write via temp file + rename; creates parent directories as needed"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    # os.open honours the umask, unlike mkstemp's 0600
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        tracing.add_bytes(len(data))
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def write_if_changed(path, data, encoding="utf-8"):
+    """One-off helper for scripts that don't keep a writer around; data is str or bytes"""
+    if isinstance(data, str):
+        data = data.encode(encoding)
+    with tracing.span("write file", "io", path=os.fspath(path)):
+        if is_identical(os.fspath(path), data):
+            return False
+        atomic_write(os.fspath(path), data)
+        return True
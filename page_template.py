@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Precompiled page templates for the PlantFinder generators.
+
+Templates use str.format field syntax ({name}, with {{ and }} for literal
+braces), so a page that used to be one big f-string keeps its markup as-is.
+The source is parsed once into static chunks and slot names; rendering is a
+single join that interleaves the chunks with the slot values. Constants known
+at compile time (BASE_URL, CONSENT_SCRIPT, ...) are folded into the static
+chunks; a constant that is itself a Template is inlined as a partial.
+"""
+
+from string import Formatter
+
+
+class Template:
+    """Template compiled into alternating static chunks and named slots"""
+
+    __slots__ = ("slots", "_parts", "_byte_parts")
+
+    def __init__(self, source, **constants):
+        chunks = [""]
+        slots = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            chunks[-1] += literal
+            if field is None:
+                continue
+            if spec or conversion:
+                raise ValueError(f"template field {{{field}}} must be a plain name")
+            if isinstance(constants.get(field), Template):
+                # A partial: splice in its chunks, its slots become ours
+                partial = constants[field]
+                chunks[-1] += partial._parts[0]
+                slots.extend(partial.slots)
+                chunks.extend(partial._parts[2::2])
+            elif field in constants:
+                chunks[-1] += str(constants[field])
+            else:
+                slots.append(field)
+                chunks.append("")
+        self.slots = tuple(slots)
+        # [chunk0, None, chunk1, None, ..., chunkN]; render fills the odd positions
+        self._parts = [None] * (2 * len(slots) + 1)
+        self._parts[0::2] = chunks
+        self._byte_parts = [c.encode("utf-8") if c is not None else None for c in self._parts]
+
+    def render(self, values):
+        """Render with values[slot] for every slot; values must be str"""
+        parts = self._parts[:]
+        parts[1::2] = map(values.__getitem__, self.slots)
+        return "".join(parts)
+
+    def render_bytes(self, values):
+        """Like render, but joins pre-encoded UTF-8 chunks"""
+        parts = self._byte_parts[:]
+        parts[1::2] = [values[s].encode("utf-8") for s in self.slots]
+        return b"".join(parts)
+
+
+class FragmentCache(dict):
+    """Memo for fragments keyed by an enum-like value (difficulty, size, ...).
+
+    Each distinct key is rendered once by factory and reused for every plant.
+    """
+
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+
+    def __missing__(self, key):
+        value = self[key] = self.factory(key)
+        return value
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Multi-locale plant page renderer for PlantFinder.
+
+Locale-independent facts about a plant (care levels, maintenance, which
+"best for" rules apply, ...) are derived once when catalog.Plant loads it and
+shared by every locale. Each locale in locales/ only supplies strings and its
+page template; LocaleRenderer turns a Plant plus those strings into page
+bytes.
+"""
+
+import importlib
+import os
+
+from build_manifest import module_sources
+from catalog import as_plant
+from page_template import FragmentCache, Template
+from site_partials import CONSENT_SCRIPT, hreflang_links
+
+BADGE_SEPARATOR = "\n                        "
+
+
+def load_locale(code):
+    return importlib.import_module(f"locales.{code}")
+
+
+def locale_sources(codes):
+    """Source files that shape the pages of these locales (for build manifests):
+    this module and everything it imports from the checkout (site_partials and
+    its helpers included), plus the locale modules it loads by name
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    paths = list(module_sources(__file__))
+    paths += [os.path.join(here, "locales", f"{code}.py") for code in codes]
+    return paths
+
+
+def _label(labels, key, default):
+    label = labels.get(key)
+    if label is None:
+        label = default if default is not None else key.title()
+    return label
+
+
+class LocaleRenderer:
+    """Renders plant pages for one locale from catalog Plants"""
+
+    def __init__(self, code):
+        strings = self.strings = load_locale(code)
+        self.code = code
+        self.prefix = strings.PREFIX
+        self.page = Template(strings.PLANT_PAGE, BASE_URL=strings.BASE_URL, CONSENT_SCRIPT=CONSENT_SCRIPT,
+                             HREFLANG=Template(hreflang_links("plants/{plant_id}/")))
+        self.toxic_warning = Template(strings.TOXIC_WARNING)
+        self.pet_safe_notice = Template(strings.PET_SAFE_NOTICE)
+
+        # Fragments that only depend on enum values are rendered once per combination
+        self.size_labels = FragmentCache(lambda size: _label(strings.SIZE_LABELS, size, strings.SIZE_DEFAULT))
+        self.size_heights = FragmentCache(lambda size: strings.SIZE_HEIGHTS.get(size, "30-90 cm"))
+        self.badges = FragmentCache(self._badges)
+        self.info_badges = FragmentCache(self._info_badges)
+        self.best_for = FragmentCache(self._best_for)
+        self.not_ideal = FragmentCache(self._not_ideal)
+        self.toxic_pets = FragmentCache(lambda pets: strings.PETS_JOINER.join([strings.TOXIC_PETS.get(p, p) for p in pets]))
+        self.labels = FragmentCache(lambda levels: (
+            strings.LIGHT_LABELS.get(levels[0], strings.LIGHT_DEFAULT),
+            strings.WATER_LABELS.get(levels[1], strings.WATER_DEFAULT),
+            strings.HUMIDITY_LABELS.get(levels[2], strings.HUMIDITY_DEFAULT),
+        ))
+        self.pet_alternative = f'<a href="/{self.prefix}search/?pet_safe=true" class="inline-flex items-center gap-2 bg-emerald-600 text-white px-5 py-2.5 rounded-xl font-semibold hover:bg-emerald-700 transition"><i data-lucide="paw-print" class="w-4 h-4"></i>{strings.PET_ALTERNATIVE}</a>'
+        self.common_names_prefix = f'<p class="text-slate-500 mb-4">{strings.COMMON_NAMES}'
+        self.origin_prefix = f'<p class="text-slate-600 leading-relaxed"><strong>{strings.ORIGIN}</strong> '
+
+    def _badges(self, key):
+        difficulty, category, pet_safe = key
+        strings = self.strings
+        color, text = strings.DIFFICULTY_BADGES.get(difficulty, ("slate", difficulty.title()))
+        pet_badge = (f'<span class="bg-green-100 text-green-700 px-3 py-1 rounded-full text-sm font-medium">{strings.PET_SAFE_BADGE}</span>' if pet_safe
+                     else f'<span class="bg-rose-100 text-rose-700 px-3 py-1 rounded-full text-sm font-medium">{strings.PET_TOXIC_BADGE}</span>')
+        return BADGE_SEPARATOR.join((
+            f'<span class="bg-{color}-100 text-{color}-700 px-3 py-1 rounded-full text-sm font-medium">{text}</span>',
+            f'<span class="bg-teal-100 text-teal-700 px-3 py-1 rounded-full text-sm font-medium">{_label(strings.CATEGORY_LABELS, category, None)}</span>',
+            pet_badge,
+        ))
+
+    def _info_badges(self, key):
+        size, growth_rate, air_purifying = key
+        strings = self.strings
+        growth = strings.GROWTH_BADGE.format(_label(strings.GROWTH_LABELS, growth_rate, strings.GROWTH_DEFAULT))
+        badges = [f'''<div class="flex items-center gap-2 px-4 py-2 bg-slate-100 rounded-xl">
+                            <i data-lucide="ruler" class="w-4 h-4 text-slate-600"></i>
+                            <span class="text-sm font-medium text-slate-700">{self.size_labels[size]}</span>
+                        </div>''', f'''<div class="flex items-center gap-2 px-4 py-2 bg-slate-100 rounded-xl">
+                            <i data-lucide="trending-up" class="w-4 h-4 text-slate-600"></i>
+                            <span class="text-sm font-medium text-slate-700">{growth}</span>
+                        </div>''']
+        if air_purifying:
+            badges.append(f'''<div class="flex items-center gap-2 px-4 py-2 bg-emerald-100 rounded-xl">
+                            <i data-lucide="wind" class="w-4 h-4 text-emerald-600"></i>
+                            <span class="text-sm font-medium text-emerald-700">{strings.AIR_PURIFYING_BADGE}</span>
+                        </div>''')
+        return BADGE_SEPARATOR.join(badges)
+
+    def _best_for(self, keys):
+        # A locale without a phrase for a rule simply skips it
+        phrases = [self.strings.BEST_FOR[k] for k in keys if k in self.strings.BEST_FOR]
+        return BADGE_SEPARATOR.join(
+            f'<li class="flex items-start gap-2"><i data-lucide="check" class="w-5 h-5 text-green-500 flex-shrink-0 mt-0.5"></i><span>{text}</span></li>'
+            for text in phrases[:4])
+
+    def _not_ideal(self, keys):
+        phrases = [self.strings.NOT_IDEAL[k] for k in keys if k in self.strings.NOT_IDEAL]
+        if not phrases:
+            return f'<li class="text-slate-400">{self.strings.NO_CONCERNS}</li>'
+        return BADGE_SEPARATOR.join(
+            f'<li class="flex items-start gap-2"><i data-lucide="x" class="w-5 h-5 text-red-500 flex-shrink-0 mt-0.5"></i><span>{text}</span></li>'
+            for text in phrases[:3])
+
+    def page_path(self, base_dir, plant_id):
+        return os.path.join(base_dir, self.prefix, "plants", plant_id, "index.html")
+
+    def values(self, plant, translation=None):
+        """Slot values for this locale's page template"""
+        if translation:
+            name = translation.get("name", plant.name)
+            description = translation.get("description", plant.description)
+            care_tips = translation.get("care_tips", plant.care_tips)
+        else:
+            name = plant.name
+            description = plant.description
+            care_tips = plant.care_tips
+
+        pet_warning_html = ""
+        if plant.pet_safe:
+            pet_warning_html = self.pet_safe_notice.render({"name": name})
+        elif plant.toxic_to:
+            pet_warning_html = self.toxic_warning.render({"name": name, "pets": self.toxic_pets[plant.toxic_to]})
+
+        common_names = plant.common_names_text
+        origin = plant.origin
+        size = plant.size
+        light_label, water_label, humidity_label = self.labels[plant.levels]
+
+        values = plant.care_slots.copy()
+        values.update(
+            plant_id=plant.id,
+            common_name_suffix=plant.common_name_suffix,
+            name=name,
+            description=description,
+            care_tips=care_tips,
+            common_names_html=f"{self.common_names_prefix}{common_names}</p>" if common_names else '<div class="mb-4"></div>',
+            origin_html=f"{self.origin_prefix}{origin}</p>" if origin else "",
+            badges_html=self.badges[plant.badges],
+            info_badges_html=self.info_badges[plant.info_badges],
+            pet_warning_html=pet_warning_html,
+            best_for_html=self.best_for[plant.best_for],
+            not_ideal_html=self.not_ideal[plant.not_ideal],
+            pet_alternative_html="" if plant.pet_safe else self.pet_alternative,
+            light_label=light_label,
+            water_label=water_label,
+            humidity_label=humidity_label,
+            size_label=self.size_labels[size],
+            size_height=self.size_heights[size],
+        )
+        return values
+
+    def render(self, plant, translation=None):
+        """Page for a catalog Plant (a raw record dict is normalized first)"""
+        return self.page.render(self.values(as_plant(plant), translation))
+
+    def render_bytes(self, plant, translation=None):
+        return self.page.render_bytes(self.values(as_plant(plant), translation))
+
+
+_renderers = {}
+
+
+def get_renderer(code):
+    """Shared LocaleRenderer per locale (built lazily, once per process)"""
+    renderer = _renderers.get(code)
+    if renderer is None:
+        renderer = _renderers[code] = LocaleRenderer(code)
+    return renderer
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Post-render transform pipeline for the generated site.
+
+Transforms (consent banner, SearchAction fix, hreflang, language selector,
+...) register with @transform and are chained in memory. Each file is read
+once, passed through every transform that applies to it, and written at most
+once. Files are fanned out across a process pool.
+
+A build manifest under .build/ records each file's size and mtime after the
+transforms ran. Its version covers the registered transforms and their
+source, so a rerun over an already-fixed tree only stats the files. The
+pass also keeps the site's PageDates (when each page's final bytes last
+changed), which the sitemaps use for lastmod.
+"""
+
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from build_manifest import BuildManifest, PageDates, source_version
+from output_writer import write_if_changed
+import tracing
+
+# name -> (function(html, page) -> html, applies(page) -> bool), in run order
+TRANSFORMS = {}
+
+
+class Page:
+    """Where a file sits in the site: its language and, for plant pages, the slug"""
+
+    __slots__ = ("path", "relpath", "lang", "slug")
+
+    def __init__(self, base_dir, path):
+        self.path = path
+        self.relpath = os.path.relpath(path, base_dir).replace(os.sep, "/")
+        parts = self.relpath.split("/")
+        self.lang = parts[0] if parts[0] in ("es", "de") else "en"
+        if self.lang != "en":
+            parts = parts[1:]
+        # plants/<slug>/index.html
+        self.slug = parts[1] if len(parts) == 3 and parts[0] == "plants" else None
+
+
+def transform(name, applies=None):
+    """Register a transform; transforms run in registration order"""
+    def register(fn):
+        TRANSFORMS[name] = (fn, applies or (lambda page: True))
+        return fn
+    return register
+
+
+def apply_transforms(html, page, names):
+    for name in names:
+        fn, applies = TRANSFORMS[name]
+        if applies(page):
+            html = fn(html, page)
+    return html
+
+
+def file_signature(path):
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def process_file(task):
+    """Read, transform and (if changed) write one file.
+
+    Returns (relpath, changed, signature, content_hash, error) so the
+    parent can update the manifests and report errors when this runs in a
+    worker.
+    """
+    base_dir, path, names = task
+    page = Page(base_dir, path)
+    try:
+        with tracing.span("post-process", path=page.relpath):
+            with open(path, encoding="utf-8") as f:
+                html = f.read()
+            data = apply_transforms(html, page, names).encode("utf-8")
+            changed = write_if_changed(path, data)
+        return page.relpath, changed, file_signature(path), hashlib.blake2b(data, digest_size=16).hexdigest(), None
+    except Exception as e:
+        return page.relpath, False, None, None, str(e)
+
+
+def pipeline_version(names):
+    modules = {TRANSFORMS[name][0].__module__ for name in names}
+    sources = [__file__] + sorted(sys.modules[module].__file__ for module in modules)
+    return f"{source_version(*sources)}:{','.join(names)}"
+
+
+def run_pipeline(base_dir, writer, names=None, jobs=1, force=False, exclude=(), filename="index.html"):
+    """Apply transforms to every filename under base_dir.
+
+    Changed/unchanged files are tallied on writer, and each file's final
+    content hash goes to the site's PageDates. Returns (processed, skipped):
+    files run through the transforms, and files left alone because they are
+    unchanged since the last run.
+    """
+    base_dir = os.fspath(base_dir)
+    names = list(names or TRANSFORMS)
+    exclude = {os.fspath(path) for path in exclude}
+    manifest = BuildManifest.for_generator(base_dir, "post-render", pipeline_version(names), force=force)
+    dates = PageDates.for_site(base_dir)
+
+    tasks = []
+    skipped = 0
+    with tracing.span("scan pages"):
+        for root, dirs, files in os.walk(base_dir):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            if filename not in files:
+                continue
+            path = os.path.join(root, filename)
+            if path in exclude:
+                continue
+            relpath = os.path.relpath(path, base_dir).replace(os.sep, "/")
+            signature = file_signature(path)
+            if manifest.is_fresh(relpath, signature, path) and dates.keep(relpath):
+                manifest.record(relpath, signature)
+                skipped += 1
+            else:
+                tasks.append((base_dir, path, names))
+
+    with tracing.span("transform pages", pages=len(tasks), jobs=jobs):
+        if jobs <= 1 or len(tasks) < 2:
+            results = list(map(process_file, tasks))
+        else:
+            # Contiguous slices keep per-task overhead low for big trees
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(process_file, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+    for relpath, changed, signature, content_hash, error in results:
+        if error is None:
+            manifest.record(relpath, signature)
+            dates.update(relpath, content_hash)
+            writer.tally(changed)
+        else:
+            # Not recorded, so the next run retries it
+            print(f"Error processing {relpath}: {error}")
+    manifest.save()
+    dates.save()
+    return len(tasks), skipped
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Opt-in cProfile / tracemalloc profiling for the generators and scripts.
+
+Every script's entry point calls profiling.run(main). Profiling is switched
+on with --profile or PLANTFINDER_PROFILE, set to cpu, memory or cpu,memory:
+
+    python generate_translations.py --profile cpu
+    PLANTFINDER_PROFILE=memory python bulk_fixes.py
+    python build.py --profile cpu,memory   # one report per stage
+
+cpu runs main() under cProfile and saves <script>.prof (for snakeviz or
+python -m pstats) next to <script>.txt, the top functions by cumulative and
+own time. memory runs it under tracemalloc and adds the peak and the lines
+holding the most memory when main() returned to the .txt report. Reports go
+to PLANTFINDER_PROFILE_DIR (default .build/profile/), the top
+PLANTFINDER_PROFILE_TOP entries (default 30) each. Process pool workers are
+not profiled; run with -j 1 to see their work.
+
+When neither is set, run() only checks sys.argv and calls main().
+"""
+
+import argparse
+import os
+import sys
+
+PROFILE_ENV = "PLANTFINDER_PROFILE"
+PROFILE_DIR_ENV = "PLANTFINDER_PROFILE_DIR"
+PROFILE_TOP_ENV = "PLANTFINDER_PROFILE_TOP"
+MODES = ("cpu", "memory")
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def add_profile_option(parser):
+    """--profile for scripts with their own parser (run() reads it before main does)"""
+    parser.add_argument("--profile", metavar="MODES",
+                        help="profile this run: cpu, memory or cpu,memory (reports in .build/profile/)")
+
+
+def parse_modes(value):
+    modes = [mode.strip() for mode in value.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        raise ValueError(f"unknown profile mode(s): {', '.join(unknown)} (available: {', '.join(MODES)})")
+    return modes
+
+
+def requested():
+    """Profile modes from --profile or the environment; [] when profiling is off"""
+    if any(arg == "--profile" or arg.startswith("--profile=") for arg in sys.argv[1:]):
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument("--profile")
+        value = parser.parse_known_args()[0].profile or ""
+        # Stages started by this run (build.py) profile themselves too
+        os.environ[PROFILE_ENV] = value
+    else:
+        value = os.environ.get(PROFILE_ENV, "")
+    return parse_modes(value)
+
+
+def run(main, name=None):
+    """Call main(), under the profilers asked for; returns what main returned"""
+    try:
+        modes = requested()
+    except ValueError as e:
+        sys.exit(f"❌ {e}")
+    if not modes:
+        return main()
+
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    name = name or os.path.splitext(os.path.basename(sys.argv[0]))[0]
+    out_dir = os.environ.get(PROFILE_DIR_ENV) or os.path.join(ROOT, ".build", "profile")
+    top = int(os.environ.get(PROFILE_TOP_ENV) or 30)
+    os.makedirs(out_dir, exist_ok=True)
+
+    profiler = cProfile.Profile() if "cpu" in modes else None
+    if "memory" in modes:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        return main()
+    finally:
+        if profiler:
+            profiler.disable()
+        snapshot = None
+        if tracemalloc.is_tracing():
+            # Before the CPU report allocates anything
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ])
+            tracemalloc.stop()
+        report = os.path.join(out_dir, f"{name}.txt")
+        with open(report, "w", encoding="utf-8") as f:
+            f.write(f"{' '.join(sys.argv)}\n")
+            if profiler:
+                profiler.dump_stats(os.path.join(out_dir, f"{name}.prof"))
+                for order in ("cumulative", "tottime"):
+                    f.write(f"\n=== CPU: top {top} by {order} ===\n")
+                    pstats.Stats(profiler, stream=f).strip_dirs().sort_stats(order).print_stats(top)
+            if snapshot:
+                f.write(f"\n=== Memory: peak {peak / 1e6:.1f} MB, {current / 1e6:.1f} MB still allocated ===\n")
+                f.write(f"Top {top} lines by memory held at exit:\n")
+                for stat in snapshot.statistics("lineno")[:top]:
+                    f.write(f"{stat}\n")
+        print(f"🔬 Profile written to {report}" + (f" and {name}.prof" if profiler else ""))
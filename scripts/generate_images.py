@@ -5,25 +5,27 @@ Uses direct HTTP API calls for Python 3.14 compatibility.
 """
 
 import os
-import json
 import requests
 import time
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import load_catalog
+import profiling
+
 API_URL = "https://api.replicate.com/v1/models/black-forest-labs/flux-1.1-pro/predictions"
 
 def load_plants():
-    """Load plants from JSON data"""
+    """Load plants from JSON data (through the shared compiled-catalog cache)"""
     script_dir = os.path.dirname(__file__)
-    data_path = os.path.join(script_dir, "..", "data", "plants.json")
-    with open(data_path, 'r') as f:
-        return json.load(f)
+    return load_catalog(os.path.join(script_dir, "..", "data", "plants.json"))
 
 def generate_prompt(plant):
     """Generate the image prompt for a plant"""
-    name = plant['name']
-    category = plant.get('category', 'foliage')
-    size = plant.get('size', 'medium')
+    name = plant.name
+    category = plant.category
+    size = plant.size
     
     # Customize prompt based on plant type
     if category == 'succulent':
@@ -92,16 +94,16 @@ def wait_for_prediction(prediction_url, headers, max_wait=60):
 
 def generate_image(plant, output_dir, api_token):
     """Generate a single plant image"""
-    slug = plant['id']
+    slug = plant.id
     output_path = os.path.join(output_dir, f"{slug}.png")
     
     # Skip if already exists
     if os.path.exists(output_path):
-        print(f"⏭️  Skipping {plant['name']} (already exists)")
+        print(f"⏭️  Skipping {plant.name} (already exists)")
         return True, "skipped"
     
     prompt = generate_prompt(plant)
-    print(f"🌱 Generating {plant['name']}...", end="", flush=True)
+    print(f"🌱 Generating {plant.name}...", end="", flush=True)
     
     headers = {
         "Authorization": f"Bearer {api_token}",
@@ -151,11 +153,11 @@ def generate_image(plant, output_dir, api_token):
             print(f"\n✅ Saved {slug}.png ({len(img_response.content) // 1024}KB)")
             return True, "generated"
         else:
-            print(f"\n❌ No output for {plant['name']}")
+            print(f"\n❌ No output for {plant.name}")
             return False, "no_output"
             
     except Exception as e:
-        print(f"\n❌ Error generating {plant['name']}: {e}")
+        print(f"\n❌ Error generating {plant.name}: {e}")
         return False, str(e)
 
 def main():
@@ -190,7 +192,7 @@ def main():
             else:
                 success += 1
         else:
-            failed.append(plant['name'])
+            failed.append(plant.name)
         
         # Small delay between requests to avoid rate limits
         time.sleep(0.5)
@@ -211,4 +213,4 @@ def main():
     return 0 if not failed else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(profiling.run(main))
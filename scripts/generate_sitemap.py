@@ -1,80 +1,50 @@
 #!/usr/bin/env python3
-"""Generate sitemap.xml with all pages and hreflang."""
+"""Generate sitemap.xml with all pages and hreflang.
+
+The pages and their languages come from the URL registry the generators
+fill in as they render (see url_registry.py); redirects to pages that
+aren't registered are reported. Written through sitemap_writer, so past
+50,000 URLs it splits into sitemap-N.xml shards with sitemap.xml as their
+index. lastmod is the date the page last changed, from the PageDates
+bulk_fixes.py keeps (pages it hasn't seen yet go without one).
+"""
+import argparse
 import os
-from datetime import date
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sitemap_writer import MAX_URLS, write_site_sitemap
+import profiling
+import tracing
+
 
-BASE_URL = "https://plantfinder.org"
-TODAY = date.today().isoformat()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--gzip", action="store_true",
+                        help="write the sitemap shards as .xml.gz (sitemap.xml becomes their index)")
+    parser.add_argument("--max-urls", type=int, default=MAX_URLS,
+                        help=f"URLs per sitemap file before starting another one (default: {MAX_URLS})")
+    tracing.add_trace_option(parser)
+    profiling.add_profile_option(parser)
+    return parser.parse_args(argv)
 
-# Static pages
-STATIC_PAGES = [
-    ("", 1.0, "weekly"),
-    ("search/", 0.9, "weekly"),
-    ("quiz/", 0.8, "monthly"),
-    ("compare/", 0.8, "monthly"),
-    ("about/", 0.5, "monthly"),
-    ("faq/", 0.6, "monthly"),
-]
 
-LANGUAGES = ["en", "es", "de"]
-LANG_PREFIXES = {"en": "", "es": "es/", "de": "de/"}
+def generate_sitemap(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        tracing.start(args.trace)
+    with tracing.span("sitemap"):
+        sitemap, registry = write_site_sitemap(ROOT, max_urls=args.max_urls, gzip=args.gzip)
 
-def generate_sitemap():
-    urls = []
-    
-    # Static pages with hreflang
-    for page, priority, freq in STATIC_PAGES:
-        for lang in LANGUAGES:
-            prefix = LANG_PREFIXES[lang]
-            url = f"{BASE_URL}/{prefix}{page}"
-            
-            hreflangs = []
-            for hl in LANGUAGES:
-                hl_prefix = LANG_PREFIXES[hl]
-                hreflangs.append(f'        <xhtml:link rel="alternate" hreflang="{hl}" href="{BASE_URL}/{hl_prefix}{page}"/>')
-            hreflangs.append(f'        <xhtml:link rel="alternate" hreflang="x-default" href="{BASE_URL}/{page}"/>')
-            
-            urls.append(f"""    <url>
-        <loc>{url}</loc>
-        <lastmod>{TODAY}</lastmod>
-        <changefreq>{freq}</changefreq>
-        <priority>{priority}</priority>
-{chr(10).join(hreflangs)}
-    </url>""")
-    
-    # Plant pages
-    plants_dir = "plants"
-    if os.path.exists(plants_dir):
-        for plant_slug in sorted(os.listdir(plants_dir)):
-            if os.path.isdir(os.path.join(plants_dir, plant_slug)):
-                for lang in LANGUAGES:
-                    prefix = LANG_PREFIXES[lang]
-                    url = f"{BASE_URL}/{prefix}plants/{plant_slug}/"
-                    
-                    hreflangs = []
-                    for hl in LANGUAGES:
-                        hl_prefix = LANG_PREFIXES[hl]
-                        hreflangs.append(f'        <xhtml:link rel="alternate" hreflang="{hl}" href="{BASE_URL}/{hl_prefix}plants/{plant_slug}/"/>')
-                    hreflangs.append(f'        <xhtml:link rel="alternate" hreflang="x-default" href="{BASE_URL}/plants/{plant_slug}/"/>')
-                    
-                    urls.append(f"""    <url>
-        <loc>{url}</loc>
-        <lastmod>{TODAY}</lastmod>
-        <changefreq>monthly</changefreq>
-        <priority>0.7</priority>
-{chr(10).join(hreflangs)}
-    </url>""")
-    
-    sitemap = f'''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-        xmlns:xhtml="http://www.w3.org/1999/xhtml">
-{chr(10).join(urls)}
-</urlset>'''
-    
-    with open("sitemap.xml", "w") as f:
-        f.write(sitemap)
-    
-    print(f"Generated sitemap.xml with {len(urls)} URLs")
+    files = f" in {len(sitemap.files)} files" if len(sitemap.files) > 1 else ""
+    print(f"Generated sitemap.xml with {sitemap.urls} URLs{files}")
+    for source, target in registry.broken_redirects():
+        print(f"⚠️  /{source} redirects to {target}, which is not a registered page")
+    trace = tracing.save()
+    if trace:
+        print(f"🧭 Trace written to {trace}")
 
 if __name__ == "__main__":
-    generate_sitemap()
+    profiling.run(generate_sitemap)
@@ -2,6 +2,12 @@
 """Translate plant names in German detail pages."""
 import os
 import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from multi_replace import Replacer, alternation
+import profiling
 
 PLANT_NAMES_DE = {
     "Monstera Deliciosa": "Fensterblatt",
@@ -51,49 +57,35 @@ PLANT_NAMES_DE = {
     "Rubber Tree": "Gummibaum",
 }
 
+# Places where the English name is replaced, as (text before, text after);
+# "Also known as" keeps the original name
+NAME_CONTEXTS = [
+    ('<title>', ' -'),
+    ('<span class="text-slate-700">', '</span>'),
+    ('"headline": "', ':'),
+    ('og:title" content="', ' -'),
+    ('Pflegeanleitung für ', '.'),
+    ('wie du deine ', ' gesund'),
+]
+
+# Every name in every context, rewritten in one scan per page
+NAME_REPLACER = Replacer({
+    f'{before}{en_name}{after}': f'{before}{de_name}{after}'
+    for en_name, de_name in PLANT_NAMES_DE.items()
+    for before, after in NAME_CONTEXTS
+})
+H1_PATTERN = re.compile(rf'<h1[^>]*>({alternation(PLANT_NAMES_DE)})</h1>')
+
 def translate_file(filepath):
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
     
     original = content
-    for en_name, de_name in PLANT_NAMES_DE.items():
-        # Replace in title, h1, breadcrumb, etc. but preserve the original for "Also known as"
-        content = re.sub(
-            rf'<title>{re.escape(en_name)} -',
-            f'<title>{de_name} -',
-            content
-        )
-        content = re.sub(
-            rf'<h1[^>]*>{re.escape(en_name)}</h1>',
-            f'<h1 class="text-3xl md:text-4xl font-bold text-slate-900 mb-2">{de_name}</h1>',
-            content
-        )
-        content = re.sub(
-            rf'<span class="text-slate-700">{re.escape(en_name)}</span>',
-            f'<span class="text-slate-700">{de_name}</span>',
-            content
-        )
-        content = re.sub(
-            rf'"headline": "{re.escape(en_name)}:',
-            f'"headline": "{de_name}:',
-            content
-        )
-        content = re.sub(
-            rf'og:title" content="{re.escape(en_name)} -',
-            f'og:title" content="{de_name} -',
-            content
-        )
-        # Replace in meta description start
-        content = re.sub(
-            rf'Pflegeanleitung für {re.escape(en_name)}\.',
-            f'Pflegeanleitung für {de_name}.',
-            content
-        )
-        content = re.sub(
-            rf'wie du deine {re.escape(en_name)} gesund',
-            f'wie du deine {de_name} gesund',
-            content
-        )
+    content = H1_PATTERN.sub(
+        lambda m: f'<h1 class="text-3xl md:text-4xl font-bold text-slate-900 mb-2">{PLANT_NAMES_DE[m[1]]}</h1>',
+        content
+    )
+    content = NAME_REPLACER(content)
     
     if content != original:
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -114,4 +106,4 @@ def main():
     print(f"\nUpdated {count} German plant pages")
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
@@ -3,6 +3,11 @@
 
 import os
 import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import profiling
 
 BASE_DIR = os.path.expanduser("~/clawd/houseplant-finder")
 PLANTS_DIR = os.path.join(BASE_DIR, "plants")
@@ -105,4 +110,4 @@ def main():
         print(f"❌ Errors: {len(errors)}")
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
@@ -0,0 +1,217 @@
+// Answers search-page queries from the index search_index.py precomputes
+// (data/search.<lang>.json): no index is built in the browser.
+//
+//   const search = new PlantSearch(await (await fetch(url)).json());
+//   search.plants            // every result card, catalog order
+//   search.search('monstra') // matching cards, best first
+//
+//   // Filter checkboxes: values OR within a facet, facets AND together
+//   const selection = {light: ['low', 'medium'], pet_safe: ['true']};
+//   const bits = search.filter(selection, search.bitset(search.searchDocs('fern')));
+//   search.docsIn(bits)                      // doc ids passing every filter
+//   search.facetCounts(selection)            // {light: {low: 12, ...}, ...}
+//
+// normalize() and trigrams() mirror search_index.py.
+(function (root) {
+    const MIN_SIMILARITY = 0.5;  // Dice coefficient of trigram sets for a typo match
+
+    function normalize(text) {
+        return text.toLowerCase().replace(/ß/g, 'ss').normalize('NFKD').replace(/\p{M}/gu, '')
+            .split(/[^\p{L}\p{N}]+/u)
+            .filter(token => token.length > 1 || /^\p{N}$/u.test(token));
+    }
+
+    // Facet bitsets arrive as base64 bytes (doc d is bit d % 8 of byte
+    // d / 8) and are kept as 32-bit words (doc d is bit d % 32 of word d / 32)
+    function decodeBitset(text, words) {
+        const bits = new Uint32Array(words);
+        const raw = atob(text);
+        for (let i = 0; i < raw.length; i++) bits[i >> 2] |= raw.charCodeAt(i) << ((i & 3) * 8);
+        return bits;
+    }
+
+    function popcount(bits) {
+        let count = 0;
+        for (let word of bits) {
+            word -= (word >>> 1) & 0x55555555;
+            word = (word & 0x33333333) + ((word >>> 2) & 0x33333333);
+            count += Math.imul((word + (word >>> 4)) & 0x0F0F0F0F, 0x01010101) >>> 24;
+        }
+        return count;
+    }
+
+    function trigrams(token) {
+        const padded = ' ' + token + ' ';
+        const grams = new Set();
+        for (let i = 0; i < padded.length - 2; i++) grams.add(padded.slice(i, i + 3));
+        return grams;
+    }
+
+    class PlantSearch {
+        constructor(index) {
+            const fields = index.fields;
+            this.plants = index.docs.map(row => {
+                const plant = {};
+                fields.forEach((field, i) => { plant[field] = row[i]; });
+                return plant;
+            });
+            this.tokens = index.tokens;
+            this.postings = index.postings;
+            this.trigrams = index.trigrams;
+            this.words = Math.ceil(this.plants.length / 32);
+            this.facets = {};
+            for (const [facet, values] of Object.entries(index.facets || {})) {
+                this.facets[facet] = {};
+                for (const [value, text] of Object.entries(values)) {
+                    this.facets[facet][value] = decodeBitset(text, this.words);
+                }
+            }
+        }
+
+        // The set of docs (doc ids in any order)
+        bitset(docs) {
+            const bits = new Uint32Array(this.words);
+            for (const doc of docs) bits[doc >> 5] |= 1 << (doc & 31);
+            return bits;
+        }
+
+        has(bits, doc) {
+            return (bits[doc >> 5] >>> (doc & 31)) & 1;
+        }
+
+        // Doc ids in bits, ascending
+        docsIn(bits) {
+            const docs = [];
+            for (let i = 0; i < bits.length; i++) {
+                for (let word = bits[i]; word; word &= word - 1) {
+                    docs.push(i * 32 + 31 - Math.clz32(word & -word));
+                }
+            }
+            return docs;
+        }
+
+        // Docs with any of values for facet (values the catalog lacks match nothing)
+        facetBits(facet, values) {
+            const bits = new Uint32Array(this.words);
+            const sets = this.facets[facet] || {};
+            for (const value of values) {
+                const set = sets[value];
+                if (set) for (let i = 0; i < bits.length; i++) bits[i] |= set[i];
+            }
+            return bits;
+        }
+
+        // Docs in base (all docs if null) passing every facet of selection
+        // ({facet: [values]}; facets with no values selected don't filter),
+        // skipping the facet named by except
+        filter(selection, base = null, except = null) {
+            const bits = base ? base.slice() : new Uint32Array(this.words).fill(0xFFFFFFFF);
+            for (const [facet, values] of Object.entries(selection)) {
+                if (facet === except || !values.length) continue;
+                const allowed = this.facetBits(facet, values);
+                for (let i = 0; i < bits.length; i++) bits[i] &= allowed[i];
+            }
+            // Clear the padding past the last doc
+            const tail = this.plants.length % 32;
+            if (tail && !base) bits[bits.length - 1] &= 0xFFFFFFFF >>> (32 - tail);
+            return bits;
+        }
+
+        // facet -> value -> how many docs in base would match with that value
+        // ticked: the other facets' selections apply, the facet's own don't
+        facetCounts(selection, base = null) {
+            const counts = {};
+            for (const [facet, values] of Object.entries(this.facets)) {
+                const others = this.filter(selection, base, facet);
+                counts[facet] = {};
+                for (const [value, set] of Object.entries(values)) {
+                    const both = new Uint32Array(this.words);
+                    for (let i = 0; i < both.length; i++) both[i] = others[i] & set[i];
+                    counts[facet][value] = popcount(both);
+                }
+            }
+            return counts;
+        }
+
+        // Ids of the tokens starting with prefix (tokens are sorted)
+        prefixMatches(prefix) {
+            const tokens = this.tokens;
+            let lo = 0, hi = tokens.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (tokens[mid] < prefix) lo = mid + 1; else hi = mid;
+            }
+            const ids = [];
+            for (let i = lo; i < tokens.length && tokens[i].startsWith(prefix); i++) ids.push(i);
+            return ids;
+        }
+
+        // Ids of name/category tokens within MIN_SIMILARITY of token
+        fuzzyMatches(token) {
+            const grams = trigrams(token);
+            const shared = new Map();
+            for (const gram of grams) {
+                for (const id of this.trigrams[gram] || []) shared.set(id, (shared.get(id) || 0) + 1);
+            }
+            const ids = [];
+            for (const [id, count] of shared) {
+                // A token of n characters, padded, has (at most) n trigrams
+                if (2 * count / (grams.size + this.tokens[id].length) >= MIN_SIMILARITY) ids.push(id);
+            }
+            return ids;
+        }
+
+        // doc -> score for one query token: the best field weight among the
+        // tokens it matches, exact matches ahead of prefixes ahead of typos
+        scoreToken(token) {
+            let ids = this.prefixMatches(token);
+            let factor = 1;
+            if (!ids.length && token.length >= 3) {
+                ids = this.fuzzyMatches(token);
+                factor = 0.5;
+            }
+            const scores = new Map();
+            for (const id of ids) {
+                const bonus = this.tokens[id] === token ? 1.5 : 1;
+                const posting = this.postings[id];
+                for (let i = 0; i < posting.length; i += 2) {
+                    const score = posting[i + 1] * factor * bonus;
+                    if (score > (scores.get(posting[i]) || 0)) scores.set(posting[i], score);
+                }
+            }
+            return scores;
+        }
+
+        // Cards matching every query token, best first (all of them if the
+        // query has no tokens)
+        search(query) {
+            const docs = this.searchDocs(query);
+            return docs ? docs.map(doc => this.plants[doc]) : this.plants.slice();
+        }
+
+        // Doc ids matching every query token, best first (null if the query
+        // has no tokens)
+        searchDocs(query) {
+            const tokens = normalize(query);
+            if (!tokens.length) return null;
+            let total = null;
+            for (const token of tokens) {
+                const scores = this.scoreToken(token);
+                if (total === null) {
+                    total = scores;
+                } else {
+                    for (const [doc, score] of total) {
+                        if (scores.has(doc)) total.set(doc, score + scores.get(doc));
+                        else total.delete(doc);
+                    }
+                }
+                if (!total.size) return [];
+            }
+            return [...total].sort((a, b) => b[1] - a[1] || a[0] - b[0]).map(([doc]) => doc);
+        }
+    }
+
+    PlantSearch.normalize = normalize;
+    if (typeof module !== 'undefined' && module.exports) module.exports = PlantSearch;
+    else root.PlantSearch = PlantSearch;
+})(this);
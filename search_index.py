@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Precomputed search index for the search page, one per language.
+
+The search page used to fetch the whole catalog (descriptions, care tips,
+...) and build a Fuse.js index over it on every visit. Instead the build
+writes data/search.<lang>.json:
+
+    docs      the result cards, one row of CARD_FIELDS per plant
+    tokens    every normalized search token, sorted
+    postings  per token, [doc, weight, doc, weight, ...] (docs ascending)
+    trigrams  trigram -> ids of the name/category tokens containing it
+    facets    filter -> value -> base64 bitset of the docs with that value
+              (doc d is bit d % 8 of byte d // 8)
+
+search/plant-search.js answers a query straight from these arrays: prefix
+matches by binary search over tokens, typo-tolerant matches through the
+trigrams, and the filter checkboxes by ANDing and ORing facet bitsets.
+normalize() and trigrams() mirror its JavaScript, so a token means the
+same on both sides.
+"""
+
+import base64
+import re
+import unicodedata
+
+from attribute_table import CATEGORIES, DIFFICULTIES, OTHER, SIZES, AttributeTable
+
+INDEX_VERSION = 2
+
+# What renderPlantCard, the filters and the sort read
+CARD_FIELDS = ("id", "name", "category", "size", "difficulty", "light", "water", "humidity", "pet_safe")
+
+# The fields the page gave Fuse, by weight; typos are only forgiven in the
+# fields weighing at least FUZZY_WEIGHT (names and categories, not prose)
+NAME, COMMON_NAME, CATEGORY, DESCRIPTION = 4, 3, 2, 1
+FUZZY_WEIGHT = CATEGORY
+
+# The search page's filter groups: attribute table column -> {code: checkbox value}
+LIGHT_BUCKETS = {1: "low", 2: "low", 3: "medium", 4: "bright", 5: "direct"}
+WATER_BUCKETS = {1: "low", 2: "moderate", 3: "moderate", 4: "high", 5: "high"}
+FACETS = (
+    ("light", LIGHT_BUCKETS),
+    ("water", WATER_BUCKETS),
+    ("difficulty", dict(enumerate(DIFFICULTIES))),
+    ("size", dict(enumerate(SIZES))),
+    ("category", dict(enumerate(CATEGORIES))),
+    ("pet_safe", {0: "false", 1: "true"}),
+)
+# Enum facets whose values the table has no code for (OTHER) keep the plant's own value
+OPEN_FACETS = ("difficulty", "size", "category")
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def normalize(text):
+    """Lowercase, accent-free tokens: "Ästhetische Grünlilie" -> ["asthetische", "grunlilie"]"""
+    text = unicodedata.normalize("NFKD", text.lower().replace("ß", "ss"))
+    text = "".join(c for c in text if not unicodedata.category(c).startswith("M"))
+    return [token for token in _WORD.findall(text) if len(token) > 1 or token.isdigit()]
+
+
+def trigrams(token):
+    """Trigrams of the token padded with one space each side"""
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def plant_fields(plant, translation, strings):
+    """(text, weight) for every searchable field of one plant in one language"""
+    translation = translation or {}
+    name = translation.get("name") or plant.name
+    fields = [(name, NAME)]
+    if name != plant.name:
+        # The English name still finds the plant, like its other common names
+        fields.append((plant.name, COMMON_NAME))
+    fields += [(common_name, COMMON_NAME) for common_name in plant.common_names]
+    fields.append((plant.category, CATEGORY))
+    label = strings.CATEGORY_LABELS.get(plant.category)
+    if label:
+        fields.append((label, CATEGORY))
+    fields.append((translation.get("description") or plant.description, DESCRIPTION))
+    return fields
+
+
+def card(plant, translation):
+    """The plant's CARD_FIELDS values, name localized"""
+    name = (translation or {}).get("name") or plant.name
+    return [plant.id, name, plant.category, plant.size, plant.difficulty,
+            plant.light, plant.water, plant.humidity, plant.pet_safe]
+
+
+def bitset(bits, size):
+    """base64 of the size-bit set bits (an int, doc d is bit d)"""
+    return base64.b64encode(bits.to_bytes((size + 7) // 8, "little")).decode("ascii")
+
+
+def facet_bitsets(plants, table):
+    """{facet: {value: bitset}} over plants, values sorted, from their AttributeTable's columns"""
+    facets = {}
+    for name, labels in FACETS:
+        values = {}
+        for code, bits in table.row_bits(name).items():
+            if code in labels:
+                values[labels[code]] = values.get(labels[code], 0) | bits
+            elif code == OTHER and name in OPEN_FACETS:
+                for doc, bit in enumerate(reversed(f"{bits:b}")):
+                    value = getattr(plants[doc], name) if bit == "1" else None
+                    if value:
+                        values[value] = values.get(value, 0) | 1 << doc
+        facets[name] = {value: bitset(values[value], len(plants)) for value in sorted(values)}
+    return facets
+
+
+def build_index(plants, translations, strings, table=None):
+    """The search index (a JSON-ready dict) for one language.
+
+    translations maps plant id -> that language's entry (empty for English);
+    strings is the locale module (for category labels); table is plants'
+    attribute_table.AttributeTable (a loaded Catalog's .table), built here
+    if not given.
+    """
+    docs = []
+    weights = {}  # token -> {doc: best weight}
+    for doc, plant in enumerate(plants):
+        translation = translations.get(plant.id)
+        docs.append(card(plant, translation))
+        for text, weight in plant_fields(plant, translation, strings):
+            for token in normalize(text):
+                token_docs = weights.setdefault(token, {})
+                if token_docs.get(doc, 0) < weight:
+                    token_docs[doc] = weight
+
+    tokens = sorted(weights)
+    postings = []
+    grams = {}
+    for token_id, token in enumerate(tokens):
+        token_docs = weights[token]
+        postings.append([value for doc in sorted(token_docs) for value in (doc, token_docs[doc])])
+        if len(token) >= 3 and max(token_docs.values()) >= FUZZY_WEIGHT:
+            for gram in trigrams(token):
+                grams.setdefault(gram, []).append(token_id)
+
+    return {
+        "version": INDEX_VERSION,
+        "lang": strings.CODE,
+        "fields": CARD_FIELDS,
+        "docs": docs,
+        "tokens": tokens,
+        "postings": postings,
+        "trigrams": dict(sorted(grams.items())),
+        "facets": facet_bitsets(plants, AttributeTable(plants) if table is None else table),
+    }
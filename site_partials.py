@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Shared head and body partials for every PlantFinder page.
+
+The consent banner (which is also what loads GA), hreflang links and the nav
+language selector used to be patched into the built site by bulk_fixes.py.
+Generators now render them in: plant pages fold them into their compiled
+template, the page generators finish their HTML with finish_page. bulk_fixes
+runs the same functions, so it is only needed for trees built before this.
+"""
+
+import re
+
+from fix_language_selector import fix_language_selector
+from url_registry import alternates
+
+GA_ID = "G-J2JW25BZPF"
+
+# GA only loads once the visitor accepts, so pages carry no GA scripts of their own
+CONSENT_SCRIPT = '''<script id="consent-banner-script">
+(function() {
+  const consentKey = 'plantfinder-consent';
+  const scripts = document.querySelectorAll('script[data-ga-pending]');
+
+  function loadGA() {
+    // Load GA scripts that were marked as pending
+    scripts.forEach(script => {
+      const newScript = document.createElement('script');
+      newScript.async = true;
+      newScript.src = 'https://www.googletagmanager.com/gtag/js?id=''' + GA_ID + '''';
+      document.head.appendChild(newScript);
+
+      const configScript = document.createElement('script');
+      configScript.textContent = `window.dataLayer=window.dataLayer||[];function gtag(){dataLayer.push(arguments);}gtag("js",new Date());gtag("config","''' + GA_ID + '''");`;
+      document.head.appendChild(configScript);
+    });
+  }
+
+  function showConsentBanner() {
+    const banner = document.createElement('div');
+    banner.id = 'consent-banner';
+    banner.style.cssText = `
+      position: fixed;
+      bottom: 0;
+      left: 0;
+      right: 0;
+      background: #fff;
+      border-top: 1px solid #e5e7eb;
+      padding: 16px 24px;
+      z-index: 9999;
+      display: flex;
+      justify-content: space-between;
+      align-items: center;
+      font-family: system-ui, -apple-system, sans-serif;
+      font-size: 14px;
+    `;
+
+    const text = document.createElement('p');
+    text.style.cssText = 'margin: 0; flex: 1; margin-right: 16px;';
+    text.textContent = 'We use analytics to understand how you use our site and improve it.';
+
+    const acceptBtn = document.createElement('button');
+    acceptBtn.textContent = 'Accept';
+    acceptBtn.style.cssText = `
+      background: #16a34a;
+      color: white;
+      border: none;
+      padding: 8px 24px;
+      border-radius: 4px;
+      cursor: pointer;
+      font-size: 14px;
+      font-weight: 500;
+      white-space: nowrap;
+    `;
+    acceptBtn.onclick = function() {
+      localStorage.setItem(consentKey, 'accepted');
+      banner.remove();
+      loadGA();
+    };
+
+    const denyBtn = document.createElement('button');
+    denyBtn.textContent = 'Decline';
+    denyBtn.style.cssText = `
+      background: transparent;
+      color: #666;
+      border: 1px solid #ddd;
+      padding: 8px 24px;
+      border-radius: 4px;
+      cursor: pointer;
+      font-size: 14px;
+      margin-left: 8px;
+      white-space: nowrap;
+    `;
+    denyBtn.onclick = function() {
+      localStorage.setItem(consentKey, 'declined');
+      banner.remove();
+    };
+
+    banner.appendChild(text);
+    banner.appendChild(acceptBtn);
+    banner.appendChild(denyBtn);
+    document.body.appendChild(banner);
+  }
+
+  const consent = localStorage.getItem(consentKey);
+  if (!consent) {
+    showConsentBanner();
+  } else if (consent === 'accepted') {
+    loadGA();
+  }
+})();
+</script>'''
+
+GA_LOADER = re.compile(r'<script\s+async\s+src="https://www\.googletagmanager\.com/gtag/js\?id=G-[^"]+"></script>')
+GA_CONFIG = re.compile(
+    r'<script>\s*window\.dataLayer\s*=\s*window\.dataLayer\s*\|\|.*?gtag\([\'"]config[\'"],\s*[\'"]G-[^\'"]+["\']\);\s*</script>',
+    flags=re.DOTALL
+)
+HREFLANG_LINK = re.compile(r'<link\b[^>]*\bhreflang=', re.IGNORECASE)
+
+
+def hreflang_links(path, indent="    "):
+    """Alternate links for every language plus x-default.
+
+    path is the page's location under the English site root, e.g.
+    "plants/monstera-deliciosa/" (or "" for the homepage).
+    """
+    links = [f'<link rel="alternate" hreflang="{lang}" href="{href}" />' for lang, href in alternates(path)]
+    return f"\n{indent}".join(links)
+
+
+def remove_ga_scripts(html):
+    """Drop inline GA loader and config scripts (the consent script loads GA)"""
+    return GA_CONFIG.sub("", GA_LOADER.sub("", html))
+
+
+def add_consent(html):
+    """Swap GA scripts for the consent script before </body>"""
+    if 'id="consent-banner-script"' in html:
+        return html
+    html = remove_ga_scripts(html)
+    banner = f"\n{CONSENT_SCRIPT}\n"
+    if "</body>" in html:
+        return html.replace("</body>", banner + "\n</body>")
+    return html + banner
+
+
+def add_hreflang(html, path):
+    """Add hreflang links before </head> unless the page has some already"""
+    head_end = html.find("</head>")
+    if head_end == -1 or HREFLANG_LINK.search(html, 0, head_end):
+        return html
+    return html.replace("</head>", f"    {hreflang_links(path)}\n  </head>")
+
+
+def finish_page(html, lang, path=None):
+    """Render the shared partials into a page built from other HTML.
+
+    path (see hreflang_links) adds hreflang links to pages that lack them.
+    """
+    html = add_consent(html)
+    if path is not None:
+        html = add_hreflang(html, path)
+    return fix_language_selector(html, lang)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Streaming sitemap writer shared by the sitemap generators.
+
+URLs are written out as they are added, so memory stays constant however
+big the site gets. A sitemap file holds at most 50,000 URLs and 50 MB
+(the protocol's limits); past that the writer starts another shard. When
+everything fits in one file it is written as sitemap.xml itself, as
+before; otherwise the shards are sitemap-1.xml, sitemap-2.xml, ... and
+sitemap.xml becomes the sitemap index listing them, so robots.txt keeps
+pointing at the same file. With gzip the shards are .xml.gz and
+sitemap.xml is always the index.
+
+    with SitemapWriter(BASE_DIR, writer=writer) as sitemap:
+        sitemap.add(f"{BASE_URL}/", priority="1.0")
+
+Like OutputWriter, a file whose bytes didn't change is left alone (and
+counted as unchanged on writer); shards left over from a bigger site are
+removed.
+
+write_site_sitemap() writes the site's sitemap: every page in the
+UrlRegistry with its hreflang alternates, lastmod from PageDates.
+"""
+
+import filecmp
+import glob
+import gzip
+import os
+import re
+from xml.sax.saxutils import escape
+
+from build_manifest import PageDates
+from url_registry import SITE_URL, UrlRegistry
+import tracing
+
+BASE_URL = SITE_URL
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+
+URLSET_HEAD = b'''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:xhtml="http://www.w3.org/1999/xhtml">
+'''
+URLSET_TAIL = b"</urlset>"
+INDEX_HEAD = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+'''
+INDEX_TAIL = b"</sitemapindex>"
+
+
+def xml_escape(text):
+    """text escaped for element content and double-quoted attributes"""
+    if "&" in text or "<" in text or ">" in text or '"' in text:
+        return escape(text, {'"': "&quot;"})
+    return text
+
+
+def alternate_links(alternates):
+    """<xhtml:link> lines for (hreflang, href) pairs"""
+    return "".join(f'        <xhtml:link rel="alternate" hreflang="{hreflang}" href="{xml_escape(href)}"/>\n'
+                   for hreflang, href in alternates)
+
+
+def url_tail(lastmod=None, changefreq=None, priority=None, alternates=()):
+    """Everything in a <url> element after its <loc>, encoded"""
+    tail = "</loc>\n"
+    if lastmod:
+        tail += f"        <lastmod>{lastmod}</lastmod>\n"
+    if changefreq:
+        tail += f"        <changefreq>{changefreq}</changefreq>\n"
+    if priority is not None:
+        tail += f"        <priority>{priority}</priority>\n"
+    return f"{tail}{alternate_links(alternates)}    </url>\n".encode("utf-8")
+
+
+class SitemapWriter:
+    """Writes <url> entries to sitemap.xml, sharding and indexing as needed"""
+
+    def __init__(self, base_dir, name="sitemap", base_url=BASE_URL, max_urls=MAX_URLS,
+                 max_bytes=MAX_BYTES, gzip=False, writer=None):
+        self.base_dir = os.fspath(base_dir)
+        self.name = name
+        self.base_url = base_url
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.gzip = gzip
+        self.writer = writer
+        self.urls = 0
+        self.files = []  # every file the sitemap consists of
+        self._shards = []  # finished shards' temp files, moved into place by close()
+        self._file = None
+        self._shard_urls = 0
+        self._shard_bytes = 0
+        self._tail = (None, None, b"")  # the last add()'s fields, alternates and url_tail()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def _path(self, suffix, gz=False):
+        return os.path.join(self.base_dir, f"{self.name}{suffix}.xml" + (".gz" if gz else ""))
+
+    def _open_shard(self):
+        os.makedirs(self.base_dir, exist_ok=True)
+        tmp = os.path.join(self.base_dir, f".{self.name}-{len(self._shards) + 1}.{os.getpid()}.tmp")
+        self._shards.append(tmp)
+        # mtime=0 keeps the .gz bytes identical for identical content
+        self._file = gzip.GzipFile(tmp, "wb", mtime=0) if self.gzip else open(tmp, "wb")
+        self._file.write(URLSET_HEAD)
+        self._shard_urls = 0
+        self._shard_bytes = len(URLSET_HEAD) + len(URLSET_TAIL)
+
+    def _close_shard(self):
+        self._file.write(URLSET_TAIL)
+        self._file.close()
+        self._file = None
+
+    def _discard(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        for tmp in self._shards:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _commit(self, tmp, path):
+        """Move tmp over path unless their bytes match (compared in chunks)"""
+        changed = not (os.path.exists(path) and filecmp.cmp(tmp, path, shallow=False))
+        if changed:
+            tracing.add_bytes(os.path.getsize(tmp))
+            os.replace(tmp, path)
+        else:
+            os.remove(tmp)
+        if self.writer:
+            self.writer.tally(changed)
+        self.files.append(path)
+        return changed
+
+    def add(self, loc, lastmod=None, changefreq=None, priority=None, alternates=()):
+        """Add a URL (absolute, or a path relative to base_url).
+
+        alternates are (hreflang, href) pairs. Everything after <loc> is
+        rendered once per distinct (lastmod, changefreq, priority,
+        alternates), so pass the same list for each language version of a
+        page.
+        """
+        if "://" not in loc:
+            loc = f"{self.base_url}/{loc.lstrip('/')}"
+        fields = (lastmod, changefreq, priority)
+        if alternates is not self._tail[1] or fields != self._tail[0]:
+            self._tail = (fields, alternates, url_tail(lastmod, changefreq, priority, alternates))
+        entry = b"    <url>\n        <loc>" + xml_escape(loc).encode("utf-8") + self._tail[2]
+        if self._file and (self._shard_urls >= self.max_urls
+                           or self._shard_bytes + len(entry) > self.max_bytes):
+            self._close_shard()
+        if not self._file:
+            self._open_shard()
+        self._file.write(entry)
+        self._shard_urls += 1
+        self._shard_bytes += len(entry)
+        self.urls += 1
+
+    def close(self):
+        """Move the shards into place and write the index; returns self.files"""
+        with tracing.span("finish sitemap", urls=self.urls, shards=max(1, len(self._shards))):
+            if not self._shards:
+                self._open_shard()  # an empty site still gets a valid sitemap
+            if self._file:
+                self._close_shard()
+            index = self._path("")
+            if len(self._shards) == 1 and not self.gzip:
+                # Fits in one file: that file is the sitemap
+                self._commit(self._shards[0], index)
+            else:
+                self._write_index(index)
+            self._shards = []
+            self._remove_stale()
+        return self.files
+
+    def _write_index(self, index):
+        # Shards first, so the index never lists a file that isn't there yet
+        for number, shard in enumerate(self._shards, 1):
+            self._commit(shard, self._path(f"-{number}", self.gzip))
+        tmp = os.path.join(self.base_dir, f".{self.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(INDEX_HEAD)
+            for number in range(1, len(self._shards) + 1):
+                loc = f"{self.base_url}/{os.path.basename(self._path(f'-{number}', self.gzip))}"
+                f.write(f"    <sitemap>\n        <loc>{xml_escape(loc)}</loc>\n    </sitemap>\n".encode("utf-8"))
+            f.write(INDEX_TAIL)
+        self._commit(tmp, index)
+
+    def _remove_stale(self):
+        """Delete shards a previous, bigger (or differently compressed) run left behind"""
+        shard = re.compile(rf"{re.escape(self.name)}-\d+\.xml(\.gz)?")
+        for path in glob.glob(os.path.join(glob.escape(self.base_dir), f"{glob.escape(self.name)}-*.xml*")):
+            if path not in self.files and shard.fullmatch(os.path.basename(path)):
+                os.remove(path)
+
+
+def write_site_sitemap(base_dir, writer=None, **options):
+    """Sitemap of every page the generators registered; returns (SitemapWriter, UrlRegistry).
+
+    options go to SitemapWriter (gzip, max_urls, ...).
+    """
+    with tracing.span("load registry"):
+        registry = UrlRegistry.load_site(base_dir)
+        dates = PageDates.for_site(base_dir)
+    with tracing.span("render sitemap", pages=len(registry.pages)):
+        with SitemapWriter(base_dir, writer=writer, **options) as sitemap:
+            for path, changefreq, priority, links in registry.urls():
+                sitemap.add(path, dates.lastmod(path), changefreq, priority, links)
+    return sitemap, registry
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Build tracing for the PlantFinder generators.
+
+Generators wrap their stages in tracing.span("render page", ...). Each span
+records wall time, CPU time and the bytes written inside it (OutputWriter
+reports writes with add_bytes). With --trace out.json the spans of the whole
+build are saved as Chrome trace-event JSON: open it in chrome://tracing or
+https://ui.perfetto.dev for a timeline per process, worker and thread.
+
+Processes started while tracing (pool workers, build.py's stages) find the
+trace directory in PLANTFINDER_TRACE_DIR and append their spans there each
+time their outermost span closes; save() merges them. Until start() is
+called, span() returns a shared no-op context manager.
+"""
+
+import contextlib
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+TRACE_DIR_ENV = "PLANTFINDER_TRACE_DIR"
+
+_dir = os.environ.get(TRACE_DIR_ENV)
+_output = None
+_owner_pid = None
+_events = {}  # pid -> events not yet flushed; forked workers ignore the parent's
+_named = set()
+_local = threading.local()
+_NULL = contextlib.nullcontext()
+
+
+def enabled():
+    return _dir is not None
+
+
+def add_trace_option(parser):
+    parser.add_argument("--trace", metavar="OUT.json",
+                        help="save a Chrome trace-event timeline of the run to OUT.json")
+
+
+def start(path):
+    """Trace this process and every process it starts, for save() to write to path.
+
+    Under a traced parent (build.py --trace) the spans go to the parent's
+    trace instead, and save() leaves writing the file to the parent.
+    """
+    global _dir, _output, _owner_pid
+    if _dir is not None:
+        return
+    _dir = tempfile.mkdtemp(prefix="plantfinder-trace-")
+    os.environ[TRACE_DIR_ENV] = _dir
+    _output = path
+    _owner_pid = os.getpid()
+
+
+def _stack():
+    # A forked worker starts with no open spans, whatever its parent had open
+    if getattr(_local, "pid", None) != os.getpid():
+        _local.pid = os.getpid()
+        _local.stack = []
+    return _local.stack
+
+
+def _buffer():
+    pid = os.getpid()
+    events = _events.get(pid)
+    if events is None:
+        events = _events[pid] = []
+        process = multiprocessing.current_process().name
+        label = os.path.basename(sys.argv[0] or "python")
+        if process != "MainProcess":
+            label += f" {process}"
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": label}})
+    tid = threading.get_native_id()
+    if (pid, tid) not in _named:
+        _named.add((pid, tid))
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                       "args": {"name": threading.current_thread().name}})
+    return events
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "bytes", "start", "cpu")
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.bytes = 0
+
+    def __enter__(self):
+        _stack().append(self)
+        self.cpu = time.thread_time_ns()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        # perf_counter is the system-wide monotonic clock, so processes line up
+        end = time.perf_counter_ns()
+        cpu = time.thread_time_ns() - self.cpu
+        stack = _stack()
+        stack.pop()
+        if stack:
+            stack[-1].bytes += self.bytes
+        args = dict(self.args, cpu_ms=round(cpu / 1e6, 3))
+        if self.bytes:
+            args["bytes"] = self.bytes
+        _buffer().append({"name": self.name, "cat": self.cat, "ph": "X",
+                          "ts": self.start / 1000, "dur": (end - self.start) / 1000,
+                          "pid": os.getpid(), "tid": threading.get_native_id(), "args": args})
+        if not stack and os.getpid() != _owner_pid:
+            flush()
+        return False
+
+
+def span(name, cat="build", **args):
+    """Context manager timing one step; args show up in the trace viewer"""
+    if _dir is None:
+        return _NULL
+    return _Span(name, cat, args)
+
+
+def add_bytes(count):
+    """Count bytes written towards the innermost open span (and its parents)"""
+    if _dir is not None:
+        stack = _stack()
+        if stack:
+            stack[-1].bytes += count
+
+
+def flush():
+    """Append this process's finished spans to the trace directory"""
+    events = _events.get(os.getpid())
+    if not events or _dir is None:
+        return
+    with open(os.path.join(_dir, f"{os.getpid()}.jsonl"), "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(event) + "\n" for event in events)
+    events.clear()
+
+
+def save():
+    """Write the merged trace if this process started it; returns the path or None"""
+    global _dir, _output, _owner_pid
+    if _dir is None:
+        return None
+    if os.getpid() != _owner_pid:
+        flush()
+        return None
+    events = _events.pop(os.getpid(), [])
+    for name in sorted(os.listdir(_dir)):
+        with open(os.path.join(_dir, name), encoding="utf-8") as f:
+            events += [json.loads(line) for line in f]
+    with open(_output, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    shutil.rmtree(_dir, ignore_errors=True)
+    os.environ.pop(TRACE_DIR_ENV, None)
+    path = _output
+    _dir = _output = _owner_pid = None
+    return path
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Registry of every URL the build produces.
+
+Each generator registers the pages it renders (a path under the English
+site root plus the languages it exists in) and bulk_fixes registers its
+redirect stubs. A generator's part is saved under .build/urls/<owner>.json;
+load_site() merges the parts, so the sitemap, its hreflang alternates and
+the redirect check come from one pass over the registry instead of each
+script rebuilding the URL list (or walking the tree) on its own:
+
+    registry = UrlRegistry()
+    registry.add_page("plants/monstera-deliciosa/", ["en", "es", "de"], "monthly", "0.7")
+    registry.save(BASE_DIR, "generate_plants")
+
+Page templates build their hreflang links with alternates(), so pages and
+sitemap agree on every URL.
+"""
+
+import glob
+import json
+import os
+
+from output_writer import write_if_changed
+
+SITE_URL = "https://plantfinder.org"
+LANGS = ("en", "es", "de")
+REGISTRY_DIR = ".build/urls"
+
+
+def lang_prefix(lang):
+    return "" if lang == "en" else f"{lang}/"
+
+
+def page_url(path, lang="en"):
+    """Absolute URL of path (under the English root, e.g. "faq/") in lang"""
+    return f"{SITE_URL}/{lang_prefix(lang)}{path}"
+
+
+def alternates(path, langs=LANGS):
+    """(hreflang, href) for each language path exists in, plus x-default (English)"""
+    links = [(lang, page_url(path, lang)) for lang in LANGS if lang in langs]
+    if "en" in langs:
+        links.append(("x-default", page_url(path)))
+    return links
+
+
+def registry_path(base_dir, owner):
+    return os.path.join(base_dir, REGISTRY_DIR, f"{owner}.json")
+
+
+class UrlRegistry:
+    """Pages (path -> [langs, changefreq, priority]) and redirects (source -> target)"""
+
+    def __init__(self):
+        self.pages = {}
+        self.redirects = {}
+
+    def add_page(self, path, langs, changefreq=None, priority=None):
+        """Register path in langs; registering it again adds languages"""
+        entry = self.pages.get(path)
+        if entry is None:
+            self.pages[path] = [[lang for lang in LANGS if lang in langs], changefreq, priority]
+            return
+        entry[0] = [lang for lang in LANGS if lang in langs or lang in entry[0]]
+        entry[1] = entry[1] or changefreq
+        entry[2] = entry[2] or priority
+
+    def add_redirect(self, source, target):
+        """Register a redirect stub at source (a site path like "es/plants/") to target ("/es/")"""
+        self.redirects[source] = target
+
+    def merge(self, other):
+        pages = self.pages
+        for path, entry in other.pages.items():
+            if path in pages:
+                self.add_page(path, *entry)
+            else:
+                pages[path] = list(entry)
+        self.redirects.update(other.redirects)
+
+    def save(self, base_dir, owner):
+        """Write this generator's part (if it changed); it replaces the part owner saved last run"""
+        path = registry_path(base_dir, owner)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_if_changed(path, json.dumps({"pages": self.pages, "redirects": self.redirects},
+                                          sort_keys=True, separators=(",", ":")))
+
+    @classmethod
+    def load(cls, path):
+        registry = cls()
+        with open(path) as f:
+            data = json.load(f)
+        registry.pages = data["pages"]
+        registry.redirects = data["redirects"]
+        return registry
+
+    @classmethod
+    def load_site(cls, base_dir):
+        """Every generator's part merged, in owner order"""
+        registry = cls()
+        for path in sorted(glob.glob(os.path.join(glob.escape(base_dir), REGISTRY_DIR, "*.json"))):
+            registry.merge(cls.load(path))
+        return registry
+
+    def urls(self):
+        """(site path, changefreq, priority, alternates) per URL, pages in path order.
+
+        The alternates list is shared by a page's language versions.
+        """
+        for path in sorted(self.pages):
+            langs, changefreq, priority = self.pages[path]
+            links = alternates(path, langs)
+            for lang in langs:
+                yield f"{lang_prefix(lang)}{path}", changefreq, priority, links
+
+    def broken_redirects(self):
+        """(source, target) for redirects to no registered page, or shadowing one"""
+        urls = {f"/{site_path}" for site_path, *_ in self.urls()}
+        broken = []
+        for source, target in sorted(self.redirects.items()):
+            if target not in urls or f"/{source}" in urls:
+                broken.append((source, target))
+        return broken